@@ -0,0 +1,195 @@
+"""Offline benchmarks for dbtc, served by a local fake dbt Cloud
+
+Each benchmark runs in its own interpreter so peak memory is measured in isolation,
+while the fake server runs in this process.
+
+    python -m benchmarks                      # run everything
+    python -m benchmarks --quick              # smaller payloads, e.g. for CI
+    python -m benchmarks --save baseline.json
+    python -m benchmarks --compare baseline.json --tolerance 0.25
+"""
+
+# stdlib
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Dict, List
+
+# first party
+from benchmarks.server import FakeDbtCloud, local_client
+from benchmarks.suite import BENCHMARKS
+
+SCALES = {
+    "full": {
+        "total_runs": 5_000,
+        "total_nodes": 25_000,
+        "artifact_mb": 50,
+        "sl_pages": 10,
+        "sl_rows_per_page": 100_000,
+    },
+    "quick": {
+        "total_runs": 500,
+        "total_nodes": 2_000,
+        "artifact_mb": 2,
+        "sl_pages": 2,
+        "sl_rows_per_page": 5_000,
+    },
+}
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and kilobytes elsewhere
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def run_worker(name: str, base_url: str) -> Dict:
+    """Run a single benchmark against the fake server at `base_url`"""
+    # stdlib
+    import io
+
+    # first party
+    from dbtc import console as dbtc_console
+    from dbtc.instrumentation import HistogramCollector
+
+    # Keep status logging from the clients out of the timings
+    dbtc_console.err_console.file = io.StringIO()
+
+    collector = HistogramCollector()
+    client = local_client(base_url, instruments=[collector])
+    benchmark = BENCHMARKS[name]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    items = benchmark(client)
+    elapsed = time.perf_counter() - start
+    _, peak_traced = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    requests = sum(collector.statuses.values())
+    received = sum(
+        value
+        for (_, _, _, counter), value in collector.counters.items()
+        if counter == "response_bytes"
+    )
+    retries = sum(
+        value
+        for (_, _, _, counter), value in collector.counters.items()
+        if counter == "retries"
+    )
+    return {
+        "name": name,
+        "unit": benchmark.unit,
+        "items": items,
+        "seconds": elapsed,
+        "throughput": items / elapsed,
+        "requests": requests,
+        "retries": retries,
+        "mb_received": received / 1024 / 1024,
+        "peak_traced_mb": peak_traced / 1024 / 1024,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def run_suite(names: List[str], server_kwargs: Dict) -> List[Dict]:
+    results = []
+    with FakeDbtCloud(**server_kwargs) as server:
+        for name in names:
+            completed = subprocess.run(
+                [sys.executable, "-m", "benchmarks", "--worker", name, server.url],
+                capture_output=True,
+                text=True,
+            )
+            if completed.returncode != 0:
+                raise RuntimeError(f"Benchmark {name} failed:\n{completed.stderr}")
+
+            results.append(json.loads(completed.stdout.splitlines()[-1]))
+    return results
+
+
+def compare(results: List[Dict], baseline: List[Dict], tolerance: float) -> List[str]:
+    """Describe every benchmark that regressed by more than `tolerance`"""
+    previous = {result["name"]: result for result in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get(result["name"])
+        if before is None:
+            continue
+
+        if result["throughput"] < before["throughput"] * (1 - tolerance):
+            regressions.append(
+                f"{result['name']}: throughput {result['throughput']:.1f} "
+                f"{result['unit']}/s < baseline {before['throughput']:.1f}"
+            )
+        if result["peak_rss_mb"] > before["peak_rss_mb"] * (1 + tolerance):
+            regressions.append(
+                f"{result['name']}: peak RSS {result['peak_rss_mb']:.1f} MB > "
+                f"baseline {before['peak_rss_mb']:.1f} MB"
+            )
+    return regressions
+
+
+def _print_table(results: List[Dict]):
+    header = (
+        f"{'benchmark':<24}{'throughput':>22}{'requests':>10}{'retries':>9}"
+        f"{'MB recv':>9}{'traced MB':>11}{'RSS MB':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        throughput = f"{r['throughput']:,.1f} {r['unit']}/s"
+        print(
+            f"{r['name']:<24}{throughput:>22}{r['requests']:>10}{r['retries']:>9}"
+            f"{r['mb_received']:>9.1f}{r['peak_traced_mb']:>11.1f}"
+            f"{r['peak_rss_mb']:>9.1f}"
+        )
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("names", nargs="*", help="Benchmarks to run (default: all)")
+    parser.add_argument("--quick", action="store_true", help="Use small payloads")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--rate-limit-every", type=int, default=0)
+    parser.add_argument("--save", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Fail if results regress from this file")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--worker", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(*args.worker)))
+        return 0
+
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    server_kwargs = dict(
+        SCALES["quick" if args.quick else "full"],
+        latency=args.latency,
+        rate_limit_every=args.rate_limit_every,
+    )
+    results = run_suite(args.names or list(BENCHMARKS), server_kwargs)
+    _print_table(results)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
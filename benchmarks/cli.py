@@ -0,0 +1,23 @@
+"""Run the `dbtc` CLI against the fake server
+
+python -m benchmarks.cli http://127.0.0.1:8000 runs get -a 1 -r 1
+"""
+
+# stdlib
+import sys
+
+# first party
+from benchmarks.server import mount_local_adapter
+from dbtc.cli import main
+from dbtc.client.main import dbtCloudClient
+
+if __name__ == "__main__":
+    base_url = sys.argv.pop(1)
+    init = dbtCloudClient.__init__
+
+    def __init__(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        mount_local_adapter(self, base_url)
+
+    dbtCloudClient.__init__ = __init__  # type: ignore[method-assign]
+    main()
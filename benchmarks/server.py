@@ -0,0 +1,377 @@
+# stdlib
+import base64
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+# third party
+import pyarrow as pa
+from requests.adapters import HTTPAdapter
+
+# first party
+from dbtc import dbtCloudClient
+
+HOST_HEADER = "X-Dbtc-Host"
+
+_RUNS = re.compile(r"^/api/v2/accounts/(\d+)/runs/?$")
+_RUN = re.compile(r"^/api/v2/accounts/(\d+)/runs/(\d+)/?$")
+_ARTIFACT = re.compile(r"^/api/v2/accounts/(\d+)/runs/(\d+)/artifacts/(.+)$")
+_TRIGGER = re.compile(r"^/api/v2/accounts/(\d+)/jobs/(\d+)/(run|rerun)/?$")
+
+
+class FakeDbtCloud:
+    """Local stand-in for the dbt Cloud admin, Discovery, and Semantic Layer APIs
+
+    Responses are synthetic but shaped like the real APIs, so the clients run their
+    normal request, pagination, decoding, and polling paths against it.
+
+    Args:
+        latency (float, optional): Seconds to wait before answering each request
+        rate_limit_every (int, optional): Answer every Nth GET request with a 429
+        total_runs (int, optional): Number of runs returned when listing runs
+        total_nodes (int, optional): Number of nodes served by paginated Discovery
+            queries
+        artifact_mb (float, optional): Approximate size of the artifacts served
+        sl_pages (int, optional): Number of Arrow pages in Semantic Layer results
+        sl_rows_per_page (int, optional): Number of rows in each Arrow page
+        sl_pending_polls (int, optional): Number of polls answered with `RUNNING`
+            before Semantic Layer results are available
+        run_duration (float, optional): Seconds before a triggered run succeeds
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        rate_limit_every: int = 0,
+        total_runs: int = 1_000,
+        total_nodes: int = 10_000,
+        artifact_mb: float = 20,
+        sl_pages: int = 5,
+        sl_rows_per_page: int = 50_000,
+        sl_pending_polls: int = 2,
+        run_duration: float = 0.5,
+    ):
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.total_runs = total_runs
+        self.total_nodes = total_nodes
+        self.sl_pages = sl_pages
+        self.sl_pending_polls = sl_pending_polls
+        self.run_duration = run_duration
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._triggered: Dict[int, Tuple[int, int, float]] = {}
+        self._next_run_id = 1_000_000
+        self._sl_polls: Dict[str, int] = {}
+        self._artifact = self._build_artifact(artifact_mb)
+        self._arrow_pages = self._build_arrow_pages(sl_pages, sl_rows_per_page)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> "FakeDbtCloud":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @staticmethod
+    def _build_artifact(size_mb: float) -> bytes:
+        node = {
+            "resource_type": "model",
+            "package_name": "benchmark",
+            "raw_code": "select * from {{ ref('upstream') }} where id > 0 " * 4,
+            "depends_on": {"nodes": ["model.benchmark.upstream"]},
+            "config": {"materialized": "table", "tags": ["nightly", "finance"]},
+        }
+        per_node = len(json.dumps(node)) + 40
+        count = max(1, int(size_mb * 1024 * 1024 / per_node))
+        nodes = {f"model.benchmark.model_{i}": node for i in range(count)}
+        return json.dumps(
+            {"metadata": {"dbt_version": "1.8.0"}, "nodes": nodes}
+        ).encode()
+
+    @staticmethod
+    def _build_arrow_pages(pages: int, rows: int):
+        encoded = []
+        for page in range(pages):
+            offset = page * rows
+            table = pa.table(
+                {
+                    "METRIC_TIME__DAY": pa.array(range(offset, offset + rows)).cast(
+                        pa.timestamp("s")
+                    ),
+                    "CUSTOMER__REGION": [f"region_{i % 7}" for i in range(rows)],
+                    "TOTAL_REVENUE": pa.array(range(rows), pa.float64()),
+                }
+            )
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            encoded.append(base64.b64encode(sink.getvalue().to_pybytes()).decode())
+        return encoded
+
+    def _handler_class(self):
+        fake = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _dispatch(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length) if length else b""
+                status, payload = fake.handle(
+                    self.command,
+                    self.headers.get(HOST_HEADER, ""),
+                    self.path,
+                    body,
+                )
+                data = payload if isinstance(payload, bytes) else json.dumps(payload)
+                data = data if isinstance(data, bytes) else data.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+            def log_message(self, format, *args):
+                pass
+
+        return _Handler
+
+    def handle(self, method: str, host: str, path: str, body: bytes):
+        with self._lock:
+            self.requests += 1
+            # Only GETs are retried by the client's urllib3 `Retry`, so limiting POSTs
+            # would measure failures rather than retries
+            rate_limited = (
+                method == "GET"
+                and self.rate_limit_every
+                and self.requests % self.rate_limit_every == 0
+            )
+        if self.latency:
+            time.sleep(self.latency)
+        if rate_limited:
+            return 429, {"status": {"code": 429, "is_success": False}}
+
+        if host.startswith("metadata."):
+            return 200, self._discovery(json.loads(body))
+
+        if host.startswith("semantic-layer."):
+            return 200, self._semantic_layer(json.loads(body))
+
+        return self._admin(method, path)
+
+    # Admin API
+
+    def _run(self, account_id: int, run_id: int, job_id: int, status: int) -> Dict:
+        return {
+            "id": run_id,
+            "account_id": account_id,
+            "job_definition_id": job_id,
+            "status": status,
+            "status_humanized": {1: "Queued", 3: "Running", 10: "Success"}[status],
+            "href": f"https://cloud.getdbt.com/runs/{run_id}",
+            "trigger": {"cause": "Benchmark"},
+        }
+
+    def _triggered_status(self, run_id: int) -> Tuple[int, int, int]:
+        account_id, job_id, created = self._triggered[run_id]
+        done = time.time() - created >= self.run_duration
+        return account_id, job_id, 10 if done else 3
+
+    def _admin(self, method: str, path: str):
+        url = urlsplit(path)
+        params = parse_qs(url.query)
+        ok = {"code": 200, "is_success": True}
+
+        match = _TRIGGER.match(url.path)
+        if match and method == "POST":
+            account_id, job_id = int(match.group(1)), int(match.group(2))
+            with self._lock:
+                run_id = self._next_run_id
+                self._next_run_id += 1
+                self._triggered[run_id] = (account_id, job_id, time.time())
+            return 200, {"status": ok, "data": self._run(account_id, run_id, job_id, 1)}
+
+        match = _ARTIFACT.match(url.path)
+        if match:
+            return 200, self._artifact
+
+        match = _RUN.match(url.path)
+        if match:
+            run_id = int(match.group(2))
+            if run_id in self._triggered:
+                account_id, job_id, status = self._triggered_status(run_id)
+            else:
+                account_id, job_id, status = int(match.group(1)), 1, 10
+            return 200, {
+                "status": ok,
+                "data": self._run(account_id, run_id, job_id, status),
+            }
+
+        match = _RUNS.match(url.path)
+        if match:
+            account_id = int(match.group(1))
+            if "status__in" in params:
+                statuses = json.loads(params["status__in"][0])
+                runs = [
+                    self._run(account_id, run_id, job_id, status)
+                    for run_id, (account_id, job_id, status) in (
+                        (run_id, self._triggered_status(run_id))
+                        for run_id in list(self._triggered)
+                    )
+                    if status in statuses
+                ]
+            else:
+                runs = [
+                    self._run(account_id, run_id, 1, 10)
+                    for run_id in range(1, self.total_runs + 1)
+                ]
+            offset = int(params.get("offset", [0])[0])
+            limit = int(params.get("limit", [100])[0])
+            return 200, {
+                "status": ok,
+                "data": runs[offset : offset + limit],
+                "extra": {
+                    "pagination": {
+                        "count": len(runs[offset : offset + limit]),
+                        "total_count": len(runs),
+                    }
+                },
+            }
+
+        return 200, {"status": ok, "data": {}}
+
+    # Discovery API
+
+    def _discovery(self, payload: Dict) -> Dict:
+        variables = payload.get("variables") or {}
+        if "pageInfo" not in payload["query"]:
+            return {"data": {"environment": {"applied": {"models": {"edges": []}}}}}
+
+        first = variables.get("first") or 500
+        offset = int(variables.get("after") or 0)
+        end = min(offset + first, self.total_nodes)
+        edges = [
+            {
+                "node": {
+                    "uniqueId": f"model.benchmark.model_{i}",
+                    "name": f"model_{i}",
+                    "description": "Synthetic model served by the benchmark server",
+                    "executionInfo": {
+                        "lastSuccessRunId": 1,
+                        "executionTime": 1.5,
+                    },
+                }
+            }
+            for i in range(offset, end)
+        ]
+        return {
+            "data": {
+                "environment": {
+                    "applied": {
+                        "models": {
+                            "pageInfo": {
+                                "startCursor": str(offset),
+                                "endCursor": str(end),
+                                "hasNextPage": end < self.total_nodes,
+                            },
+                            "edges": edges,
+                            "totalCount": self.total_nodes,
+                        }
+                    }
+                }
+            }
+        }
+
+    # Semantic Layer API
+
+    def _semantic_layer(self, payload: Dict) -> Dict:
+        query = payload["query"]
+        variables = payload.get("variables") or {}
+        for mutation in ("createDimensionValuesQuery", "createQuery"):
+            if mutation in query:
+                with self._lock:
+                    query_id = f"query-{len(self._sl_polls)}"
+                    self._sl_polls[query_id] = 0
+                return {"data": {mutation: {"queryId": query_id}}}
+
+        if "arrowResult" in query:
+            query_id = variables["queryId"]
+            with self._lock:
+                polls = self._sl_polls.setdefault(query_id, 0)
+                self._sl_polls[query_id] = polls + 1
+            page = variables.get("pageNum") or 1
+            pending = polls < self.sl_pending_polls
+            return {
+                "data": {
+                    "query": {
+                        "queryId": query_id,
+                        "sql": "select 1",
+                        "status": "RUNNING" if pending else "SUCCESSFUL",
+                        "error": None,
+                        "totalPages": None if pending else self.sl_pages,
+                        "arrowResult": None if pending else self._arrow_pages[page - 1],
+                    }
+                }
+            }
+
+        return {"data": {}}
+
+
+class _LocalAdapter(HTTPAdapter):
+    """Send every `https://` request to the fake server, keeping the original host
+    in a header so the server can tell the APIs apart."""
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url
+
+    def send(self, request, **kwargs):
+        url = urlsplit(request.url)
+        request.headers[HOST_HEADER] = url.netloc
+        request.url = f"{self.base_url}{url.path}" + (
+            f"?{url.query}" if url.query else ""
+        )
+        return super().send(request, **kwargs)
+
+
+def mount_local_adapter(client: dbtCloudClient, base_url: str):
+    """Send every request made by `client` to `base_url`, keeping its retries"""
+    session = client.cloud.session
+    retries = session.get_adapter("https://").max_retries
+    session.mount("https://", _LocalAdapter(base_url, max_retries=retries))
+
+
+def local_client(base_url: str, **kwargs) -> dbtCloudClient:
+    """Build a `dbtCloudClient` whose requests are all sent to `base_url`
+
+    The client keeps the retry configuration it was built with.
+    """
+    kwargs.setdefault("api_key", "benchmark")
+    kwargs.setdefault("service_token", "benchmark")
+    kwargs.setdefault("environment_id", 1)
+    client = dbtCloudClient(**kwargs)
+    mount_local_adapter(client, base_url)
+    return client
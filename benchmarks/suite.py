@@ -0,0 +1,225 @@
+# stdlib
+import subprocess
+import sys
+from typing import Callable, Dict
+
+# first party
+from dbtc.client.runs import wait_all
+
+BENCHMARKS: Dict[str, Callable] = {}
+
+# Modules that must only be loaded when they're actually used
+HEAVY_MODULES = ("pandas", "pyarrow")
+
+DISCOVERY_QUERY = """
+query Environment($environmentId: BigInt!, $first: Int!, $after: String) {
+    environment(id: $environmentId) {
+        applied {
+            models(first: $first, after: $after) {
+                pageInfo {
+                    startCursor
+                    endCursor
+                    hasNextPage
+                }
+                edges {
+                    node {
+                        uniqueId
+                        name
+                        description
+                        executionInfo {
+                            lastSuccessRunId
+                            executionTime
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+
+def benchmark(unit: str):
+    """Register a benchmark that returns the number of `unit` it processed"""
+
+    def decorator(func):
+        func.unit = unit
+        BENCHMARKS[func.__name__] = func
+        return func
+
+    return decorator
+
+
+@benchmark("runs")
+def list_runs_pagination(client) -> int:
+    runs = 0
+    while True:
+        response = client.cloud.list_runs(1, offset=runs, limit=100)
+        runs += len(response["data"])
+        if runs >= response["extra"]["pagination"]["total_count"]:
+            return runs
+
+
+@benchmark("nodes")
+def metadata_pagination(client) -> int:
+    nodes = client.metadata.query(
+        DISCOVERY_QUERY,
+        {"environmentId": 1, "first": 500},
+        paginated_request_to_list=True,
+    )
+    return len(nodes)
+
+
+@benchmark("nodes")
+def metadata_query_many(client) -> int:
+    variables_list = [{"environmentId": i, "first": 500} for i in range(20)]
+    results = client.metadata.query_many(
+        DISCOVERY_QUERY, variables_list, paginated_request_to_list=True
+    )
+    return sum(len(nodes) for _, nodes in results)
+
+
+@benchmark("nodes")
+def artifact_download(client) -> int:
+    manifest = client.cloud.get_run_artifact(1, 1, "manifest.json")
+    return len(manifest["nodes"])
+
+
+@benchmark("rows")
+def sl_decode(client) -> int:
+    response = client.sl.query(
+        metrics=["total_revenue"], group_by=["customer__region", "metric_time"]
+    )
+    return len(response.result)
+
+
+@benchmark("searches")
+def catalog_search(client) -> int:
+    """Answer keystroke-style searches from a local index of 5,000 models"""
+    # first party
+    from dbtc.client.catalog import CatalogIndex
+
+    index = CatalogIndex(client.metadata, 1)
+    index.update(
+        {
+            "uniqueId": f"model.bench.model_{i}",
+            "name": f"{('stg', 'int', 'fct', 'dim')[i % 4]}_entity_{i}",
+            "description": f"Entity {i} with customer and order details",
+            "resourceType": "model",
+            "tags": ["core"] if i % 10 == 0 else [],
+            "catalog": {"columns": [{"name": f"column_{j}"} for j in range(10)]},
+        }
+        for i in range(5_000)
+    )
+    query = "dim entity customer"
+    searches = 0
+    for _ in range(20):
+        for end in range(1, len(query) + 1):
+            index.search(query[:end], first=20)
+            searches += 1
+    return searches
+
+
+@benchmark("models")
+def performance_frame(client) -> int:
+    """Percentiles, trends, and regressions for 2,000 models' execution history"""
+    # first party
+    from dbtc.performance import PerformanceFrame
+
+    models = 2_000
+    history = {
+        f"model.bench.model_{i}": {
+            "data": {
+                "performance": {
+                    "modelExecutionHistory": [
+                        {
+                            "date": f"2024-01-{day:02d}",
+                            "executionsByJob": [
+                                {
+                                    "jobId": job_id,
+                                    "executions": [
+                                        {"runId": run, "executionTime": i % 7 + run}
+                                        for run in range(3)
+                                    ],
+                                }
+                                for job_id in range(2)
+                            ],
+                        }
+                        for day in range(1, 31)
+                    ]
+                }
+            }
+        }
+        for i in range(models)
+    }
+    frame = PerformanceFrame.from_history(history)
+    for by in ("model", "job"):
+        frame.percentiles(by)
+        frame.trends(by)
+        frame.regressions(by)
+    return models
+
+
+@benchmark("runs")
+def run_polling(client) -> int:
+    futures = [
+        client.cloud.trigger_job_async(
+            1, job_id, {"cause": "Benchmark"}, poll_interval=0.1
+        )
+        for job_id in range(50)
+    ]
+    done, _ = wait_all(futures, timeout=120)
+    return len(done)
+
+
+@benchmark("imports")
+def import_time(client) -> int:
+    """Import the CLI in fresh interpreters, as every `dbtc` invocation does"""
+    check = (
+        "import sys, dbtc.cli; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    imports = 10
+    for _ in range(imports):
+        loaded = subprocess.run(
+            [sys.executable, "-c", check], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        if loaded:
+            raise RuntimeError(f"Importing dbtc loaded {loaded}")
+
+    return imports
+
+
+@benchmark("invocations")
+def cli_startup(client) -> int:
+    """Invoke `dbtc runs get`, from interpreter start to printed result"""
+    base_url = client.cloud.session.get_adapter("https://").base_url
+    command = [sys.executable, "-m", "benchmarks.cli", base_url]
+    command += ["--api-key", "benchmark", "runs", "get", "-a", "1", "-r", "1"]
+    invocations = 10
+    for _ in range(invocations):
+        subprocess.run(command, capture_output=True, check=True)
+
+    return invocations
+
+
+@benchmark("runs")
+def cli_list_runs_ndjson(client) -> int:
+    """Stream every run as NDJSON through the CLI, as when piping into jq"""
+    base_url = client.cloud.session.get_adapter("https://").base_url
+    command = [sys.executable, "-m", "benchmarks.cli", base_url, "--api-key", "x"]
+    command += ["--all-pages", "--format", "ndjson", "runs", "list", "-a", "1"]
+    output = subprocess.run(command, capture_output=True, check=True).stdout
+    return output.count(b"\n")
+
+
+@benchmark("commands")
+def cli_batch(client) -> int:
+    """Run `dbtc runs get` 200 times through one `dbtc batch` invocation"""
+    base_url = client.cloud.session.get_adapter("https://").base_url
+    command = [sys.executable, "-m", "benchmarks.cli", base_url, "--api-key", "x"]
+    lines = "\n".join(f"runs get -a 1 -r {run_id}" for run_id in range(1, 201))
+    output = subprocess.run(
+        command + ["batch"], input=lines.encode(), capture_output=True, check=True
+    ).stdout
+    return output.count(b"\n")
@@ -0,0 +1,243 @@
+# stdlib
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# first party
+from dbtc.graphql import normalize
+from dbtc.utils import write_json_atomic
+
+__all__ = ["ResponseCache", "latest_run_version"]
+
+# Name of the file an entry is stored in, the SHA-256 of its key
+_ENTRY_NAME = re.compile(r"[0-9a-f]{64}\.json")
+
+
+class ResponseCache:
+    """Cache of Discovery API responses, kept in memory and optionally on disk
+
+    Responses are keyed by the URL they were requested from, their normalized
+    query, so formatting doesn't matter, and their variables.  The most recently
+    used `maxsize` responses are kept in memory; with a `directory`, every response
+    is also written there so it outlives the process and can be shared between
+    processes.
+
+    An entry is used until it's older than `ttl` seconds or, when `version` is
+    given, until the version of its environment changes.  `version` is called with
+    an environment ID, e.g. to look up the environment's latest completed run with
+    `latest_run_version`, and its result is reused for `version_ttl` seconds.
+    Responses that aren't tied to a version, such as those without an
+    `environmentId` variable, also expire after `unversioned_ttl` seconds.
+
+    Args:
+        maxsize (int, optional): Max number of responses kept in memory
+        ttl (float, optional): Max age of a response in seconds.  Defaults to no
+            limit.
+        directory (str, optional): Directory to also store responses in
+        version (Callable, optional): Returns the current version of an environment
+        version_ttl (float, optional): Number of seconds to reuse a version for
+        unversioned_ttl (float, optional): Max age in seconds of a response that
+            isn't tied to a version.  Defaults to 5 minutes.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        *,
+        ttl: float = None,
+        directory: str = None,
+        version: Callable[[Any], Any] = None,
+        version_ttl: float = 60,
+        unversioned_ttl: float = 300,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.directory = directory
+        self.version = version
+        self.version_ttl = version_ttl
+        self.unversioned_ttl = unversioned_ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._versions: Dict[Any, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(payload: Dict, url: str = None) -> str:
+        """Key of a request payload, ignoring the formatting of its query
+
+        Args:
+            payload (Dict): The request payload
+            url (str, optional): URL the payload is sent to, so responses from
+                different hosts and endpoints are kept apart
+        """
+        try:
+            query = normalize(payload["query"])
+        except ValueError:
+            query = payload["query"]
+        variables = json.dumps(payload.get("variables") or {}, sort_keys=True)
+        return hashlib.sha256(f"{url or ''}\n{query}\n{variables}".encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")  # type: ignore[arg-type]
+
+    def _current_version(self, environment_id: Any) -> Any:
+        if self.version is None or environment_id is None:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            cached = self._versions.get(environment_id)
+        if cached is not None and now - cached[0] < self.version_ttl:
+            return cached[1]
+
+        version = self.version(environment_id)
+        with self._lock:
+            self._versions[environment_id] = (now, version)
+        return version
+
+    def _read(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        if self.directory is None:
+            return None
+
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+
+        except (OSError, ValueError):
+            return None
+
+    def _is_fresh(self, entry: Dict) -> bool:
+        age = time.time() - entry["stored_at"]
+        if self.ttl is not None and age > self.ttl:
+            return False
+
+        if entry["version"] is None and age > self.unversioned_ttl:
+            return False
+
+        environment_id = entry["environment_id"]
+        return entry["version"] == self._current_version(environment_id)
+
+    def get(self, payload: Dict, *, url: str = None) -> Optional[Dict]:
+        """The cached response to a request payload, or None
+
+        Args:
+            payload (Dict): The request payload
+            url (str, optional): URL the payload is sent to
+        """
+        key = self.key(payload, url)
+        entry = self._read(key)
+        if entry is None or not self._is_fresh(entry):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+            self._store(key, entry)
+        # Each caller gets its own copy, so responses can be modified freely
+        return json.loads(entry["response"])
+
+    def _store(self, key: str, entry: Dict):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def set(self, payload: Dict, response: Dict, *, url: str = None):
+        """Cache the response to a request payload
+
+        Responses containing errors aren't cached.
+
+        Args:
+            payload (Dict): The request payload
+            response (Dict): The decoded response
+            url (str, optional): URL the payload was sent to
+        """
+        if response.get("errors"):
+            return
+
+        environment_id = (payload.get("variables") or {}).get("environmentId")
+        entry = {
+            "stored_at": time.time(),
+            "environment_id": environment_id,
+            "version": self._current_version(environment_id),
+            "response": json.dumps(response),
+        }
+        key = self.key(payload, url)
+        with self._lock:
+            self._store(key, entry)
+        if self.directory is not None:
+            write_json_atomic(self._path(key), entry)
+
+    def invalidate(self, environment_id: Any = None):
+        """Remove every response for an environment, or every response if None"""
+        with self._lock:
+            if environment_id is None:
+                self._versions.clear()
+            else:
+                self._versions.pop(environment_id, None)
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if environment_id is None or entry["environment_id"] == environment_id
+            ]:
+                del self._entries[key]
+        if self.directory is None:
+            return
+
+        for name in os.listdir(self.directory):
+            # Only entries written by `set`, the directory may hold other files
+            if not _ENTRY_NAME.fullmatch(name):
+                continue
+
+            path = os.path.join(self.directory, name)
+            if environment_id is not None:
+                try:
+                    with open(path) as f:
+                        if json.load(f)["environment_id"] != environment_id:
+                            continue
+
+                except (OSError, ValueError, KeyError, TypeError):
+                    continue
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def latest_run_version(admin_client, account_id: int) -> Callable[[Any], Optional[int]]:
+    """Versions an environment by the ID of its latest completed run
+
+    Args:
+        admin_client (_AdminClient): Admin client used to list runs
+        account_id (int): Numeric ID of the account the environments belong to
+    """
+
+    def version(environment_id: Any) -> Optional[int]:
+        runs = admin_client.list_runs(
+            account_id,
+            environment_id=environment_id,
+            status=["success", "error", "cancelled"],
+            order_by="-finished_at",
+            limit=1,
+        ).get("data")
+        return runs[0]["id"] if runs else None
+
+    return version
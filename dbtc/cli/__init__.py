@@ -0,0 +1,110 @@
+# stdlib
+import importlib
+import threading
+from types import ModuleType
+from typing import Dict, List, Optional
+
+# third party
+import click
+import typer
+from typer.core import TyperGroup
+
+# first party
+from dbtc.cli._common import (
+    ALL_PAGES,
+    API_KEY,
+    FORMAT,
+    HOST,
+    OUTPUT,
+    TOKEN,
+    VERSION,
+)
+from dbtc.cli._output import FORMATS
+
+# Command name -> module within `dbtc.cli` defining that command's `app`.  Modules
+# are only imported once their command is invoked (or help is requested).
+SUB_APPS: Dict[str, str] = {
+    "accounts": "accounts",
+    "adapters": "adapters",
+    "batch": "batch",
+    "connections": "connections",
+    "credentials": "credentials",
+    "env-vars": "env_vars",
+    "environments": "environments",
+    "groups": "groups",
+    "jobs": "jobs",
+    "metadata": "metadata",
+    "notifications": "notifications",
+    "projects": "projects",
+    "repos": "repos",
+    "runs": "runs",
+    "service-tokens": "service_tokens",
+    "users": "users",
+    "webhooks": "webhooks",
+}
+
+
+def _load(module_name: str) -> ModuleType:
+    return importlib.import_module(f"dbtc.cli.{module_name}")
+
+
+class LazyGroup(TyperGroup):
+    """Top-level group that builds a sub-app only when it's invoked
+
+    Building every sub-app and command up front accounts for most of the CLI's
+    startup time, so `dbtc runs get` only imports and builds `dbtc.cli.runs`.
+    Deprecated top-level aliases (e.g. `dbtc get-run`) are looked up in each module's
+    `legacy_app` on demand.  Built sub-apps are cached, since `dbtc batch` resolves
+    commands repeatedly.
+    """
+
+    _lock = threading.Lock()
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return list(SUB_APPS)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in SUB_APPS:
+            with self._lock:
+                if cmd_name not in self.commands:
+                    sub_app = _load(SUB_APPS[cmd_name]).app
+                    self.commands[cmd_name] = typer.main.get_command(sub_app)
+            return self.commands[cmd_name]
+
+        for module_name in SUB_APPS.values():
+            module = _load(module_name)
+            legacy_app = getattr(module, "legacy_app", None)
+            if legacy_app is not None and any(
+                info.name == cmd_name for info in legacy_app.registered_commands
+            ):
+                return typer.main.get_group(legacy_app).get_command(ctx, cmd_name)
+
+        return None
+
+
+app = typer.Typer(cls=LazyGroup)
+
+
+@app.callback()
+def common(
+    ctx: typer.Context,
+    api_key: Optional[str] = API_KEY,
+    service_token: Optional[str] = TOKEN,
+    host: Optional[str] = HOST,
+    version: Optional[bool] = VERSION,
+    output: Optional[str] = OUTPUT,
+    format: Optional[str] = FORMAT,
+    all_pages: bool = ALL_PAGES,
+):
+    if format is not None and format not in FORMATS:
+        raise typer.BadParameter(
+            f"must be one of {', '.join(FORMATS)}", param_hint="--format"
+        )
+
+    ctx.params.pop("version")
+    ctx.obj = ctx.params
+    pass
+
+
+def main():
+    app()
@@ -0,0 +1,4 @@
+# first party
+from dbtc.cli import main
+
+main()
@@ -0,0 +1,190 @@
+# stdlib
+import json
+import threading
+
+# third party
+import typer
+
+# first party
+from dbtc import __version__
+from dbtc import dbtCloudClient as dbtc
+from dbtc.cli._output import complete_format, iter_pages, write_responses
+
+valid_inclusions = ["trigger", "environment", "run_steps", "job", "repository"]
+
+
+def version_callback(called: bool):
+    if called:
+        typer.echo(f"dbtc version: {__version__}")
+        raise typer.Exit()
+
+
+def complete_inclusion(ctx, param, incomplete):
+    for inclusion in valid_inclusions:
+        if inclusion.startswith(incomplete):
+            yield inclusion
+
+
+# region _VARIABLES
+
+ACCOUNT_ID = typer.Option(
+    ...,
+    "--account-id",
+    "-a",
+    envvar="DBT_CLOUD_ACCOUNT_ID",
+    help="Numeric ID of account to retrieve.",
+)
+ALL_PAGES = typer.Option(
+    False,
+    "--all-pages",
+    help="Follow `offset` and `limit` until every page of a listing is returned.",
+)
+ADAPTER_ID = typer.Option(
+    ...,
+    "--adapter-id",
+    help="Numeric ID of adapter.",
+)
+API_KEY = typer.Option(
+    None, "--api-key", envvar="DBT_CLOUD_API_KEY", help="User's dbt Cloud API Key"
+)
+CONNECTION_ID = typer.Option(
+    ..., "--connection-id", "-c", help="Numeric ID of the connection."
+)
+END_DATE = typer.Option(..., "--end-date", help="Date to end retrieving data from")
+ENVIRONMENT_ID = typer.Option(
+    ..., "--environment-id", "-e", help="Numeric ID of the connection."
+)
+FORMAT = typer.Option(
+    None,
+    "--format",
+    "-f",
+    help=(
+        "Output format: json, ndjson, csv, or parquet.  Defaults to the output "
+        "file's extension, or json."
+    ),
+    shell_complete=complete_format,
+)
+GROUP_ID = typer.Option(
+    ..., "--group-id", "-g", help="Numeric ID of the group to retrieve."
+)
+HOST = typer.Option(
+    None,
+    "--host",
+    envvar="DBT_CLOUD_HOST",
+    help="Used for single tenant instances or multi-tenant regions outside of the US.",
+)
+INCLUDE_RELATED = typer.Option(
+    None,
+    "--include-related",
+    "-i",
+    help="List of related fields to pull with run",
+    shell_complete=complete_inclusion,
+)
+JOB_ID = typer.Option(..., "--job-id", "-j", help="Numeric ID of job to retrieve.")
+LIMIT = typer.Option(
+    None,
+    help="Limit to apply when listing runs.  Use with `offset` to paginate results.",
+)
+NOTIFICATION_ID = typer.Option(
+    ..., "--notification-id", "-n", help="Numeric ID of the notification."
+)
+OFFSET = typer.Option(
+    None,
+    help="Offset to apply when listing runs.  Use with `limit` to paginate results.",
+)
+OUTPUT = typer.Option(
+    None, "--output", "-o", help="Output file to write results to.  Defaults to stdout."
+)
+ORDER_BY = typer.Option(
+    None,
+    "--order-by",
+    help="Field to order the result by.  Use `-` to indicate reverse order.",
+)
+PAYLOAD = typer.Option(
+    ...,
+    "--payload",
+    "-d",
+    help="String representation of dictionary needed to create or update resource.",
+)
+PROJECT_ID = typer.Option(
+    ...,
+    "--project-id",
+    "-p",
+    envvar="DBT_CLOUD_PROJECT_ID",
+    help="Numeric ID of the project to retrieve.",
+)
+REPOSITORY_ID = typer.Option(
+    ..., "--repository-id", "-y", help="Numeric ID of the repository."
+)
+RUN_ID = typer.Option(..., "--run-id", "-r", help="Numeric ID of run to retrieve.")
+RUN_ID_OPTIONAL = typer.Option(
+    None, "--run-id", "-r", help="Numeric ID of run to retrieve."
+)
+SERVICE_TOKEN_ID = typer.Option(
+    ..., "--service-token-id", "-t", help="Numeric ID of the service token."
+)
+START_DATE = typer.Option(
+    ..., "--start-date", help="Date to begin retrieving data from"
+)
+STATE = typer.Option(None, "--state", help="1 = active, 2 = deleted")
+TOKEN = typer.Option(
+    None,
+    "--token",
+    envvar="DBT_CLOUD_SERVICE_TOKEN",
+    help="Service token for dbt Cloud Account.",
+)
+UNIQUE_ID = typer.Option(
+    ..., "--unique-id", help="The unique ID of this particular object."
+)
+USER_ID = typer.Option(..., "--user-id", "-u", help="Numeric ID of the user.")
+
+VERSION = typer.Option(
+    None,
+    "--version",
+    "-v",
+    help="Show installed version of dbtc.",
+    callback=version_callback,
+    is_eager=True,
+)
+WEBHOOK_ID = typer.Option(..., "--webhook-id", "-w", help="String ID of the webhook")
+
+# endregion
+
+
+# region _COMMON
+
+# Set by `dbtc batch` on each worker thread, so commands share its client and
+# hand their responses back instead of writing them
+batch_state = threading.local()
+
+
+def _dbt_api_request(ctx: typer.Context, property: str, method: str, *args, **kwargs):
+    options = dict(ctx.obj)
+    output = options.pop("output", None)
+    output_format = options.pop("format", None)
+    all_pages = options.pop("all_pages", False) or getattr(
+        batch_state, "all_pages", False
+    )
+    instance = getattr(batch_state, "client", None) or dbtc(**options)
+    api = getattr(instance, property)
+    responses = iter_pages(getattr(api, method), *args, all_pages=all_pages, **kwargs)
+    if getattr(batch_state, "client", None) is not None:
+        batch_state.responses = list(responses)
+        return
+
+    write_responses(
+        responses, output=output, output_format=output_format, all_pages=all_pages
+    )
+
+
+def _dbt_cloud_request(ctx: typer.Context, method: str, *args, **kwargs):
+    if kwargs.get("include_related", None) is not None:
+        try:
+            include_related = kwargs["include_related"]
+            kwargs["include_related"] = json.loads(include_related)
+        except ValueError as e:
+            raise ValueError(f'"{include_related}" is not a valid JSON string') from e
+    _dbt_api_request(ctx, "cloud", method, *args, **kwargs)
+
+
+# endregion
@@ -0,0 +1,227 @@
+# stdlib
+import csv
+import json
+import sys
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional
+
+# first party
+from dbtc.console import console
+
+FORMATS = ["json", "ndjson", "csv", "parquet"]
+
+# Largest page size accepted by the dbt Cloud list endpoints
+MAX_PAGE_SIZE = 100
+
+
+def complete_format(ctx, param, incomplete):
+    for output_format in FORMATS:
+        if output_format.startswith(incomplete):
+            yield output_format
+
+
+def infer_format(output: Optional[str]) -> str:
+    """Pick a format from the extension of the output file, defaulting to JSON"""
+    if output is not None:
+        extension = output.rsplit(".", 1)[-1].lower()
+        if extension in ("jsonl", "ndjson"):
+            return "ndjson"
+        if extension in ("csv", "parquet"):
+            return extension
+
+    return "json"
+
+
+def iter_pages(
+    func: Callable, *args, all_pages: bool = False, **kwargs
+) -> Iterator[Any]:
+    """Yield responses from `func`, following `offset` and `limit` if `all_pages`
+
+    Only commands that accept an `offset` are paginated; anything else makes a
+    single request.
+    """
+    if not all_pages or "offset" not in kwargs:
+        yield func(*args, **kwargs)
+        return
+
+    offset = kwargs.pop("offset") or 0
+    limit = kwargs.pop("limit") or MAX_PAGE_SIZE
+    while True:
+        response = func(*args, offset=offset, limit=limit, **kwargs)
+        yield response
+        data = response.get("data") if isinstance(response, dict) else None
+        if not isinstance(data, list) or not data:
+            return
+
+        offset += len(data)
+        total = (response.get("extra") or {}).get("pagination", {}).get("total_count")
+        if len(data) < limit or (total is not None and offset >= total):
+            return
+
+
+def _records(response: Any) -> List:
+    data = response.get("data", response) if isinstance(response, dict) else response
+    if data is None:
+        return []
+
+    return data if isinstance(data, list) else [data]
+
+
+def merge_pages(pages: List[Any]) -> Any:
+    """A single response as-is, or `{"data": [...]}` with the records of every page"""
+    if len(pages) == 1:
+        return pages[0]
+
+    return {"data": [record for page in pages for record in _records(page)]}
+
+
+def _flatten(record: Any) -> Dict:
+    if not isinstance(record, dict):
+        return {"value": record}
+
+    return {
+        key: json.dumps(value) if isinstance(value, (dict, list)) else value
+        for key, value in record.items()
+    }
+
+
+class _JsonWriter:
+    """The response as-is, or `{"data": [...]}` built page by page"""
+
+    def __init__(self, stream: IO, all_pages: bool):
+        self.stream = stream
+        self.all_pages = all_pages
+        self.started = False
+
+    def write(self, response: Any):
+        if not self.all_pages:
+            json.dump(response, self.stream)
+            return
+
+        for record in _records(response):
+            self.stream.write(",\n" if self.started else '{"data": [\n')
+            json.dump(record, self.stream)
+            self.started = True
+
+    def close(self):
+        if self.all_pages:
+            self.stream.write("\n]}" if self.started else '{"data": []}')
+        self.stream.write("\n")
+
+
+class _NdjsonWriter:
+    def __init__(self, stream: IO, all_pages: bool):
+        self.stream = stream
+
+    def write(self, response: Any):
+        self.stream.writelines(
+            json.dumps(record) + "\n" for record in _records(response)
+        )
+
+    def close(self):
+        pass
+
+
+class _CsvWriter:
+    """Columns are taken from the first page; nested values are JSON encoded"""
+
+    def __init__(self, stream: IO, all_pages: bool):
+        self.stream = stream
+        self.writer: Optional[csv.DictWriter] = None
+
+    def write(self, response: Any):
+        rows = [_flatten(record) for record in _records(response)]
+        if not rows:
+            return
+
+        if self.writer is None:
+            fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+            self.writer = csv.DictWriter(self.stream, fieldnames, extrasaction="ignore")
+            self.writer.writeheader()
+        self.writer.writerows(rows)
+
+    def close(self):
+        pass
+
+
+class _ParquetWriter:
+    """The schema is taken from the first page; nested values are JSON encoded"""
+
+    def __init__(self, stream: IO, all_pages: bool):
+        self.stream = stream
+        self.schema = None
+        self.writer = None
+
+    def write(self, response: Any):
+        # third party
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        rows = [_flatten(record) for record in _records(response)]
+        if not rows:
+            return
+
+        if self.schema is None:
+            inferred = pa.Table.from_pylist(rows).schema
+            self.schema = pa.schema(
+                pa.field(f.name, pa.string()) if pa.types.is_null(f.type) else f
+                for f in inferred
+            )
+            self.writer = pq.ParquetWriter(self.stream, self.schema)
+        columns = {
+            f.name: pa.array([row.get(f.name) for row in rows]).cast(f.type)
+            for f in self.schema
+        }
+        self.writer.write_table(pa.table(columns, schema=self.schema))
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+WRITERS = {
+    "json": _JsonWriter,
+    "ndjson": _NdjsonWriter,
+    "csv": _CsvWriter,
+    "parquet": _ParquetWriter,
+}
+
+
+def write_responses(
+    responses: Iterator[Any],
+    *,
+    output: Optional[str] = None,
+    output_format: Optional[str] = None,
+    all_pages: bool = False,
+):
+    """Write each response as soon as it arrives
+
+    JSON written to an interactive terminal is pretty printed with Rich; everything
+    else is written without formatting so piping into other tools stays cheap.
+    """
+    output_format = output_format or infer_format(output)
+    if output is None and output_format == "json" and console.is_terminal:
+        console.print_json(json.dumps(merge_pages(list(responses))))
+        return
+
+    binary = output_format == "parquet"
+    if output is not None:
+        stream = open(output, "wb") if binary else open(output, "w", newline="")
+    else:
+        stream = sys.stdout.buffer if binary else sys.stdout
+
+    try:
+        writer = WRITERS[output_format](stream, all_pages)
+        for response in responses:
+            if isinstance(response, str) and not binary:
+                # Non-JSON artifacts, e.g. compiled SQL, are written verbatim.  Parquet
+                # is binary, so they're written as a record with a `value` column.
+                stream.write(response)
+                continue
+
+            writer.write(response)
+        writer.close()
+    finally:
+        if output is not None:
+            stream.close()
+        else:
+            stream.flush()
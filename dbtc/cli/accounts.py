@@ -0,0 +1,133 @@
+# third party
+import typer
+
+# first party
+from dbtc.cli._common import (
+    ACCOUNT_ID,
+    LIMIT,
+    OFFSET,
+    _dbt_cloud_request,
+)
+
+app = typer.Typer(name="accounts", help="Manage accounts in dbt Cloud")
+
+# Hidden, deprecated aliases registered on the top-level command
+legacy_app = typer.Typer()
+
+
+@legacy_app.command("get-account", hidden=True)
+def get_account_old(ctx: typer.Context, account_id: int = ACCOUNT_ID):
+    """This will soon be deprecated! Use `dbtc accounts get` instead."""
+    return get_account(ctx, account_id)
+
+
+@app.command("get")
+def get_account(ctx: typer.Context, account_id: int = ACCOUNT_ID):
+    """Get an account by its ID."""
+    _dbt_cloud_request(ctx, "get_account", account_id)
+
+
+@legacy_app.command("get-account-by-name", hidden=True)
+def get_account_by_name_old(
+    ctx: typer.Context,
+    account_name: str = typer.Option(..., "--account-name", help="Name of account"),
+):
+    """This will soon be deprecated! Use `dbtc accounts get-by-name` instead."""
+    return get_account_by_name(ctx, account_name)
+
+
+@app.command("get-by-name")
+def get_account_by_name(
+    ctx: typer.Context,
+    account_name: str = typer.Option(..., "--account-name", help="Name of account"),
+):
+    """Get an account by its name."""
+    _dbt_cloud_request(ctx, "get_account_by_name", account_name)
+
+
+@legacy_app.command("get-account-licenses", hidden=True)
+def get_account_licenses_old(ctx: typer.Context, account_id: int = ACCOUNT_ID):
+    """This will soon be deprecated! Use `dbtc accounts get-licenses` instead."""
+    return get_account_licenses(ctx, account_id)
+
+
+@app.command("get-licenses")
+def get_account_licenses(ctx: typer.Context, account_id: int = ACCOUNT_ID):
+    """Get the licenses for an account."""
+    _dbt_cloud_request(ctx, "get_account_licenses", account_id)
+
+
+@legacy_app.command("list-accounts", hidden=True)
+def list_accounts_old(ctx: typer.Context):
+    """This will soon be deprecated! Use `dbtc accounts list` instead."""
+    return list_accounts(ctx)
+
+
+@app.command("list")
+def list_accounts(ctx: typer.Context):
+    """List of accounts that your API Token is authorized to access."""
+    _dbt_cloud_request(ctx, "list_accounts")
+
+
+@legacy_app.command("list-audit-logs", hidden=True)
+def list_audit_logs_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    logged_at_start: str = typer.Option(
+        None, "--logged-at-start", help="Date to begin retrieving audit logs"
+    ),
+    logged_at_end: str = typer.Option(
+        None, "--logged-at-end", help="Date to stop retrieving audit logs"
+    ),
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+):
+    """This will soon be deprecated! Use `dbtc accounts list-audit-logs` instead."""
+    return list_audit_logs(
+        ctx,
+        account_id,
+        logged_at_start,
+        logged_at_end,
+        offset,
+        limit,
+    )
+
+
+@app.command("list-audit-logs")
+def list_audit_logs(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    logged_at_start: str = typer.Option(
+        None, "--logged-at-start", help="Date to begin retrieving audit logs"
+    ),
+    logged_at_end: str = typer.Option(
+        None, "--logged-at-end", help="Date to stop retrieving audit logs"
+    ),
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+):
+    """Retrieve audit logs for an account."""
+    _dbt_cloud_request(
+        ctx,
+        "list_audit_logs",
+        account_id,
+        logged_at_start=logged_at_start,
+        logged_at_end=logged_at_end,
+        offset=offset,
+        limit=limit,
+    )
+
+
+@legacy_app.command("list-feature-flags", hidden=True)
+def list_feature_flags_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+):
+    """This will soon be deprecated! Use `dbtc feature-flags list` instead."""
+    return list_feature_flags(ctx, account_id)
+
+
+@app.command()
+def list_feature_flags(ctx: typer.Context, account_id: int = ACCOUNT_ID):
+    """List feature flags for a specific account."""
+    _dbt_cloud_request(ctx, "list_feature_flags", account_id)
@@ -0,0 +1,65 @@
+# stdlib
+import json
+
+# third party
+import typer
+
+# first party
+from dbtc.cli._common import (
+    ACCOUNT_ID,
+    ADAPTER_ID,
+    PAYLOAD,
+    PROJECT_ID,
+    _dbt_cloud_request,
+)
+
+app = typer.Typer(name="adapters", help="Manage adapters in dbt Cloud")
+
+
+@app.command("create")
+def create_adapter(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """Create an adapter."""
+    _dbt_cloud_request(
+        ctx, "create_adapter", account_id, project_id, json.loads(payload)
+    )
+
+
+@app.command("delete")
+def delete_adapter(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    adapter_id: int = ADAPTER_ID,
+):
+    """Delete an adapter."""
+    _dbt_cloud_request(ctx, "delete_adapter", account_id, project_id, adapter_id)
+
+
+@app.command("get")
+def get_adapter(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    adapter_id: int = ADAPTER_ID,
+):
+    """Get an adapter."""
+    _dbt_cloud_request(ctx, "get_adapter", account_id, project_id, adapter_id)
+
+
+@app.command("update")
+def update_adapter(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    adapter_id: int = ADAPTER_ID,
+    payload: str = PAYLOAD,
+):
+    """Update an adapter."""
+    _dbt_cloud_request(
+        ctx, "update_adapter", account_id, project_id, adapter_id, payload
+    )
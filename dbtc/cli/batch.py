@@ -0,0 +1,176 @@
+# stdlib
+import json
+import shlex
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# third party
+import click
+import typer
+
+# first party
+from dbtc import dbtCloudClient as dbtc
+from dbtc.cli._common import batch_state
+from dbtc.cli._output import merge_pages
+
+app = typer.Typer(
+    name="batch", help="Run many commands with a single client", add_completion=False
+)
+
+PROPERTIES = ["cloud", "metadata", "sl"]
+
+# Options of `dbtc` that would write somewhere other than the batch's output, so
+# they're rejected on a line
+LINE_OPTIONS_REJECTED = ("output", "format", "version")
+
+
+def _read_lines(path: Optional[str]) -> Iterator[Tuple[int, str]]:
+    stream = sys.stdin if path in (None, "-") else open(path)
+    try:
+        for number, line in enumerate(iter(stream.readline, ""), start=1):
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield number, line
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def _run_operation(client: dbtc, operation: Dict):
+    """Call a client method directly, e.g. `{"method": "get_run", "args": [1, 2]}`"""
+    property = operation.get("property", "cloud")
+    method = operation.get("method", "")
+    if property not in PROPERTIES:
+        raise ValueError(f"property must be one of {', '.join(PROPERTIES)}")
+
+    if method.startswith("_") or not callable(
+        getattr(getattr(client, property), method, None)
+    ):
+        raise ValueError(f'"{method}" is not a method of the {property} property')
+
+    api = getattr(client, property)
+    return getattr(api, method)(
+        *operation.get("args", []), **operation.get("kwargs", {})
+    )
+
+
+def _check_command(root: click.Command, args: List[str]):
+    """Raise if a line would print or write outside of the batch's results"""
+    if "--help" in args:
+        raise ValueError("--help can't be used in a batch")
+
+    options = {
+        opt: param
+        for param in root.params
+        if isinstance(param, click.Option)
+        for opt in param.opts + param.secondary_opts
+    }
+    remaining = iter(args)
+    for arg in remaining:
+        if not arg.startswith("-"):
+            if arg == "batch":
+                raise ValueError("batch can't be run inside a batch")
+            return
+
+        name = arg.split("=", 1)[0]
+        param = options.get(name)
+        if param is None:
+            # Left for the command to report
+            return
+
+        if param.name in LINE_OPTIONS_REJECTED:
+            raise ValueError(f"{name} can't be used in a batch")
+
+        if not param.is_flag and "=" not in arg:
+            next(remaining, None)
+
+
+def _run_command(client: dbtc, root: click.Command, line: str, all_pages: bool):
+    args = shlex.split(line)
+    _check_command(root, args)
+    batch_state.client = client
+    batch_state.all_pages = all_pages
+    batch_state.responses = None
+    try:
+        root.main(args, prog_name="dbtc", standalone_mode=False)
+    finally:
+        batch_state.client = None
+        batch_state.all_pages = False
+    if batch_state.responses is None:
+        raise ValueError("Command did not make a request")
+
+    return merge_pages(batch_state.responses)
+
+
+def _execute(
+    client: dbtc, root: click.Command, number: int, line: str, all_pages: bool
+) -> Dict:
+    result: Dict = {"line": number}
+    try:
+        if line.startswith("{"):
+            response = _run_operation(client, json.loads(line))
+        else:
+            response = _run_command(client, root, line, all_pages)
+    except click.ClickException as e:
+        result.update(ok=False, error=e.format_message())
+    except Exception as e:
+        result.update(ok=False, error=f"{type(e).__name__}: {e}")
+    else:
+        result.update(ok=True, response=response)
+    return result
+
+
+@app.command()
+def batch(
+    ctx: typer.Context,
+    file: Optional[str] = typer.Argument(
+        None, help="File with one command per line.  Defaults to stdin."
+    ),
+    concurrency: int = typer.Option(
+        8, "--concurrency", "-c", min=1, help="Number of commands run at once."
+    ),
+):
+    """Run many commands through one client, writing NDJSON in input order.
+
+    Each line is either a command as you'd pass it to `dbtc`, e.g.
+    `jobs get --account-id 1 --job-id 2`, or a JSON object naming a client method,
+    e.g. `{"method": "get_job", "args": [1, 2]}` (`property` defaults to `cloud`).
+    Blank lines and lines starting with `#` are skipped.  Every result is written as
+    `{"line": ..., "ok": ..., "response": ...}`, or with an `error` on failure.
+    `--output` and `--all-pages` apply to the whole batch; lines using `--output`,
+    `--format`, `--version`, `--help`, or `batch` fail.
+    """
+    # first party
+    from dbtc.cli import app as root_app
+
+    options = dict(ctx.obj)
+    output = options.pop("output", None)
+    output_format = options.pop("format", None)
+    all_pages = options.pop("all_pages", False)
+    if output_format not in (None, "ndjson"):
+        raise typer.BadParameter(
+            "batch results are always written as ndjson", param_hint="--format"
+        )
+
+    client = dbtc(**options)
+    root = typer.main.get_command(root_app)
+    stream = open(output, "w") if output else sys.stdout
+    failed = False
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(_execute, client, root, number, line, all_pages)
+                for number, line in _read_lines(file)
+            ]
+            for future in futures:
+                result = future.result()
+                failed = failed or not result["ok"]
+                stream.write(json.dumps(result) + "\n")
+                stream.flush()
+    finally:
+        if output:
+            stream.close()
+
+    if failed:
+        raise typer.Exit(code=1)
@@ -0,0 +1,143 @@
+# stdlib
+import json
+
+# third party
+import typer
+
+# first party
+from dbtc.cli._common import (
+    ACCOUNT_ID,
+    CONNECTION_ID,
+    PAYLOAD,
+    PROJECT_ID,
+    _dbt_cloud_request,
+)
+
+app = typer.Typer(name="connections", help="Manage connections in dbt Cloud")
+
+# Hidden, deprecated aliases registered on the top-level command
+legacy_app = typer.Typer()
+
+
+@legacy_app.command("create-connection", hidden=True)
+def create_connection_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc connections create` instead."""
+    return create_connection(ctx, account_id, project_id, payload)
+
+
+@app.command("create")
+def create_connection(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """Create a connection."""
+    _dbt_cloud_request(
+        ctx, "create_connection", account_id, project_id, json.loads(payload)
+    )
+
+
+@legacy_app.command("delete-connection", hidden=True)
+def delete_connection_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    connection_id: int = CONNECTION_ID,
+):
+    """This will soon be deprecated! Use `dbtc connections delete` instead."""
+    return delete_connection(ctx, account_id, project_id, connection_id)
+
+
+@app.command("delete")
+def delete_connection(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    connection_id: int = CONNECTION_ID,
+):
+    """Delete a connection"""
+    _dbt_cloud_request(ctx, "delete_connection", account_id, project_id, connection_id)
+
+
+@legacy_app.command("list-connections", hidden=True)
+def list_connections_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+):
+    """This will soon be deprecated! Use `dbtc connections list` instead."""
+    return list_connections(ctx, account_id, project_id)
+
+
+@app.command("list")
+def list_connections(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+):
+    """List connections for a specific account and project."""
+    _dbt_cloud_request(ctx, "list_connections", account_id, project_id)
+
+
+@legacy_app.command("test-connection", hidden=True)
+def test_connection_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated!  Use dbtc connections test instead."""
+    return test_connection(ctx, account_id, project_id, payload)
+
+
+@app.command("test")
+def test_connection(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    _dbt_cloud_request(
+        ctx,
+        "test_connection",
+        account_id,
+        project_id,
+        json.loads(payload),
+    )
+
+
+@legacy_app.command("update-connection", hidden=True)
+def update_connection_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    connection_id: int = CONNECTION_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc connections update` instead."""
+    return update_connection(ctx, account_id, project_id, connection_id, payload)
+
+
+@app.command("update")
+def update_connection(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    connection_id: int = CONNECTION_ID,
+    payload: str = PAYLOAD,
+):
+    """Update a connection."""
+    _dbt_cloud_request(
+        ctx,
+        "update_connection",
+        account_id,
+        project_id,
+        connection_id,
+        json.loads(payload),
+    )
@@ -0,0 +1,97 @@
+# stdlib
+import json
+
+# third party
+import typer
+
+# first party
+from dbtc.cli._common import (
+    ACCOUNT_ID,
+    PAYLOAD,
+    PROJECT_ID,
+    _dbt_cloud_request,
+)
+
+app = typer.Typer(name="credentials", help="Manage credentials in dbt Cloud")
+
+# Hidden, deprecated aliases registered on the top-level command
+legacy_app = typer.Typer()
+
+
+@legacy_app.command("create-credentials", hidden=True)
+def create_credentials_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc credentials create` instead."""
+    return create_credentials(ctx, account_id, project_id, payload)
+
+
+@app.command("create")
+def create_credentials(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """Create credentials."""
+    _dbt_cloud_request(
+        ctx, "create_credentials", account_id, project_id, json.loads(payload)
+    )
+
+
+@legacy_app.command("list-credentials", hidden=True)
+def list_credentials_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+):
+    """This will soon be deprecated! Use `dbtc credentials list` instead."""
+    return list_credentials(ctx, account_id, project_id)
+
+
+@app.command("list")
+def list_credentials(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+):
+    """List credentials for a specific account and project."""
+    _dbt_cloud_request(ctx, "list_credentials", account_id, project_id)
+
+
+@legacy_app.command("update-credentials", hidden=True)
+def update_credentials_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    credentials_id: int = typer.Option(
+        ..., "--credentials-id", help="Numeric ID of the credentials."
+    ),
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc credentials update` instead."""
+    return update_credentials(ctx, account_id, project_id, credentials_id, payload)
+
+
+@app.command("update")
+def update_credentials(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    credentials_id: int = typer.Option(
+        ..., "--credentials-id", help="Numeric ID of the credentials."
+    ),
+    payload: str = PAYLOAD,
+):
+    """Update credentials."""
+    _dbt_cloud_request(
+        ctx,
+        "update_credentials",
+        account_id,
+        project_id,
+        credentials_id,
+        json.loads(payload),
+    )
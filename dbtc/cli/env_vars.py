@@ -0,0 +1,205 @@
+# stdlib
+import json
+
+# third party
+import typer
+
+# first party
+from dbtc.cli._common import (
+    ACCOUNT_ID,
+    LIMIT,
+    OFFSET,
+    PAYLOAD,
+    PROJECT_ID,
+    STATE,
+    _dbt_cloud_request,
+)
+
+app = typer.Typer(name="env-vars", help="Manage environment variables in dbt Cloud")
+
+# Hidden, deprecated aliases registered on the top-level command
+legacy_app = typer.Typer()
+
+
+@legacy_app.command("create-environment-variables", hidden=True)
+def create_environment_variables_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc env-vars create` instead."""
+    return create_environment_variables(ctx, account_id, project_id, payload)
+
+
+@app.command("create")
+def create_environment_variables(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """Create environment variables."""
+    _dbt_cloud_request(
+        ctx, "create_environment_variables", account_id, project_id, json.loads(payload)
+    )
+
+
+@legacy_app.command("delete-environment-variables", hidden=True)
+def delete_environment_variables_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc env-vars delete` instead."""
+    return delete_environment_variables(ctx, account_id, project_id, payload)
+
+
+@app.command("delete")
+def delete_environment_variables(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """Delete environment variables"""
+    _dbt_cloud_request(
+        ctx,
+        "delete_environment_variables",
+        account_id,
+        project_id,
+        json.loads(payload),
+    )
+
+
+@legacy_app.command("list-environment-variables", hidden=True)
+def list_environment_variables_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    resource_type: str = typer.Option(
+        "environment",
+        "--resource-type",
+        help="The name of the resource to retrieve",
+    ),
+    environment_id: int = typer.Option(
+        None,
+        "--environment-id",
+        help="Numeric ID of the environment to retrieve",
+    ),
+    job_id: int = typer.Option(
+        None,
+        "--job-id",
+        help="Numeric ID of the job to retrieve",
+    ),
+    user_id: int = typer.Option(None, "--user-id", "-u", help="Numeric ID of the user"),
+    name: str = typer.Option(
+        None,
+        "--name",
+        help="The name of the environment",
+    ),
+    type: str = typer.Option(
+        None,
+        "--type",
+        help="The type of environment (deployment or development)",
+    ),
+    state: str = STATE,
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+):
+    """This will soon be deprecated! Use `dbtc env-vars list` instead."""
+    return list_environment_variables(
+        ctx,
+        account_id,
+        project_id,
+        resource_type,
+        environment_id,
+        job_id,
+        user_id,
+        name,
+        type,
+        state,
+        offset,
+        limit,
+    )
+
+
+@app.command("list")
+def list_environment_variables(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    resource_type: str = typer.Option(
+        "environment",
+        "--resource-type",
+        help="The name of the resource to retrieve",
+    ),
+    environment_id: int = typer.Option(
+        None,
+        "--environment-id",
+        help="Numeric ID of the environment to retrieve",
+    ),
+    job_id: int = typer.Option(
+        None,
+        "--job-id",
+        help="Numeric ID of the job to retrieve",
+    ),
+    user_id: int = typer.Option(None, "--user-id", "-u", help="Numeric ID of the user"),
+    name: str = typer.Option(
+        None,
+        "--name",
+        help="The name of the environment",
+    ),
+    type: str = typer.Option(
+        None,
+        "--type",
+        help="The type of environment (deployment or development)",
+    ),
+    state: str = STATE,
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+):
+    _dbt_cloud_request(
+        ctx,
+        "list_environment_variables",
+        account_id,
+        project_id,
+        resource_type=resource_type,
+        environment_id=environment_id,
+        job_id=job_id,
+        user_id=user_id,
+        name=name,
+        type=type,
+        state=state,
+        offset=offset,
+        limit=limit,
+    )
+
+
+@legacy_app.command("update-environment-variables", hidden=True)
+def update_environment_variables_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc env-vars update` instead."""
+    return update_environment_variables(ctx, account_id, project_id, payload)
+
+
+@app.command("update")
+def update_environment_variables(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """Update environment variables."""
+    _dbt_cloud_request(
+        ctx,
+        "update_environment_variables",
+        account_id,
+        project_id,
+        json.loads(payload),
+    )
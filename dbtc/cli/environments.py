@@ -0,0 +1,213 @@
+# stdlib
+import json
+
+# third party
+import typer
+
+# first party
+from dbtc.cli._common import (
+    ACCOUNT_ID,
+    ENVIRONMENT_ID,
+    LIMIT,
+    OFFSET,
+    ORDER_BY,
+    PAYLOAD,
+    PROJECT_ID,
+    STATE,
+    _dbt_cloud_request,
+)
+
+app = typer.Typer(name="environments", help="Manage environments in dbt Cloud")
+
+# Hidden, deprecated aliases registered on the top-level command
+legacy_app = typer.Typer()
+
+
+@legacy_app.command("create-environment", hidden=True)
+def create_environment_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc environments create` instead."""
+    return create_environment(ctx, account_id, project_id, payload)
+
+
+@app.command("create")
+def create_environment(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """Create an environment."""
+    _dbt_cloud_request(
+        ctx, "create_environment", account_id, project_id, json.loads(payload)
+    )
+
+
+@legacy_app.command("delete-environment", hidden=True)
+def delete_environment_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    environment_id: int = ENVIRONMENT_ID,
+):
+    """This will soon be deprecated! Use `dbtc environments delete` instead."""
+    return delete_environment(ctx, account_id, project_id, environment_id)
+
+
+@app.command("delete")
+def delete_environment(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    environment_id: int = ENVIRONMENT_ID,
+):
+    """Delete an environment"""
+    _dbt_cloud_request(
+        ctx, "delete_environment", account_id, project_id, environment_id
+    )
+
+
+@legacy_app.command("list-environments", hidden=True)
+def list_environments_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: str = PROJECT_ID,
+    credentials_id: int = typer.Option(
+        None, "--credentials-id", help="Numeric ID of the credentials."
+    ),
+    dbt_version: str = typer.Option(
+        None,
+        "--dbt-version",
+        help="The dbt version(s) used in the environment",
+    ),
+    deployment_type: str = typer.Option(
+        None,
+        "--deployment-type",
+        help="The deployment type of the environment",
+    ),
+    name: str = typer.Option(
+        None,
+        "--name",
+        help="The name of the environment",
+    ),
+    type: str = typer.Option(
+        None,
+        "--type",
+        help="The type of environment (deployment or development)",
+    ),
+    state: str = STATE,
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+    order_by: str = ORDER_BY,
+):
+    """This will soon be deprecated! Use `dbtc environments list` instead."""
+    return list_environments(
+        ctx,
+        account_id,
+        project_id,
+        credentials_id=credentials_id,
+        dbt_version=dbt_version,
+        deployment_type=deployment_type,
+        name=name,
+        type=type,
+        state=state,
+        offset=offset,
+        limit=limit,
+        order_by=order_by,
+    )
+
+
+@app.command("list")
+def list_environments(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: str = PROJECT_ID,
+    dbt_version: str = typer.Option(
+        None,
+        "--dbt-version",
+        help="The dbt version(s) used in the environment",
+    ),
+    deployment_type: str = typer.Option(
+        None,
+        "--deployment-type",
+        help="The deployment type of the environment",
+    ),
+    credentials_id: int = typer.Option(
+        None, "--credentials-id", help="Numeric ID of the credentials."
+    ),
+    name: str = typer.Option(
+        None,
+        "--name",
+        help="The name of the environment",
+    ),
+    type: str = typer.Option(
+        None,
+        "--type",
+        help="The type of environment (deployment or development)",
+    ),
+    state: str = STATE,
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+    order_by: str = ORDER_BY,
+):
+    """List environments in an account"""
+    try:
+        dbt_version = json.loads(dbt_version)
+    except (ValueError, TypeError):
+        pass
+
+    try:
+        deployment_type = json.loads(deployment_type)
+    except (ValueError, TypeError):
+        pass
+
+    _dbt_cloud_request(
+        ctx,
+        "list_environments",
+        account_id,
+        project_id,
+        dbt_version=dbt_version,
+        deployment_type=deployment_type,
+        credentials_id=credentials_id,
+        name=name,
+        type=type,
+        state=state,
+        offset=offset,
+        limit=limit,
+        order_by=order_by,
+    )
+
+
+@legacy_app.command("update-environment", hidden=True)
+def update_environment_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    environment_id: int = ENVIRONMENT_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc environments update` instead."""
+    return update_environment(ctx, account_id, project_id, environment_id, payload)
+
+
+@app.command("update")
+def update_environment(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    environment_id: int = ENVIRONMENT_ID,
+    payload: str = PAYLOAD,
+):
+    """Update an environment."""
+    _dbt_cloud_request(
+        ctx,
+        "update_environment",
+        account_id,
+        project_id,
+        environment_id,
+        json.loads(payload),
+    )
@@ -0,0 +1,128 @@
+# stdlib
+import json
+
+# third party
+import typer
+
+# first party
+from dbtc.cli._common import (
+    ACCOUNT_ID,
+    GROUP_ID,
+    PAYLOAD,
+    PROJECT_ID,
+    _dbt_cloud_request,
+)
+
+app = typer.Typer(name="groups", help="Manage user groups in dbt Cloud")
+
+# Hidden, deprecated aliases registered on the top-level command
+legacy_app = typer.Typer()
+
+
+@legacy_app.command("assign-group-permissions", hidden=True)
+def assign_group_permissions_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    group_id: int = GROUP_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc user-groups assign-permissions`
+    instead.
+    """
+    return assign_group_permissions(ctx, account_id, group_id, payload)
+
+
+@app.command("assign-permissions")
+def assign_group_permissions(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    group_id: int = GROUP_ID,
+    payload: str = PAYLOAD,
+):
+    """Assign group permissions."""
+    _dbt_cloud_request(
+        ctx,
+        "assign_group_permissions",
+        account_id,
+        group_id,
+        json.loads(payload),
+    )
+
+
+@legacy_app.command("assign-user-to-group", hidden=True)
+def assign_user_to_group_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc users assign-to-group` instead."""
+    return assign_user_to_group(ctx, account_id, project_id, payload)
+
+
+@app.command("assign")
+def assign_user_to_group(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """Assign a user to a group."""
+    _dbt_cloud_request(
+        ctx,
+        "assign_user_to_group",
+        account_id,
+        project_id,
+        json.loads(payload),
+    )
+
+
+@legacy_app.command("create-user-group", hidden=True)
+def create_user_group_old(
+    ctx: typer.Context, account_id: int = ACCOUNT_ID, payload: str = PAYLOAD
+):
+    """This will soon be deprecated! Use `dbtc user-groups create` instead."""
+    return create_user_group(ctx, account_id, payload)
+
+
+@app.command("create")
+def create_user_group(
+    ctx: typer.Context, account_id: int = ACCOUNT_ID, payload: str = PAYLOAD
+):
+    """Create a user group."""
+    _dbt_cloud_request(ctx, "create_user_group", account_id, json.loads(payload))
+
+
+@legacy_app.command("delete-user-group", hidden=True)
+def delete_user_group_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    group_id: int = GROUP_ID,
+):
+    """This will soon be deprecated! Use `dbtc user-groups delete` instead."""
+    return delete_user_group(ctx, account_id, group_id)
+
+
+@app.command("delete")
+def delete_user_group(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    group_id: int = GROUP_ID,
+):
+    """Delete a user group."""
+    _dbt_cloud_request(ctx, "delete_user_group", account_id, group_id)
+
+
+@legacy_app.command("list-groups", hidden=True)
+def list_groups_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+):
+    """This will soon be deprecated! Use `dbtc user-groups list` instead."""
+    return list_groups(ctx, account_id)
+
+
+@app.command("list")
+def list_groups(ctx: typer.Context, account_id: int = ACCOUNT_ID):
+    """List groups for a specific account."""
+    _dbt_cloud_request(ctx, "list_groups", account_id)
@@ -0,0 +1,328 @@
+# stdlib
+import json
+
+# third party
+import typer
+
+# first party
+from dbtc.cli._common import (
+    ACCOUNT_ID,
+    INCLUDE_RELATED,
+    JOB_ID,
+    LIMIT,
+    OFFSET,
+    ORDER_BY,
+    PAYLOAD,
+    PROJECT_ID,
+    STATE,
+    _dbt_cloud_request,
+)
+
+app = typer.Typer(name="jobs", help="Manage jobs in dbt Cloud")
+
+# Hidden, deprecated aliases registered on the top-level command
+legacy_app = typer.Typer()
+
+
+@legacy_app.command("create-job", hidden=True)
+def create_job_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc jobs create` instead."""
+    return create_job(ctx, account_id, project_id, payload)
+
+
+@app.command("create")
+def create_job(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """Create a job in a project."""
+    _dbt_cloud_request(ctx, "create_job", account_id, project_id, json.loads(payload))
+
+
+@legacy_app.command("get-job", hidden=True)
+def get_job_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    job_id: int = JOB_ID,
+    order_by: str = ORDER_BY,
+    include_related: str = INCLUDE_RELATED,
+):
+    """This will soon be deprecated! Use `dbtc jobs get` instead."""
+    return get_job(ctx, account_id, job_id, order_by, include_related)
+
+
+@app.command("get")
+def get_job(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    job_id: int = JOB_ID,
+    order_by: str = ORDER_BY,
+    include_related: str = INCLUDE_RELATED,
+):
+    """Return job details for a job on an account."""
+    _dbt_cloud_request(
+        ctx,
+        "get_job",
+        account_id,
+        job_id,
+        order_by=order_by,
+        include_related=include_related,
+    )
+
+
+@legacy_app.command("list-jobs", hidden=True)
+def list_jobs_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    environment_id: int = typer.Option(
+        None,
+        "--environment-id",
+        "-e",
+        help="Numeric ID of the environment to retrieve",
+    ),
+    project_id: str = typer.Option(
+        None, "--project-id", "-p", help="The project ID or IDs"
+    ),
+    state: str = STATE,
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+    order_by: str = ORDER_BY,
+):
+    """This will soon be deprecated! Use `dbtc jobs list` instead."""
+    return list_jobs(
+        ctx, account_id, environment_id, project_id, state, offset, limit, order_by
+    )
+
+
+@app.command("list")
+def list_jobs(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    environment_id: int = typer.Option(
+        None,
+        "--environment-id",
+        "-e",
+        help="Numeric ID of the environment to retrieve",
+    ),
+    project_id: str = typer.Option(
+        None, "--project-id", "-p", help="The project ID or IDs"
+    ),
+    state: str = STATE,
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+    order_by: str = ORDER_BY,
+):
+    """List jobs in an account or specific project"""
+    _dbt_cloud_request(
+        ctx,
+        "list_jobs",
+        account_id,
+        environment_id=environment_id,
+        project_id=json.loads(project_id) if project_id else project_id,
+        state=state,
+        offset=offset,
+        limit=limit,
+        order_by=order_by,
+    )
+
+
+@legacy_app.command("trigger-job", hidden=True)
+def trigger_job_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    job_id: int = JOB_ID,
+    payload: str = PAYLOAD,
+    should_poll: bool = typer.Option(
+        True,
+        help="Poll until job completion (status is one of success, failure, or "
+        "cancelled)",
+    ),
+    poll_interval: int = typer.Option(
+        10, "--poll-interval", help="Number of seconds to wait in between polling."
+    ),
+    retries: int = typer.Option(
+        0, "--retries", help="Number of times to retry triggering the job on failure."
+    ),
+):
+    """This will soon be deprecated! Use `dbtc jobs trigger` instead."""
+    return trigger_job(
+        ctx, account_id, job_id, payload, should_poll, poll_interval, retries
+    )
+
+
+@app.command("trigger")
+def trigger_job(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    job_id: int = JOB_ID,
+    payload: str = PAYLOAD,
+    should_poll: bool = typer.Option(
+        True,
+        help="Poll until job completion (status is one of success, failure, or "
+        "cancelled)",
+    ),
+    poll_interval: int = typer.Option(
+        10, "--poll-interval", help="Number of seconds to wait in between polling."
+    ),
+    retries: int = typer.Option(
+        0, "--retries", help="Number of times to retry triggering the job on failure."
+    ),
+):
+    """Trigger job to run."""
+    _dbt_cloud_request(
+        ctx,
+        "trigger_job",
+        account_id,
+        job_id,
+        json.loads(payload),
+        should_poll=should_poll,
+        poll_interval=poll_interval,
+        retries=retries,
+    )
+
+
+@legacy_app.command("trigger-autoscaling-ci-job", hidden=True)
+def trigger_autoscaling_ci_job_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    job_id: int = JOB_ID,
+    payload: str = PAYLOAD,
+    should_poll: bool = typer.Option(
+        False,
+        help="Poll until job completion (status is one of success, failure, or "
+        "cancelled)",
+    ),
+    poll_interval: int = typer.Option(
+        10, "--poll-interval", help="Number of seconds to wait in between polling."
+    ),
+    delete_cloned_job: bool = typer.Option(
+        True, help="Indicate whether cloned job should be deleted after triggering"
+    ),
+    max_run_slots: int = typer.Option(
+        None, help="Number of run slots that should be available to this process"
+    ),
+):
+    """This will soon be deprecated! Use `dbtc jobs trigger-autoscaling` instead."""
+    return trigger_autoscaling_ci_job(
+        ctx,
+        account_id,
+        job_id,
+        payload,
+        should_poll,
+        poll_interval,
+        delete_cloned_job,
+        max_run_slots,
+    )
+
+
+@app.command("trigger-autoscaling")
+def trigger_autoscaling_ci_job(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    job_id: int = JOB_ID,
+    payload: str = PAYLOAD,
+    should_poll: bool = typer.Option(
+        False,
+        help="Poll until job completion (status is one of success, failure, or "
+        "cancelled)",
+    ),
+    poll_interval: int = typer.Option(
+        10, "--poll-interval", help="Number of seconds to wait in between polling."
+    ),
+    delete_cloned_job: bool = typer.Option(
+        True, help="Indicate whether cloned job should be deleted after triggering"
+    ),
+    max_run_slots: int = typer.Option(
+        None, help="Number of run slots that should be available to this process"
+    ),
+):
+    """Trigger an autoscaling CI job to run."""
+    _dbt_cloud_request(
+        ctx,
+        "trigger_autoscaling_ci_job",
+        account_id,
+        job_id,
+        json.loads(payload),
+        should_poll=should_poll,
+        poll_interval=poll_interval,
+        delete_cloned_job=delete_cloned_job,
+        max_run_slots=max_run_slots,
+    )
+
+
+@legacy_app.command("trigger-job-from-failure", hidden=True)
+def trigger_job_from_failure_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    job_id: int = JOB_ID,
+    should_poll: bool = typer.Option(
+        True,
+        help="Poll until job completion (status is one of success, failure, or "
+        "cancelled)",
+    ),
+    poll_interval: int = typer.Option(
+        10, "--poll-interval", help="Number of seconds to wait in between polling."
+    ),
+):
+    """This will soon be deprecated! Use `dbtc jobs trigger-from-failure` instead."""
+    return trigger_job_from_failure(ctx, account_id, job_id, should_poll, poll_interval)
+
+
+@app.command("trigger-from-failure")
+def trigger_job_from_failure(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    job_id: int = JOB_ID,
+    should_poll: bool = typer.Option(
+        True,
+        help="Poll until job completion (status is one of success, failure, or "
+        "cancelled)",
+    ),
+    poll_interval: int = typer.Option(
+        10, "--poll-interval", help="Number of seconds to wait in between polling."
+    ),
+):
+    """Trigger job from point of failure."""
+    _dbt_cloud_request(
+        ctx,
+        "trigger_job_from_failure",
+        account_id,
+        job_id,
+        should_poll=should_poll,
+        poll_interval=poll_interval,
+    )
+
+
+@legacy_app.command("update-job", hidden=True)
+def update_job_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    job_id: int = JOB_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc jobs update` instead."""
+    return update_job(ctx, account_id, job_id, payload)
+
+
+@app.command("update")
+def update_job(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    job_id: int = JOB_ID,
+    payload: str = PAYLOAD,
+):
+    """Update the definition of an existing job."""
+    _dbt_cloud_request(
+        ctx,
+        "update_job",
+        account_id,
+        job_id,
+        json.loads(payload),
+    )
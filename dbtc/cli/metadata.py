@@ -0,0 +1,312 @@
+# stdlib
+import json
+
+# third party
+import typer
+
+# first party
+from dbtc.cli._common import (
+    ACCOUNT_ID,
+    END_DATE,
+    ENVIRONMENT_ID,
+    START_DATE,
+    UNIQUE_ID,
+    _dbt_api_request,
+)
+
+app = typer.Typer(name="metadata", help="Retrieve metadata from dbt Cloud")
+
+
+@app.command("column-lineage")
+def column_lineage(
+    ctx: typer.Context,
+    environment_id: int = ENVIRONMENT_ID,
+    node_unique_id: str = UNIQUE_ID,
+    *,
+    max_depth: int = typer.Option(
+        None, "--max-depth", help="Maximum depth of the lineage graph."
+    ),
+    column_name: str = typer.Option(
+        None, "--column-name", help="Name of the column to filter lineage for."
+    ),
+    is_error: bool = typer.Option(
+        False, "--is-error", help="Whether to return only error nodes."
+    ),
+):
+    _dbt_api_request(
+        ctx,
+        "metadata",
+        "column_lineage",
+        environment_id,
+        node_unique_id,
+        max_depth=max_depth,
+        column_name=column_name,
+        is_error=is_error,
+    )
+
+
+@app.command("longest-executed-models")
+def longest_executed_models(
+    ctx: typer.Context,
+    environment_id: int = ENVIRONMENT_ID,
+    start_date: str = START_DATE,
+    end_date: str = END_DATE,
+    *,
+    limit: int = typer.Option(5, "--limit", help="Maximum number of models to return."),
+    job_limit: int = typer.Option(
+        5, "--job-limit", help="Maximum number of jobs to return."
+    ),
+    order_by: str = typer.Option(
+        "MAX", "--order-by", help="Order the results by MAX or AVG."
+    ),
+):
+    _dbt_api_request(
+        ctx,
+        "metadata",
+        "longest_executed_models",
+        environment_id,
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit,
+        job_limit=job_limit,
+        order_by=order_by,
+    )
+
+
+@app.command("mesh-projects")
+def mesh_projects(ctx: typer.Context, account_id: int = ACCOUNT_ID):
+    _dbt_api_request(
+        ctx,
+        "metadata",
+        "mesh_projects",
+        account_id,
+    )
+
+
+@app.command("model-execution-history")
+def model_execution_history(
+    ctx: typer.Context,
+    environment_id: int = ENVIRONMENT_ID,
+    start_date: str = START_DATE,
+    end_date: str = END_DATE,
+    unique_id: str = UNIQUE_ID,
+):
+    _dbt_api_request(
+        ctx,
+        "metadata",
+        "model_execution_history",
+        environment_id,
+        start_date=start_date,
+        end_date=end_date,
+        unique_id=unique_id,
+    )
+
+
+@app.command("model-job-information")
+def model_job_information(
+    ctx: typer.Context,
+    environment_id: int = ENVIRONMENT_ID,
+    start_date: str = START_DATE,
+    end_date: str = END_DATE,
+    unique_id: str = UNIQUE_ID,
+):
+    _dbt_api_request(
+        ctx,
+        "metadata",
+        "model_job_information",
+        environment_id,
+        start_date=start_date,
+        end_date=end_date,
+        unique_id=unique_id,
+    )
+
+
+@app.command("most-executed-models")
+def most_executed_models(
+    ctx: typer.Context,
+    environment_id: int = ENVIRONMENT_ID,
+    start_date: str = START_DATE,
+    end_date: str = END_DATE,
+    *,
+    limit: int = typer.Option(5, "--limit", help="Maximum number of models to return."),
+    job_limit: int = typer.Option(
+        5, "--job-limit", help="Maximum number of jobs to return."
+    ),
+):
+    _dbt_api_request(
+        ctx,
+        "metadata",
+        "most_executed_models",
+        environment_id,
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit,
+        job_limit=job_limit,
+    )
+
+
+@app.command("most-failed-models")
+def most_failed_models(
+    ctx: typer.Context,
+    environment_id: int = ENVIRONMENT_ID,
+    start_date: str = START_DATE,
+    end_date: str = END_DATE,
+    *,
+    limit: int = typer.Option(5, "--limit", help="Maximum number of models to return."),
+):
+    _dbt_api_request(
+        ctx,
+        "metadata",
+        "most_failed_models",
+        environment_id,
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit,
+    )
+
+
+@app.command("most-test-failures")
+def most_models_test_failures(
+    ctx: typer.Context,
+    environment_id: int = ENVIRONMENT_ID,
+    start_date: str = START_DATE,
+    end_date: str = END_DATE,
+    *,
+    limit: int = typer.Option(5, "--limit", help="Maximum number of models to return."),
+):
+    _dbt_api_request(
+        ctx,
+        "metadata",
+        "most_models_test_failures",
+        environment_id,
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit,
+    )
+
+
+@app.command("performance-overview")
+def performance_overview(
+    ctx: typer.Context,
+    environment_id: int = ENVIRONMENT_ID,
+    start_date: str = START_DATE,
+    end_date: str = END_DATE,
+    *,
+    limit: int = typer.Option(5, "--limit", help="Maximum number of models to return."),
+    job_limit: int = typer.Option(
+        5, "--job-limit", help="Maximum number of jobs to return."
+    ),
+    order_by: str = typer.Option(
+        "MAX", "--order-by", help="Order the longest executed models by MAX or AVG."
+    ),
+    first: int = typer.Option(
+        500, "--first", help="Maximum number of recommendations to return."
+    ),
+):
+    _dbt_api_request(
+        ctx,
+        "metadata",
+        "performance_overview",
+        environment_id,
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit,
+        job_limit=job_limit,
+        order_by=order_by,
+        first=first,
+    )
+
+
+@app.command("public-models")
+def public_models(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    *,
+    max_results: int = typer.Option(
+        None, "--max-results", help="Maximum number of models to return."
+    ),
+):
+    _dbt_api_request(
+        ctx,
+        "metadata",
+        "public_models",
+        account_id,
+        max_results=max_results,
+    )
+
+
+@app.command("query")
+def query(
+    ctx: typer.Context,
+    query: str = typer.Option(..., "--query", "-q", help="The GraphQL query to run."),
+    variables: str = typer.Option(
+        None, "--variables", help="The variables to include in the request."
+    ),
+    max_pages: int = typer.Option(
+        None, "--max-pages", help="Maximum number of pages to retrieve."
+    ),
+    paginated_request_to_list: bool = typer.Option(
+        True, "--to-list", help="Whether to convert paginated requests to a list."
+    ),
+    validate: bool = typer.Option(
+        False,
+        "--validate",
+        help="Validate the query against the cached schema before sending it.",
+    ),
+):
+    if variables is not None:
+        variables = json.loads(variables)
+    _dbt_api_request(
+        ctx,
+        "metadata",
+        "query",
+        query,
+        variables,
+        max_pages,
+        paginated_request_to_list,
+        validate=validate,
+    )
+
+
+@app.command("recommendations")
+def recommendations(
+    ctx: typer.Context,
+    environment_id: int = ENVIRONMENT_ID,
+    *,
+    first: int = typer.Option(
+        500, "--first", help="Maximum number of items to return in a single request."
+    ),
+    severity: str = typer.Option(
+        None, "--severity", help="Severity to filter recommendations by."
+    ),
+    categories: str = typer.Option(
+        None, "--categories", help="Categories to filter recommendations by."
+    ),
+    rule_names: str = typer.Option(
+        None, "--rule-names", help="Rules to filter recommendations by."
+    ),
+    unique_ids: str = typer.Option(
+        None, "--unique-ids", help="Unique IDs to filter recommendations by."
+    ),
+):
+    def _to_list(value):
+        if value is None:
+            return None
+
+        try:
+            return json.loads(value)
+
+        except ValueError:
+            return value
+
+    _dbt_api_request(
+        ctx,
+        "metadata",
+        "recommendations",
+        environment_id,
+        first=first,
+        severity=_to_list(severity),
+        categories=_to_list(categories),
+        rule_names=_to_list(rule_names),
+        unique_ids=_to_list(unique_ids),
+    )
@@ -0,0 +1,87 @@
+# stdlib
+import json
+
+# third party
+import typer
+
+# first party
+from dbtc.cli._common import (
+    ACCOUNT_ID,
+    LIMIT,
+    NOTIFICATION_ID,
+    OFFSET,
+    PAYLOAD,
+    _dbt_cloud_request,
+)
+
+app = typer.Typer(name="notifications", help="Manage job notifications in dbt Cloud")
+
+
+@app.command("create")
+def create_notification(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    payload: str = PAYLOAD,
+):
+    """Create a job notification."""
+    _dbt_cloud_request(ctx, "create_notification", account_id, json.loads(payload))
+
+
+@app.command("delete")
+def delete_notification(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    notification_id: int = NOTIFICATION_ID,
+):
+    """Delete a job notification."""
+    _dbt_cloud_request(ctx, "delete_notification", account_id, notification_id)
+
+
+@app.command("get")
+def get_notification(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    notification_id: int = NOTIFICATION_ID,
+):
+    """Get a job notification."""
+    _dbt_cloud_request(ctx, "get_notification", account_id, notification_id)
+
+
+@app.command("list")
+def list_notifications(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    external_email: str = typer.Option(
+        None,
+        "--external-email",
+        help="The external email address the job notifications are sent to",
+    ),
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+):
+    """List job notifications."""
+    _dbt_cloud_request(
+        ctx,
+        "list_notifications",
+        account_id,
+        external_email=external_email,
+        offset=offset,
+        limit=limit,
+    )
+
+
+@app.command("update")
+def update_notification(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    notification_id: int = NOTIFICATION_ID,
+    payload: str = PAYLOAD,
+):
+    """Update a job notification."""
+    _dbt_cloud_request(
+        ctx,
+        "update_notification",
+        account_id,
+        notification_id,
+        json.loads(payload),
+    )
@@ -0,0 +1,175 @@
+# stdlib
+import json
+
+# third party
+import typer
+
+# first party
+from dbtc.cli._common import (
+    ACCOUNT_ID,
+    LIMIT,
+    OFFSET,
+    PAYLOAD,
+    PROJECT_ID,
+    STATE,
+    _dbt_cloud_request,
+)
+
+app = typer.Typer(name="projects", help="Manage projects in dbt Cloud")
+
+# Hidden, deprecated aliases registered on the top-level command
+legacy_app = typer.Typer()
+
+
+@legacy_app.command("create-project", hidden=True)
+def create_project_old(
+    ctx: typer.Context, account_id: int = ACCOUNT_ID, payload: str = PAYLOAD
+):
+    """This will soon be deprecated! Use `dbtc projects create` instead."""
+    return create_project(ctx, account_id, payload)
+
+
+@app.command("create")
+def create_project(
+    ctx: typer.Context, account_id: int = ACCOUNT_ID, payload: str = PAYLOAD
+):
+    """Create a project."""
+    _dbt_cloud_request(ctx, "create_project", account_id, json.loads(payload))
+
+
+@legacy_app.command("delete-project", hidden=True)
+def delete_project_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+):
+    """This will soon be deprecated! Use `dbtc projects delete` instead."""
+    return delete_project(ctx, account_id, project_id)
+
+
+@app.command("delete")
+def delete_project(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+):
+    """Delete a project."""
+    _dbt_cloud_request(ctx, "delete_project", account_id, project_id)
+
+
+@legacy_app.command("get-project", hidden=True)
+def get_project_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+):
+    """This will soon be deprecated! Use `dbtc projects get` instead."""
+    return get_project(ctx, account_id, project_id)
+
+
+@app.command("get")
+def get_project(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+):
+    """Get a project by its ID"""
+    _dbt_cloud_request(ctx, "get_project", account_id=account_id, project_id=project_id)
+
+
+@legacy_app.command("get-project-by-name", hidden=True)
+def get_project_by_name_old(
+    ctx: typer.Context,
+    project_name: str = typer.Option(..., "--project-name", help="Name of project"),
+    account_id: str = typer.Option(
+        None, "--account-id", "-a", help="Numeric ID of account"
+    ),
+    account_name: str = typer.Option(None, "--account-name", help="Name of account"),
+):
+    """This will soon be deprecated! Use `dbtc projects get-by-name` instead."""
+    return get_project_by_name(ctx, project_name, account_id, account_name)
+
+
+@app.command("get-by-name")
+def get_project_by_name(
+    ctx: typer.Context,
+    project_name: str = typer.Option(..., "--project-name", help="Name of project"),
+    account_id: str = typer.Option(
+        None, "--account-id", "-a", help="Numeric ID of account"
+    ),
+    account_name: str = typer.Option(None, "--account-name", help="Name of account"),
+):
+    """Get a project by its name."""
+    _dbt_cloud_request(
+        ctx,
+        "get_project_by_name",
+        project_name,
+        account_id=account_id,
+        account_name=account_name,
+    )
+
+
+@legacy_app.command("list-projects", hidden=True)
+def list_projects_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: str = typer.Option(
+        None, "--project-id", "-p", help="The project ID or IDs"
+    ),
+    state: str = STATE,
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+):
+    """This will soon be deprecated! Use `dbtc projects list` instead."""
+    return list_projects(ctx, account_id, project_id, state, offset, limit)
+
+
+@app.command("list")
+def list_projects(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: str = typer.Option(
+        None, "--project-id", "-p", help="The project ID or IDs"
+    ),
+    state: str = STATE,
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+):
+    """List projects for a specified account"""
+    _dbt_cloud_request(
+        ctx,
+        "list_projects",
+        account_id,
+        project_id=json.loads(project_id) if project_id else project_id,
+        state=state,
+        offset=offset,
+        limit=limit,
+    )
+
+
+@legacy_app.command("update-project", hidden=True)
+def update_project_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc projects update` instead."""
+    return update_project(ctx, account_id, project_id, payload)
+
+
+@app.command("update")
+def update_project(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """Update a project."""
+    _dbt_cloud_request(
+        ctx,
+        "update_project",
+        account_id,
+        project_id,
+        json.loads(payload),
+    )
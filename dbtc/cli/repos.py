@@ -0,0 +1,116 @@
+# stdlib
+import json
+
+# third party
+import typer
+
+# first party
+from dbtc.cli._common import (
+    ACCOUNT_ID,
+    PAYLOAD,
+    PROJECT_ID,
+    REPOSITORY_ID,
+    _dbt_cloud_request,
+)
+
+app = typer.Typer(name="repos", help="Manage repositories in dbt Cloud")
+
+# Hidden, deprecated aliases registered on the top-level command
+legacy_app = typer.Typer()
+
+
+@legacy_app.command("create-repository", hidden=True)
+def create_repository_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc repos create` instead."""
+    return create_repository(ctx, account_id, project_id, payload)
+
+
+@app.command("create")
+def create_repository(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    payload: str = PAYLOAD,
+):
+    """Create a repository in a project."""
+    _dbt_cloud_request(
+        ctx, "create_repository", account_id, project_id, json.loads(payload)
+    )
+
+
+@legacy_app.command("delete-repository", hidden=True)
+def delete_repository_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    repository_id: int = REPOSITORY_ID,
+):
+    """This will soon be deprecated! Use `dbtc repos delete` instead."""
+    return delete_repository(ctx, account_id, project_id, repository_id)
+
+
+@app.command("delete")
+def delete_repository(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    repository_id: int = REPOSITORY_ID,
+):
+    """Delete a repository."""
+    _dbt_cloud_request(ctx, "delete_repository", account_id, project_id, repository_id)
+
+
+@legacy_app.command("list-repositories", hidden=True)
+def list_repositories_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+):
+    """This will soon be deprecated! Use `dbtc repos list` instead."""
+    return list_repositories(ctx, account_id, project_id)
+
+
+@app.command("list")
+def list_repositories(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+):
+    """List repositories for a specific account and project."""
+    _dbt_cloud_request(ctx, "list_repositories", account_id, project_id)
+
+
+@legacy_app.command("update-repository", hidden=True)
+def update_repository_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    repository_id: int = REPOSITORY_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc repos update` instead."""
+    return update_repository(ctx, account_id, project_id, repository_id, payload)
+
+
+@app.command("update")
+def update_repository(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    repository_id: int = REPOSITORY_ID,
+    payload: str = PAYLOAD,
+):
+    """Update a repository."""
+    _dbt_cloud_request(
+        ctx,
+        "update_repository",
+        account_id,
+        project_id,
+        repository_id,
+        json.loads(payload),
+    )
@@ -0,0 +1,408 @@
+# stdlib
+import json
+
+# third party
+import typer
+
+# first party
+from dbtc.cli._common import (
+    ACCOUNT_ID,
+    INCLUDE_RELATED,
+    LIMIT,
+    OFFSET,
+    ORDER_BY,
+    PROJECT_ID,
+    RUN_ID,
+    _dbt_cloud_request,
+)
+
+app = typer.Typer(name="runs", help="Manage runs in dbt Cloud")
+
+# Hidden, deprecated aliases registered on the top-level command
+legacy_app = typer.Typer()
+
+
+@legacy_app.command("cancel-run", hidden=True)
+def cancel_run_old(
+    ctx: typer.Context, account_id: int = ACCOUNT_ID, run_id: int = RUN_ID
+):
+    """This will soon be deprecated! Use `dbtc runs cancel` instead."""
+    return cancel_run(ctx, account_id, run_id)
+
+
+@app.command("cancel")
+def cancel_run(ctx: typer.Context, account_id: int = ACCOUNT_ID, run_id: int = RUN_ID):
+    """Cancel a run."""
+    _dbt_cloud_request(ctx, "cancel_run", account_id, run_id)
+
+
+@legacy_app.command("get-most-recent-run", hidden=True)
+def get_most_recent_run_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    include_related: str = INCLUDE_RELATED,
+    job_id: int = typer.Option(
+        None, "--job-id", "-j", help="Numeric ID of job to retrieve"
+    ),
+    environment_id: int = typer.Option(
+        None, "--environment-id", "-e", help="Numeric ID of environment to retrieve"
+    ),
+    project_id: str = typer.Option(
+        None, "--project-id", "-p", help="The project ID or IDs"
+    ),
+    deferring_run_id: int = typer.Option(
+        None, "--deferring-run-id", help="The deferring run ID"
+    ),
+    status: str = typer.Option(
+        None, "--status", help="Status to apply when listing runs"
+    ),
+):
+    """This will soon be deprecated! Use `dbtc runs get-most-recent` instead."""
+    return get_most_recent_run(
+        ctx,
+        account_id,
+        include_related,
+        job_id,
+        environment_id,
+        project_id,
+        deferring_run_id,
+        status,
+    )
+
+
+@app.command("get-most-recent")
+def get_most_recent_run(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    include_related: str = INCLUDE_RELATED,
+    job_id: int = typer.Option(
+        None, "--job-id", "-j", help="Numeric ID of job to retrieve"
+    ),
+    environment_id: int = typer.Option(
+        None, "--environment-id", "-e", help="Numeric ID of environment to retrieve"
+    ),
+    project_id: str = typer.Option(
+        None, "--project-id", "-p", help="The project ID or IDs"
+    ),
+    deferring_run_id: int = typer.Option(
+        None, "--deferring-run-id", help="The deferring run ID"
+    ),
+    status: str = typer.Option(
+        None, "--status", help="Status to apply when listing runs"
+    ),
+):
+    """Get the most recent run for an account."""
+    if status is not None:
+        try:
+            status = json.loads(status)
+        except ValueError:
+            pass
+
+    _dbt_cloud_request(
+        ctx,
+        "get_most_recent_run",
+        account_id,
+        include_related=include_related,
+        job_definition_id=job_id,
+        environment_id=environment_id,
+        project_id=json.loads(project_id) if project_id else project_id,
+        deferring_run_id=deferring_run_id,
+        status=status,
+    )
+
+
+@legacy_app.command("get-most-recent-run-artifact", hidden=True)
+def get_most_recent_run_artifact_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    path: str = typer.Option(
+        ..., "--path", "-f", help="Name of artifact to retrieve (e.g. manifest.json)"
+    ),
+    job_id: int = typer.Option(
+        None, "--job-id", "-j", help="Numeric ID of job to retrieve"
+    ),
+    environment_id: int = typer.Option(
+        None, "--environment-id", "-e", help="Numeric ID of environment to retrieve"
+    ),
+    project_id: str = typer.Option(
+        None, "--project-id", "-p", help="The project ID or IDs"
+    ),
+    deferring_run_id: int = typer.Option(
+        None, "--deferring-run-id", help="The deferring run ID"
+    ),
+    step: int = typer.Option(
+        None, "--step", "-s", help="Index of the step in the run to retrieve"
+    ),
+):
+    """
+    This will soon be deprecated! Use `dbtc runs get-most-recent-artifact` instead.
+    """
+    return get_most_recent_run_artifact(
+        ctx,
+        account_id,
+        path,
+        job_id,
+        environment_id,
+        project_id,
+        deferring_run_id,
+        step,
+    )
+
+
+@app.command("get-most-recent-artifact")
+def get_most_recent_run_artifact(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    path: str = typer.Option(
+        ..., "--path", "-f", help="Name of artifact to retrieve (e.g. manifest.json)"
+    ),
+    job_id: int = typer.Option(
+        None, "--job-id", "-j", help="Numeric ID of job to retrieve"
+    ),
+    environment_id: int = typer.Option(
+        None, "--environment-id", "-e", help="Numeric ID of environment to retrieve"
+    ),
+    project_id: str = typer.Option(
+        None, "--project-id", "-p", help="The project ID or IDs"
+    ),
+    deferring_run_id: int = typer.Option(
+        None, "--deferring-run-id", help="The deferring run ID"
+    ),
+    step: int = typer.Option(
+        None, "--step", "-s", help="Index of the step in the run to retrieve"
+    ),
+):
+    """Get an artifact from the most recent run for an account."""
+    _dbt_cloud_request(
+        ctx,
+        "get_most_recent_run_artifact",
+        account_id,
+        path,
+        job_definition_id=job_id,
+        environment_id=environment_id,
+        project_id=json.loads(project_id) if project_id else project_id,
+        deferring_run_id=deferring_run_id,
+        step=step,
+    )
+
+
+@legacy_app.command("get-run", hidden=True)
+def get_run_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    run_id: int = RUN_ID,
+    include_related: str = INCLUDE_RELATED,
+):
+    """This will soon be deprecated! Use `dbtc runs get` instead."""
+    return get_run(ctx, account_id, run_id, include_related)
+
+
+@app.command("get")
+def get_run(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    run_id: int = RUN_ID,
+    include_related: str = INCLUDE_RELATED,
+):
+    """Get run by ID for a specific account."""
+    _dbt_cloud_request(
+        ctx,
+        "get_run",
+        account_id,
+        run_id,
+        include_related=include_related,
+    )
+
+
+@legacy_app.command("get-run-artifact", hidden=True)
+def get_run_artifact_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    run_id: int = RUN_ID,
+    path: str = typer.Option(
+        ..., "--path", "-f", help="Name of artifact to retrieve (e.g. manifest.json)"
+    ),
+    step: int = typer.Option(
+        None, "--step", "-s", help="Index of the step in the run to retrieve"
+    ),
+):
+    """This will soon be deprecated! Use `dbtc runs get-artifact` instead."""
+    return get_run_artifact(ctx, account_id, run_id, path, step)
+
+
+@app.command("get-artifact")
+def get_run_artifact(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    run_id: int = RUN_ID,
+    path: str = typer.Option(
+        ..., "--path", "-f", help="Name of artifact to retrieve (e.g. manifest.json)"
+    ),
+    step: int = typer.Option(
+        None, "--step", "-s", help="Index of the step in the run to retrieve"
+    ),
+):
+    """Get a specific run artifact by path
+
+    Use this endpoint to fetch artifacts from a completed run.  Once a run has
+    completed, you can use this endpoint to download the `manifest.json`,
+    `run_results.json`, or `catalog.json` files from dbt Cloud.  These artifacts
+    contain information about the models in your dbt project, timing information
+    around their execution, and a status message indicating the result of the model
+    build
+
+    Note:  By default, this endpoint returns artifacts from the last step in the run.
+    To list artifacts from other steps in the run, use the `step` query parameter.
+    """
+    _dbt_cloud_request(
+        ctx,
+        "get_run_artifact",
+        account_id=account_id,
+        run_id=run_id,
+        path=path,
+        step=step,
+    )
+
+
+@legacy_app.command("get-run-timing-details", hidden=True)
+def get_run_timing_details_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    run_id: int = RUN_ID,
+):
+    """This will soon be deprecated! Use `dbtc runs get-timing-details` instead."""
+    return get_run_timing_details(ctx, account_id, project_id, run_id)
+
+
+@app.command("get-run-timing-details")
+def get_run_timing_details(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    project_id: int = PROJECT_ID,
+    run_id: int = RUN_ID,
+):
+    """Get run timing details for specific run."""
+    _dbt_cloud_request(
+        ctx,
+        "get_run_timing_details",
+        account_id,
+        project_id,
+        run_id,
+    )
+
+
+@legacy_app.command("list-run-artifacts", hidden=True)
+def list_run_artifacts_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    run_id: int = RUN_ID,
+    step: int = typer.Option(None, "--step", "-s"),
+):
+    """This will soon be deprecated! Use `dbtc runs list-artifacts` instead."""
+    return list_run_artifacts(ctx, account_id, run_id, step)
+
+
+@app.command("list-artifacts")
+def list_run_artifacts(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    run_id: int = RUN_ID,
+    step: int = typer.Option(None, "--step", "-s"),
+):
+    """List run artifacts
+
+    Use this endpoint to fetch a list of artifact fiels generated for a completed run.
+
+    !!! note
+        By default, this endpoint returns artifacts from the last step in the run.
+        To list artifacts from other steps in the run, use the `step` query parameter.
+    """
+    _dbt_cloud_request(ctx, "list_run_artifacts", account_id, run_id, step=step)
+
+
+@legacy_app.command("list-runs", hidden=True)
+def list_runs_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    include_related: str = INCLUDE_RELATED,
+    job_id: int = typer.Option(
+        None, "--job-id", "-j", help="Numeric ID of job to retrieve"
+    ),
+    environment_id: int = typer.Option(
+        None, "--environment-id", "-e", help="Numeric ID of environment to retrieve"
+    ),
+    project_id: str = typer.Option(
+        None, "--project-id", "-p", help="The project ID or IDs"
+    ),
+    deferring_run_id: int = typer.Option(
+        None, "--deferring-run-id", help="The deferring run ID"
+    ),
+    status: str = typer.Option(
+        None, "--status", help="Status to apply when listing runs"
+    ),
+    order_by: str = ORDER_BY,
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+):
+    """This will soon be deprecated! Use `dbtc runs list` instead."""
+    return list_runs(
+        ctx,
+        account_id,
+        include_related,
+        job_id,
+        environment_id,
+        project_id,
+        deferring_run_id,
+        status,
+        order_by,
+        offset,
+        limit,
+    )
+
+
+@app.command("list")
+def list_runs(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    include_related: str = INCLUDE_RELATED,
+    job_id: int = typer.Option(
+        None, "--job-id", "-j", help="Numeric ID of job to retrieve"
+    ),
+    environment_id: int = typer.Option(
+        None, "--environment-id", "-e", help="Numeric ID of environment to retrieve"
+    ),
+    project_id: str = typer.Option(
+        None, "--project-id", "-p", help="The project ID or IDs"
+    ),
+    deferring_run_id: int = typer.Option(
+        None, "--deferring-run-id", help="The deferring run ID"
+    ),
+    status: str = typer.Option(
+        None, "--status", help="Status to apply when listing runs"
+    ),
+    order_by: str = ORDER_BY,
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+):
+    """List of runs for a specific account."""
+    if status is not None:
+        try:
+            status = json.loads(status)
+        except ValueError:
+            pass
+    """List runs for a specific account."""
+    _dbt_cloud_request(
+        ctx,
+        "list_runs",
+        account_id,
+        include_related=include_related,
+        job_definition_id=job_id,
+        environment_id=environment_id,
+        project_id=json.loads(project_id) if project_id else project_id,
+        deferring_run_id=deferring_run_id,
+        order_by=order_by,
+        offset=offset,
+        limit=limit,
+        status=status,
+    )
@@ -0,0 +1,88 @@
+# stdlib
+import json
+
+# third party
+import typer
+
+# first party
+from dbtc.cli._common import (
+    ACCOUNT_ID,
+    PAYLOAD,
+    SERVICE_TOKEN_ID,
+    _dbt_cloud_request,
+)
+
+app = typer.Typer(name="service-tokens", help="Manage service tokens in dbt Cloud")
+
+# Hidden, deprecated aliases registered on the top-level command
+legacy_app = typer.Typer()
+
+
+@legacy_app.command("assign-service-token-permissions", hidden=True)
+def assign_service_token_permissions_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    service_token_id: int = SERVICE_TOKEN_ID,
+    payload: str = PAYLOAD,
+):
+    """
+    This will soon be deprecated! Use `dbtc service-tokens assign-permissions` instead.
+    """
+    return assign_service_token_permissions(ctx, account_id, service_token_id, payload)
+
+
+@app.command("assign-permissions")
+def assign_service_token_permissions(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    service_token_id: int = SERVICE_TOKEN_ID,
+    payload: str = PAYLOAD,
+):
+    """Assign permissions to a service token."""
+    _dbt_cloud_request(
+        ctx,
+        "assign_service_token_permissions",
+        account_id,
+        service_token_id,
+        json.loads(payload),
+    )
+
+
+@legacy_app.command("create-service-token", hidden=True)
+def create_service_token_old(
+    ctx: typer.Context, account_id: int = ACCOUNT_ID, payload: str = PAYLOAD
+):
+    """This will soon be deprecated! Use `dbtc service-tokens create` instead."""
+    return create_service_token(ctx, account_id, payload)
+
+
+@app.command("create")
+def create_service_token(
+    ctx: typer.Context, account_id: int = ACCOUNT_ID, payload: str = PAYLOAD
+):
+    """Create a service token."""
+    _dbt_cloud_request(ctx, "create_service_token", account_id, json.loads(payload))
+
+
+@legacy_app.command("list-service-tokens-permissions", hidden=True)
+def list_service_token_permissions_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    service_token_id: int = SERVICE_TOKEN_ID,
+):
+    """
+    This will soon be deprecated! Use `dbtc service-tokens list-permissions` instead.
+    """
+    return list_service_token_permissions(ctx, account_id, service_token_id)
+
+
+@app.command("list-permissions")
+def list_service_token_permissions(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    service_token_id: int = SERVICE_TOKEN_ID,
+):
+    """List service token permissions for a specific account."""
+    _dbt_cloud_request(
+        ctx, "list_service_token_permissions", account_id, service_token_id
+    )
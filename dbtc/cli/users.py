@@ -0,0 +1,116 @@
+# stdlib
+import json
+
+# third party
+import typer
+
+# first party
+from dbtc.cli._common import (
+    ACCOUNT_ID,
+    LIMIT,
+    OFFSET,
+    ORDER_BY,
+    PAYLOAD,
+    USER_ID,
+    _dbt_cloud_request,
+)
+
+app = typer.Typer(name="users", help="Manage users in dbt Cloud")
+
+# Hidden, deprecated aliases registered on the top-level command
+legacy_app = typer.Typer()
+
+
+@legacy_app.command("deactivate-user-license", hidden=True)
+def deactivate_user_license_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    permission_id: int = typer.Option(..., "--permission-id"),
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc users deactivate-license` instead."""
+    return deactivate_user_license(ctx, account_id, permission_id, payload)
+
+
+@app.command("deactivate")
+def deactivate_user_license(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    permission_id: int = typer.Option(..., "--permission-id"),
+    payload: str = PAYLOAD,
+):
+    """Deactive a user license."""
+    _dbt_cloud_request(
+        ctx, "deactivate_user_license", account_id, permission_id, json.loads(payload)
+    )
+
+
+@legacy_app.command("get-user", hidden=True)
+def get_user_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    user_id: int = USER_ID,
+):
+    """This will soon be deprecated! Use `dbtc users get` instead."""
+    return get_user(ctx, account_id, user_id)
+
+
+@app.command("get")
+def get_user(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    user_id: int = USER_ID,
+):
+    """Get a user."""
+    _dbt_cloud_request(
+        ctx,
+        "get_user",
+        account_id,
+        user_id,
+    )
+
+
+@legacy_app.command("list-invited-users", hidden=True)
+def list_invited_users_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+):
+    """This will soon be deprecated! Use `dbtc users list-invited` instead."""
+    return list_invited_users(ctx, account_id)
+
+
+@app.command("list-invited")
+def list_invited_users(ctx: typer.Context, account_id: int = ACCOUNT_ID):
+    """List invited users for a specific account."""
+    _dbt_cloud_request(ctx, "list_invited_users", account_id)
+
+
+@legacy_app.command("list-users", hidden=True)
+def list_users_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    order_by: str = ORDER_BY,
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+):
+    """This will soon be deprecated! Use `dbtc users list` instead."""
+    return list_users(ctx, account_id, order_by, offset, limit)
+
+
+@app.command("list")
+def list_users(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    order_by: str = ORDER_BY,
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+):
+    """List users for a specific account."""
+    _dbt_cloud_request(
+        ctx,
+        "list_users",
+        account_id,
+        order_by=order_by,
+        offset=offset,
+        limit=limit,
+    )
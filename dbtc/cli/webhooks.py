@@ -0,0 +1,157 @@
+# stdlib
+import json
+
+# third party
+import typer
+
+# first party
+from dbtc.cli._common import (
+    ACCOUNT_ID,
+    LIMIT,
+    OFFSET,
+    PAYLOAD,
+    WEBHOOK_ID,
+    _dbt_cloud_request,
+)
+
+app = typer.Typer(name="webhooks", help="Manage webhooks in dbt Cloud")
+
+# Hidden, deprecated aliases registered on the top-level command
+legacy_app = typer.Typer()
+
+
+@legacy_app.command("create-webhook", hidden=True)
+def create_webhook_old(
+    ctx: typer.Context, account_id: int = ACCOUNT_ID, payload: str = PAYLOAD
+):
+    """This will soon be deprecated! Use `dbtc webhooks create` instead."""
+    return create_webhook(ctx, account_id, payload)
+
+
+@app.command("create")
+def create_webhook(
+    ctx: typer.Context, account_id: int = ACCOUNT_ID, payload: str = PAYLOAD
+):
+    """Create a webhook."""
+    _dbt_cloud_request(ctx, "create_webhook", account_id, json.loads(payload))
+
+
+@legacy_app.command("delete-webhook", hidden=True)
+def delete_webhook_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    webhook_id: str = WEBHOOK_ID,
+):
+    """This will soon be deprecated! Use `dbtc webhooks delete` instead."""
+    return delete_webhook(ctx, account_id, webhook_id)
+
+
+@app.command("delete")
+def delete_webhook(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    webhook_id: str = WEBHOOK_ID,
+):
+    """Delete a webhook."""
+    _dbt_cloud_request(ctx, "delete_webhook", account_id, webhook_id)
+
+
+@legacy_app.command("get-webhook", hidden=True)
+def get_webhook_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    webhook_id: str = WEBHOOK_ID,
+):
+    """This will soon be deprecated! Use `dbtc webhooks get` instead."""
+    return get_webhook(ctx, account_id, webhook_id)
+
+
+@app.command("get")
+def get_webhook(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    webhook_id: str = WEBHOOK_ID,
+):
+    """Get a webhook by its ID"""
+    _dbt_cloud_request(ctx, "get_webhook", account_id=account_id, webhook_id=webhook_id)
+
+
+@legacy_app.command("list-webhooks", hidden=True)
+def list_webhooks_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+):
+    """This will soon be deprecated! Use `dbtc webhooks list` instead."""
+    return list_webhooks(ctx, account_id, offset, limit)
+
+
+@app.command("list")
+def list_webhooks(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    offset: int = OFFSET,
+    limit: int = LIMIT,
+):
+    """List webhooks for a specific account."""
+    _dbt_cloud_request(
+        ctx,
+        "list_webhooks",
+        account_id,
+        offset=offset,
+        limit=limit,
+    )
+
+
+@legacy_app.command("test-webhook", hidden=True)
+def test_webhook_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    webhook_id: str = WEBHOOK_ID,
+):
+    """This will soon be deprecated! Use `dbtc webhooks test` instead."""
+    return test_webhook(ctx, account_id, webhook_id)
+
+
+@app.command("test")
+def test_webhook(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    webhook_id: str = WEBHOOK_ID,
+):
+    """Test a webhook."""
+    _dbt_cloud_request(
+        ctx,
+        "test_webhook",
+        account_id,
+        webhook_id,
+    )
+
+
+@legacy_app.command("update-webhook", hidden=True)
+def update_webhook_old(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    webhook_id: str = WEBHOOK_ID,
+    payload: str = PAYLOAD,
+):
+    """This will soon be deprecated! Use `dbtc webhooks update` instead."""
+    return update_webhook(ctx, account_id, webhook_id, payload)
+
+
+@app.command("update")
+def update_webhook(
+    ctx: typer.Context,
+    account_id: int = ACCOUNT_ID,
+    webhook_id: str = WEBHOOK_ID,
+    payload: str = PAYLOAD,
+):
+    """Update a webhook."""
+    _dbt_cloud_request(
+        ctx,
+        "update_webhook",
+        account_id,
+        webhook_id,
+        json.loads(payload),
+    )
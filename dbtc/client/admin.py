@@ -1,5 +1,4 @@
 # stdlib
-import enum
 import json
 import time
 from datetime import datetime
@@ -12,18 +11,17 @@ import requests
 # first party
 from dbtc import models
 from dbtc.client.base import _Client
+from dbtc.client.dag import JobDAG
+from dbtc.client.runs import (
+    TERMINAL_STATUSES,
+    BackgroundRunPoller,
+    JobRunStatus,
+    RunFuture,
+)
+from dbtc.client.webhooks import WebhookReceiver
+from dbtc.instrumentation import endpoint_template
 from dbtc.utils import json_listify, listify
 
-
-class JobRunStatus(enum.IntEnum):
-    QUEUED = 1
-    STARTING = 2
-    RUNNING = 3
-    SUCCESS = 10
-    ERROR = 20
-    CANCELLED = 30
-
-
 PULL_REQUESTS = (
     "github_pull_request_id",
     "gitlab_merge_request_id",
@@ -46,10 +44,22 @@ v3 = partial(_version_decorator, version="v3")
 
 
 class _AdminClient(_Client):
+    _client_name = "cloud"
+
     def __init__(self, session, **kwargs):
         super().__init__(session, **kwargs)
+        self._run_poller = BackgroundRunPoller(self)
+        self.webhook_receiver: Optional[WebhookReceiver] = None
+
+    @property
+    def _path(self):
+        # The API version is set per call by the v2/v3 decorators, so keep it local
+        # to the calling thread for clients shared across threads
+        return getattr(self._local, "path", None)
 
-    _path = None
+    @_path.setter
+    def _path(self, path: str):
+        self._local.path = path
 
     @property
     def _header_property(self):
@@ -63,20 +73,29 @@ class _AdminClient(_Client):
     ) -> requests.Response:
         """Make request to API."""
 
-        # Model is not an argument that the request method accepts, needs to be removed
-        model = kwargs.pop("model", None)
-        if model is not None:
-            # This will validate the payload
-            kwargs["json"] = model(**kwargs["json"]).model_dump(exclude_unset=True)
+        with self._instrument(method, self._endpoint(path)) as event:
+            # Model is not an argument that the request method accepts, needs to be
+            # removed
+            model = kwargs.pop("model", None)
+            if model is not None:
+                # This will validate the payload
+                with event.timer("validation_time"):
+                    kwargs["json"] = model(**kwargs["json"]).model_dump(
+                        exclude_unset=True
+                    )
 
-        full_url = self.full_url(path)
-        response = self.session.request(method=method, url=full_url, **kwargs)
-        return response
+            full_url = self.full_url(path)
+            return self._send(method, full_url, **kwargs)
 
     def _simple_request(self, path: str, *, method: str = "get", **kwargs) -> Dict:
         """Return json from response."""
-        response = self._make_request(path, method=method, **kwargs)
-        return response.json()
+        with self._instrument(method, self._endpoint(path)) as event:
+            response = self._make_request(path, method=method, **kwargs)
+            with event.timer("decode_time"):
+                return response.json()
+
+    def _endpoint(self, path: str) -> str:
+        return f"{self._path}{endpoint_template(path)}"
 
     def _get_by_name(self, items: List, item_name: str, value: str = "name"):
         try:
@@ -2028,6 +2047,35 @@ class _AdminClient(_Client):
             params={"limit": limit, "offset": offset},
         )
 
+    def start_webhook_receiver(
+        self,
+        hmac_secret: str,
+        *,
+        host: str = "0.0.0.0",
+        port: int = 8080,
+        fallback_interval: int = 60,
+    ) -> WebhookReceiver:
+        """Start a local webhook receiver and use it to wait on runs
+
+        Once started, `trigger_job`, `trigger_job_async`, and `trigger_job_dag`
+        finish as soon as dbt Cloud delivers a `job.run.completed` or
+        `job.run.errored` event for the run, and only poll when no event has arrived
+        within `fallback_interval` seconds.  The webhook subscription itself should
+        point its `client_url` at this receiver.
+
+        Args:
+            hmac_secret (str): Secret returned when the webhook subscription was
+                created, used to verify each delivery
+            host (str, optional): Interface to listen on
+            port (int, optional): Port to listen on
+            fallback_interval (int, optional): Number of seconds to wait for an event
+                before polling the run instead
+        """
+        self.webhook_receiver = WebhookReceiver(
+            hmac_secret, host=host, port=port, fallback_interval=fallback_interval
+        ).start()
+        return self.webhook_receiver
+
     @v3
     def test_connection(self, account_id: int, payload: Dict) -> Dict:
         """Test a connection
@@ -2057,15 +2105,14 @@ class _AdminClient(_Client):
         run_id = run["data"]["id"]
         account_id = run["data"]["account_id"]
         while True:
-            time.sleep(poll_interval)
+            if self.webhook_receiver is None:
+                time.sleep(poll_interval)
+            else:
+                self.webhook_receiver.wait_for(lambda: [run_id])
             run = self.get_run(account_id, run_id)
             status = run["data"]["status"]
             self.console.log(self._run_status_formatted(run, time.time() - start))
-            if status in [
-                JobRunStatus.SUCCESS,
-                JobRunStatus.CANCELLED,
-                JobRunStatus.ERROR,
-            ]:
+            if status in TERMINAL_STATUSES:
                 break
         return run
 
@@ -2256,6 +2303,12 @@ class _AdminClient(_Client):
             f"accounts/{account_id}/jobs/{job_id}/rerun/",
             method="post",
         )
+        if not run["status"]["is_success"]:
+            self.console.log(
+                f"Rerun NOT triggered for job {job_id}.  See run response."
+            )
+            return run
+
         self.console.log(self._run_status_formatted(run, 0))
         if should_poll:
             run = self._poll_for_completion(run, poll_interval)
@@ -2309,10 +2362,92 @@ class _AdminClient(_Client):
                     f"Retrying job {job_id} after failure.  Retries left: {retries - 1}"
                 )
                 run = self.trigger_job_from_failure(account_id, job_id)
+                if not run["status"]["is_success"]:
+                    break
+
                 retries -= 1
 
         return run
 
+    def trigger_job_async(
+        self,
+        account_id: int,
+        job_id: int,
+        payload: Dict,
+        *,
+        poll_interval: int = 10,
+        retries: int = 0,
+    ) -> RunFuture:
+        """Trigger a job by its ID without waiting for the run to complete
+
+        Returns immediately with a `RunFuture`.  All outstanding futures are resolved
+        by a single background poller, so tracking many runs doesn't require a thread
+        per run.  Use `dbtc.client.runs.as_completed` or `dbtc.client.runs.wait_all`
+        to wait on several futures at once.
+
+        Args:
+            account_id (int): Numeric ID of the account to retrieve
+            job_id (int): Numeric ID of the job to trigger
+            payload (dict): Payload required for post request
+            poll_interval (int, optional): Number of seconds to wait in between
+                polling
+            retries (int, optional): Number of times to retry a failed job from the
+                point of failure
+
+        Returns:
+            RunFuture: Future whose `result()` is the final run.  If the run wasn't
+                triggered, the future is already resolved with the response.
+        """
+        future = RunFuture(account_id, job_id, retries=retries)
+        future.set_running_or_notify_cancel()
+        run = self.trigger_job(account_id, job_id, payload, should_poll=False)
+        if not run["status"]["is_success"]:
+            future.run = run
+            future.set_result(run)
+            return future
+
+        return self._run_poller.submit(future, run, poll_interval=poll_interval)
+
+    def trigger_job_dag(
+        self,
+        account_id: int,
+        dependencies: Dict[int, List[int]],
+        *,
+        payloads: Dict[int, Dict] = None,
+        retries: int = 0,
+        poll_interval: int = 10,
+    ) -> Dict[int, Optional[Dict]]:
+        """Trigger a set of dependent jobs, running independent branches in parallel
+
+        A job is triggered once all of its upstream jobs have succeeded.  Every
+        in-flight run is tracked by a single poller rather than polling each run on
+        its own.  When a job fails, its downstream jobs are skipped.
+
+        Args:
+            account_id (int): Numeric ID of the account
+            dependencies (dict): Mapping of job ID to the list of upstream job IDs
+                that must succeed before it's triggered, e.g.
+                `{staging_job: [ingest_job], marts_job: [staging_job]}`
+            payloads (dict, optional): Mapping of job ID to the payload used when
+                triggering that job
+            retries (int, optional): Number of times to retry a failed job from the
+                point of failure
+            poll_interval (int, optional): Number of seconds to wait in between
+                polling
+
+        Returns:
+            Dict[int, Optional[Dict]]: Mapping of job ID to its final run.  Skipped
+                jobs map to `None`.
+        """
+        return JobDAG(
+            self,
+            account_id,
+            dependencies,
+            payloads=payloads,
+            retries=retries,
+            poll_interval=poll_interval,
+        ).run()
+
     @v3
     def update_environment_variables(
         self, account_id: int, project_id: int, payload: Dict
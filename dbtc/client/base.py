@@ -1,13 +1,18 @@
 # stdlib
 import abc
 import os
-from typing import Optional
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 
 # third party
 import requests
 
 # first party
 from dbtc.console import err_console
+from dbtc.graphql import encode_payload, persisted_payload
+from dbtc.instrumentation import Instrument, RequestEvent
 
 
 class _Client(abc.ABC):
@@ -20,6 +25,8 @@ class _Client(abc.ABC):
         host: str = None,
         environment_id: int = None,
         use_beta_endpoint: bool = True,
+        instruments: List[Instrument] = None,
+        persisted_queries: bool = False,
     ):
         self.api_key: Optional[str] = api_key or os.getenv("DBT_CLOUD_API_KEY", None)
         self.service_token: Optional[str] = service_token or os.getenv(
@@ -35,9 +42,15 @@ class _Client(abc.ABC):
         self.console = err_console
         self.session = session
         self.session.headers = self.headers
+        self.instruments: List[Instrument] = list(instruments or [])
+        self.persisted_queries = persisted_queries
+        self._local = threading.local()
 
     DEFAULT_DOMAIN = "cloud.getdbt.com"
 
+    # Name used to identify requests from this client in instrumentation
+    _client_name = None
+
     @property
     @abc.abstractmethod
     def _path(self):
@@ -64,3 +77,87 @@ class _Client(abc.ABC):
             return f"{self._base_url}{path}"
 
         return self._base_url
+
+    def add_instrument(self, instrument: Instrument):
+        """Call `instrument` before and after every request made by this client"""
+        self.instruments.append(instrument)
+
+    @contextmanager
+    def _instrument(self, method: str, endpoint: str) -> Iterator[RequestEvent]:
+        """Time everything within the block as a single request
+
+        Nested blocks on the same thread share the outermost event, so a request
+        helper can be called on its own or from another instrumented method.
+        """
+        event = getattr(self._local, "event", None)
+        if event is not None:
+            yield event
+            return
+
+        event = RequestEvent(
+            client=self._client_name, method=method.upper(), endpoint=endpoint
+        )
+        for instrument in self.instruments:
+            instrument.before_request(event)
+        self._local.event = event
+        try:
+            yield event
+        except Exception as e:
+            event.error = repr(e)
+            raise
+        finally:
+            self._local.event = None
+            event.total_time = time.perf_counter() - event.started_at
+            for instrument in self.instruments:
+                instrument.after_request(event)
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, recording network details on the current event"""
+        payload = kwargs.get("json")
+        if isinstance(payload, dict) and isinstance(payload.get("query"), str):
+            # GraphQL queries are long and rarely change, so splice in the bytes
+            # they were serialized to the first time rather than encoding them again
+            kwargs["data"] = encode_payload(kwargs.pop("json"))
+        event = getattr(self._local, "event", None)
+        if event is None:
+            return self.session.request(method=method, url=url, **kwargs)
+
+        with event.timer("network_time"):
+            response = self.session.request(method=method, url=url, **kwargs)
+        event.status_code = response.status_code
+        event.request_bytes += len(response.request.body or b"")
+        if kwargs.get("stream"):
+            event.response_bytes += int(response.headers.get("Content-Length", 0))
+        else:
+            event.response_bytes += len(response.content)
+        retries = getattr(response.raw, "retries", None)
+        if retries is not None:
+            event.retries += len(retries.history)
+        return response
+
+    def _post_graphql(self, payload: Dict) -> requests.Response:
+        """POST a GraphQL payload
+
+        With `persisted_queries`, the query is sent as an automatic persisted query:
+        only its hash is sent, followed by the full query if the server doesn't
+        know it yet.  A server that doesn't support persisted queries turns them
+        off for this client.
+        """
+        if not self.persisted_queries:
+            return self._send("post", self.full_url(), json=payload)
+
+        response = self._send("post", self.full_url(), json=persisted_payload(payload))
+        content = response.content
+        if b"PersistedQueryNotSupported" in content:
+            self.persisted_queries = False
+            return self._send("post", self.full_url(), json=payload)
+
+        if (
+            b"PersistedQueryNotFound" in content
+            or b"PERSISTED_QUERY_NOT_FOUND" in content
+        ):
+            return self._send(
+                "post", self.full_url(), json=persisted_payload(payload, True)
+            )
+
+        return response
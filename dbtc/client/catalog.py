@@ -0,0 +1,592 @@
+# stdlib
+import bisect
+import hashlib
+import json
+import math
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# first party
+from dbtc.client.metadata import ACCESS_LEVELS, RESOURCE_TYPES, SEARCH_FIELD_TYPES
+
+_COLUMNS = "catalog { columns { name description } }"
+
+_APPLIED_QUERY = """
+query {operation}(
+  $environmentId: BigInt!, $first: Int, $after: String{filter_variable}
+) {{
+  environment(id: $environmentId) {{
+    applied {{
+      {field}(first: $first, after: $after{filter_argument}) {{
+        pageInfo {{
+          endCursor
+          hasNextPage
+        }}
+        edges {{
+          node {{
+            {fields}
+          }}
+        }}
+      }}
+    }}
+  }}
+}}
+"""
+
+
+def applied_query(
+    field: str, fields: str, filter_type: str = None, *, operation: str = "Catalog"
+) -> str:
+    """Paginated applied state query for one resource type
+
+    Args:
+        field (str): Field of `applied` to query, e.g. `models`
+        fields (str): Fields selected for each node
+        filter_type (str, optional): Type of the field's `filter` argument, added
+            as a `$filter` variable so resources can be fetched by unique id
+        operation (str, optional): Name of the operation
+    """
+    return _APPLIED_QUERY.format(
+        operation=operation,
+        field=field,
+        fields=fields,
+        filter_variable=f", $filter: {filter_type}" if filter_type else "",
+        filter_argument=", filter: $filter" if filter_type else "",
+    )
+
+
+_COMMON = "uniqueId name description resourceType tags filePath"
+
+# Paginated applied state query used to index each resource type
+CATALOG_QUERIES = {
+    "Model": applied_query(
+        "models",
+        f"{_COMMON} database schema alias access materializedType modelingLayer "
+        f"rawCode executionInfo {{ lastRunGeneratedAt }} {_COLUMNS}",
+        "ModelAppliedFilter",
+    ),
+    "Source": applied_query(
+        "sources", f"{_COMMON} database schema identifier sourceName {_COLUMNS}"
+    ),
+    "Seed": applied_query("seeds", f"{_COMMON} database schema alias {_COLUMNS}"),
+    "Snapshot": applied_query(
+        "snapshots", f"{_COMMON} database schema alias rawCode {_COLUMNS}"
+    ),
+    "Exposure": applied_query("exposures", _COMMON),
+}
+
+# Lightweight queries listing the run that last generated each resource, so
+# `refresh` only fetches resources generated by a newer run.  Resource types
+# without one are small enough to fetch in full.
+VERSION_QUERIES = {
+    "Model": applied_query("models", "uniqueId executionInfo { lastRunGeneratedAt }"),
+}
+
+LAST_UPDATED_QUERY = """
+query CatalogLastUpdated($environmentId: BigInt!) {
+  environment(id: $environmentId) {
+    applied {
+      lastUpdatedAt
+    }
+  }
+}
+"""
+
+
+def fetch_last_updated_at(client, environment_id: int) -> Optional[str]:
+    """When an environment's applied state was last updated
+
+    Args:
+        client (_MetadataClient): Metadata client used to make requests
+        environment_id (int): The environment id
+    """
+    response = client.query(LAST_UPDATED_QUERY, {"environmentId": environment_id})
+    environment = (response.get("data") or {}).get("environment") or {}
+    return (environment.get("applied") or {}).get("lastUpdatedAt")
+
+
+def _generated_at(node: Dict) -> Optional[str]:
+    return (node.get("executionInfo") or {}).get("lastRunGeneratedAt")
+
+
+def fetch_applied(
+    client,
+    query: str,
+    environment_id: int,
+    *,
+    variables: Dict = None,
+    first: int = 500,
+) -> List[Dict]:
+    """Every node returned by a paginated applied state query
+
+    Args:
+        client (_MetadataClient): Metadata client used to make requests
+        query (str): Query built with `applied_query`
+        environment_id (int): The environment id
+        variables (Dict, optional): Other variables for the query
+        first (int, optional): Number of resources retrieved per request
+    """
+    return [
+        edge["node"]
+        for edge in client.iter_query(
+            query,
+            {"environmentId": environment_id, "first": first, **(variables or {})},
+            paginated_request_to_list=True,
+        )
+    ]
+
+
+def fetch_changed(
+    client,
+    query: str,
+    version_query: str,
+    environment_id: int,
+    known: Dict[str, Optional[str]],
+    *,
+    first: int = 500,
+    max_workers: int = 5,
+) -> Tuple[Set[str], List[Dict]]:
+    """Fetch the resources generated by a newer run than the ones already known
+
+    `version_query` lists when each resource was last generated.  Resources that
+    are new, or whose `lastRunGeneratedAt` differs from the one in `known`, are
+    fetched with `query` by unique id, in concurrent chunks of `first`.  When more
+    than half of them changed, every resource is fetched instead.
+
+    Args:
+        client (_MetadataClient): Metadata client used to make requests
+        query (str): Query built with `applied_query` with a filter type
+        version_query (str): Query selecting each resource's `uniqueId` and
+            `executionInfo { lastRunGeneratedAt }`
+        environment_id (int): The environment id
+        known (Dict[str, Optional[str]]): `lastRunGeneratedAt` of each resource
+            already fetched, by unique id
+        first (int, optional): Number of resources retrieved per request
+        max_workers (int, optional): Max number of requests made at once
+
+    Returns:
+        Tuple[Set[str], List[Dict]]: Unique ids of every current resource, and
+            the resources that were fetched
+    """
+    versions = {
+        node["uniqueId"]: _generated_at(node)
+        for node in fetch_applied(client, version_query, environment_id, first=first)
+    }
+    changed = [
+        unique_id
+        for unique_id, version in versions.items()
+        if version is None or known.get(unique_id) != version
+    ]
+    if len(changed) > len(versions) / 2:
+        # Filtering by unique id only pays off when few resources changed
+        return set(versions), fetch_applied(client, query, environment_id, first=first)
+
+    chunks = [changed[start : start + first] for start in range(0, len(changed), first)]
+
+    def fetch(chunk: List[str]) -> List[Dict]:
+        return fetch_applied(
+            client,
+            query,
+            environment_id,
+            variables={"filter": {"uniqueIds": chunk}},
+            first=first,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        nodes = [node for nodes in executor.map(fetch, chunks) for node in nodes]
+    return set(versions), nodes
+
+
+# Matches in a resource's name count for more than matches in its code
+FIELD_WEIGHTS = {
+    "name": 5.0,
+    "relation": 3.0,
+    "column": 2.0,
+    "description": 1.5,
+    "code": 0.5,
+}
+
+_WORD = re.compile(r"[a-z0-9]+(?:_[a-z0-9]+)*")
+
+
+def _tokenize(text: Optional[str]) -> List[str]:
+    """Lowercased words, plus each part of words joined by underscores"""
+    tokens: List[str] = []
+    for word in _WORD.findall((text or "").lower()):
+        tokens.append(word)
+        if "_" in word:
+            tokens.extend(word.split("_"))
+    return tokens
+
+
+def _fields(node: Dict) -> Dict[str, str]:
+    columns = ((node.get("catalog") or {}).get("columns")) or []
+    relation = ".".join(
+        part
+        for part in (
+            node.get("database"),
+            node.get("schema"),
+            node.get("alias") or node.get("identifier"),
+        )
+        if part
+    )
+    return {
+        "name": node.get("name") or "",
+        "description": node.get("description") or "",
+        "column": " ".join(
+            f"{column.get('name') or ''} {column.get('description') or ''}"
+            for column in columns
+        ),
+        "code": node.get("rawCode") or "",
+        "relation": relation,
+    }
+
+
+def _hit(node: Dict) -> Dict:
+    return {
+        key: value
+        for key, value in node.items()
+        if key
+        not in ("catalog", "rawCode", "database", "schema", "alias", "executionInfo")
+    }
+
+
+class CatalogIndex:
+    """In-process full-text index of an environment's applied state
+
+    The index is built from paginated applied state queries for each resource type
+    and answers `search`-style queries, with the same filters, without making any
+    requests.  Matches are ranked by how rare each word is across the index and by
+    the field it's found in, with matches in a resource's name ranked highest.  The
+    last word of a query also matches as a prefix, so partially typed words find
+    results.  `refresh` does nothing until the environment's applied state has
+    changed, then only fetches models generated by a newer run, along with the
+    smaller resource types, and only re-indexes resources that changed.
+
+    Args:
+        client (_MetadataClient): Metadata client used to make requests
+        environment_id (int): The environment id
+        resource_types (List[str], optional): Resource types to index.  Defaults to
+            every type in `CATALOG_QUERIES`.
+        first (int, optional): Number of resources retrieved per request
+        max_workers (int, optional): Max number of resource types fetched at once
+    """
+
+    def __init__(
+        self,
+        client,
+        environment_id: int,
+        *,
+        resource_types: List[str] = None,
+        first: int = 500,
+        max_workers: int = 5,
+    ):
+        resource_types = resource_types or list(CATALOG_QUERIES)
+        unsupported = [t for t in resource_types if t not in CATALOG_QUERIES]
+        if unsupported:
+            raise ValueError(
+                f"resource_types must be one of {', '.join(CATALOG_QUERIES)}"
+            )
+
+        self._client = client
+        self.environment_id = environment_id
+        self.resource_types = resource_types
+        self.first = first
+        self.max_workers = max_workers
+        self.last_updated_at: Optional[str] = None
+        self.documents: Dict[str, Dict] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._postings: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self._document_tokens: Dict[str, Set[str]] = {}
+        self._sorted_tokens: Optional[List[str]] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __contains__(self, unique_id: str) -> bool:
+        return unique_id in self.documents
+
+    def _fetch(self, resource_type: str) -> List[Dict]:
+        return fetch_applied(
+            self._client,
+            CATALOG_QUERIES[resource_type],
+            self.environment_id,
+            first=self.first,
+        )
+
+    def build(self) -> "CatalogIndex":
+        """Fetch every resource and index it, replacing anything already indexed
+
+        Returns:
+            CatalogIndex: The index, so calls can be chained
+        """
+        last_updated_at = fetch_last_updated_at(self._client, self.environment_id)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            nodes = [
+                node
+                for resources in executor.map(self._fetch, self.resource_types)
+                for node in resources
+            ]
+        self.update(nodes, replace=True)
+        self.last_updated_at = last_updated_at
+        return self
+
+    def _changes(self, resource_type: str) -> Tuple[Set[str], List[Dict]]:
+        """Unique ids of a resource type's current resources, and those to index"""
+        if resource_type not in VERSION_QUERIES:
+            nodes = self._fetch(resource_type)
+            return {node["uniqueId"] for node in nodes}, nodes
+
+        with self._lock:
+            known = {
+                unique_id: _generated_at(node)
+                for unique_id, node in self.documents.items()
+            }
+        return fetch_changed(
+            self._client,
+            CATALOG_QUERIES[resource_type],
+            VERSION_QUERIES[resource_type],
+            self.environment_id,
+            known,
+            first=self.first,
+            max_workers=self.max_workers,
+        )
+
+    def refresh(self, *, force: bool = False) -> bool:
+        """Bring the index up to date with the environment's applied state
+
+        Nothing is fetched unless the applied state has been updated since the
+        index was built or last refreshed.  Models are then listed with when each
+        was last generated, and only those that are new or were generated by a
+        newer run are fetched again; other resource types are fetched in full.
+        Only resources that changed are re-indexed, and resources no longer in
+        the environment are removed.
+
+        Args:
+            force (bool, optional): Check for changes even if the environment's
+                applied state hasn't been updated.  Defaults to False.
+
+        Returns:
+            bool: Whether the environment was checked for changes
+        """
+        if self.last_updated_at is None and not self.documents:
+            self.build()
+            return True
+
+        last_updated_at = fetch_last_updated_at(self._client, self.environment_id)
+        if (
+            not force
+            and last_updated_at is not None
+            and last_updated_at == self.last_updated_at
+        ):
+            return False
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            changes = list(executor.map(self._changes, self.resource_types))
+        with self._lock:
+            for resource_type, (current, nodes) in zip(self.resource_types, changes):
+                self.update(nodes)
+                # dbt unique ids start with the resource type, e.g. `model.`
+                prefix = f"{resource_type.lower()}."
+                for unique_id in [
+                    u
+                    for u in self.documents
+                    if u.startswith(prefix) and u not in current
+                ]:
+                    self.remove(unique_id)
+            self.last_updated_at = last_updated_at
+        return True
+
+    def update(self, nodes: Iterable[Dict], *, replace: bool = False):
+        """Index applied state nodes, skipping any that haven't changed
+
+        Args:
+            nodes (Iterable[Dict]): Nodes shaped like those in `CATALOG_QUERIES`
+            replace (bool, optional): Remove indexed resources not in `nodes`.
+                Defaults to False.
+        """
+        with self._lock:
+            seen = set()
+            for node in nodes:
+                unique_id = node["uniqueId"]
+                seen.add(unique_id)
+                fingerprint = hashlib.sha1(
+                    json.dumps(node, sort_keys=True, default=str).encode()
+                ).hexdigest()
+                if self._fingerprints.get(unique_id) == fingerprint:
+                    continue
+
+                self.remove(unique_id)
+                self._add(unique_id, node)
+                self._fingerprints[unique_id] = fingerprint
+            if replace:
+                for unique_id in [u for u in self.documents if u not in seen]:
+                    self.remove(unique_id)
+
+    def _add(self, unique_id: str, node: Dict):
+        tokens = set()
+        for field, text in _fields(node).items():
+            for token in _tokenize(text):
+                fields = self._postings.setdefault(token, {}).setdefault(unique_id, {})
+                fields[field] = fields.get(field, 0) + 1
+                tokens.add(token)
+        self.documents[unique_id] = node
+        self._document_tokens[unique_id] = tokens
+        self._sorted_tokens = None
+
+    def remove(self, unique_id: str):
+        """Remove a resource from the index, if it's there"""
+        with self._lock:
+            for token in self._document_tokens.pop(unique_id, ()):
+                postings = self._postings[token]
+                postings.pop(unique_id, None)
+                if not postings:
+                    del self._postings[token]
+            self.documents.pop(unique_id, None)
+            self._fingerprints.pop(unique_id, None)
+            self._sorted_tokens = None
+
+    def _matching_tokens(self, word: str, prefix: bool) -> List[str]:
+        if not prefix:
+            return [word] if word in self._postings else []
+
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._postings)
+        start = bisect.bisect_left(self._sorted_tokens, word)
+        end = bisect.bisect_left(self._sorted_tokens, word + "\uffff")
+        return self._sorted_tokens[start:end]
+
+    def _matches_filters(self, node: Dict, filters: Dict[str, Optional[str]]) -> bool:
+        for key, value in filters.items():
+            if value is None:
+                continue
+
+            if key == "tags":
+                if value.lower() not in [t.lower() for t in node.get("tags") or []]:
+                    return False
+            elif str(node.get(key) or "").lower() != value.lower():
+                return False
+        return True
+
+    def search(
+        self,
+        search_query: str,
+        *,
+        first: int = 500,
+        access_level: str = None,
+        search_fields: List[str] = SEARCH_FIELD_TYPES,
+        materialization_type: str = None,
+        modeling_layer: str = None,
+        resource_type: str = None,
+        tags: str = None,
+    ) -> List[Dict]:
+        """Search the index, accepting the same filters as `_MetadataClient.search`
+
+        Every word in `search_query` must be found in one of `search_fields`.
+
+        Args:
+            search_query (str): The search query to filter by.
+            first (int, optional): The max number of search results to return.
+                Defaults to 500.
+            access_level (str, optional): The access level to filter by.
+                Defaults to None.
+            search_fields (List[str], optional): The fields to search by. Defaults to
+                ["code", "column", "description", "name", "relation"].
+            materialization_type (str, optional): The materialization type to filter
+                by.  Defaults to None.
+            modeling_layer (str, optional): The modeling layer to filter by.
+                Defaults to None.
+            resource_type (str, optional): The resource type to filter by.
+                Defaults to None.
+            tags (str, optional): The tag to filter by.  Defaults to None.
+
+        Returns:
+            List[Dict]: Matches ordered by score, each with the matched resource as
+                `hit`, the field that contributed most to its score as
+                `matchedField`, and its `score`
+        """
+        if access_level and access_level not in ACCESS_LEVELS:
+            raise ValueError(f"access_level must be one of {ACCESS_LEVELS}")
+
+        if resource_type and resource_type not in RESOURCE_TYPES:
+            raise ValueError(f"resource_type must be one of {RESOURCE_TYPES}")
+
+        if any([f not in SEARCH_FIELD_TYPES for f in search_fields]):
+            raise ValueError(
+                f"search_fields must be one of {', '.join(SEARCH_FIELD_TYPES)}"
+            )
+
+        words = _WORD.findall(search_query.lower())
+        if not words:
+            return []
+
+        filters = {
+            "access": access_level,
+            "materializedType": materialization_type,
+            "modelingLayer": modeling_layer,
+            "resourceType": resource_type,
+            "tags": tags,
+        }
+        with self._lock:
+            total = len(self.documents)
+            scores: Optional[Dict[str, Dict[str, float]]] = None
+            for position, word in enumerate(words):
+                word_scores: Dict[str, Dict[str, float]] = {}
+                prefix = position == len(words) - 1
+                for token in self._matching_tokens(word, prefix):
+                    postings = self._postings[token]
+                    idf = math.log(
+                        1 + (total - len(postings) + 0.5) / (len(postings) + 0.5)
+                    )
+                    # Partial words count for less than complete ones
+                    weight = idf if token == word else idf * 0.5
+                    for unique_id, fields in postings.items():
+                        # Only resources matching every earlier word can match
+                        if scores is not None and unique_id not in scores:
+                            continue
+
+                        for field, count in fields.items():
+                            if field not in search_fields:
+                                continue
+
+                            by_field = word_scores.setdefault(unique_id, {})
+                            by_field[field] = by_field.get(field, 0.0) + (
+                                weight * FIELD_WEIGHTS[field] * count / (count + 1)
+                            )
+                if scores is None:
+                    scores = word_scores
+                else:
+                    scores = {
+                        unique_id: {
+                            field: by_field.get(field, 0.0)
+                            + word_scores[unique_id].get(field, 0.0)
+                            for field in {*by_field, *word_scores[unique_id]}
+                        }
+                        for unique_id, by_field in scores.items()
+                        if unique_id in word_scores
+                    }
+
+            ranked: List[Tuple[float, str, str]] = []
+            for unique_id, by_field in (scores or {}).items():
+                node = self.documents[unique_id]
+                if not self._matches_filters(node, filters):
+                    continue
+
+                score = sum(by_field.values())
+                if (node.get("name") or "").lower() == search_query.strip().lower():
+                    score *= 2
+                matched_field = max(by_field, key=by_field.__getitem__)
+                ranked.append((score, unique_id, matched_field))
+
+            ranked.sort(key=lambda match: (-match[0], match[1]))
+            return [
+                {
+                    "hit": _hit(self.documents[unique_id]),
+                    "matchedField": matched_field,
+                    "score": score,
+                }
+                for score, unique_id, matched_field in ranked[:first]
+            ]
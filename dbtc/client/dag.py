@@ -0,0 +1,164 @@
+# stdlib
+from typing import Dict, List, Optional
+
+# first party
+from dbtc.client.runs import JobRunStatus, RunPoller
+
+
+class JobDAG:
+    """Execute dbt Cloud jobs in dependency order.
+
+    Each job is triggered as soon as all of its upstream jobs have completed
+    successfully, so independent branches run concurrently.  All in-flight runs are
+    tracked by a single `RunPoller`.  A failed run is retried from the point of
+    failure up to `retries` times; when a job ultimately fails, everything downstream
+    of it is skipped while unrelated branches keep running.
+
+    Args:
+        client (_AdminClient): Admin client used to make requests
+        account_id (int): Numeric ID of the account
+        dependencies (dict): Mapping of job ID to the list of job IDs that must
+            succeed before it is triggered.  Jobs only referenced as upstream
+            dependencies are included as well.
+        payloads (dict, optional): Mapping of job ID to the payload used when
+            triggering that job.  Jobs not included use `{"cause": ...}`.
+        retries (int, optional): Number of times to retry a failed job from the
+            point of failure
+        poll_interval (int, optional): Number of seconds to wait in between
+            polling
+    """
+
+    DEFAULT_CAUSE = "Triggered by dbtc job DAG"
+
+    def __init__(
+        self,
+        client,
+        account_id: int,
+        dependencies: Dict[int, List[int]],
+        *,
+        payloads: Dict[int, Dict] = None,
+        retries: int = 0,
+        poll_interval: int = 10,
+    ):
+        self._client = client
+        self.account_id = account_id
+        self.payloads = payloads or {}
+        self.retries = retries
+        self.poller = RunPoller(client, poll_interval=poll_interval)
+        self.upstream: Dict[int, List[int]] = {}
+        self.downstream: Dict[int, List[int]] = {}
+        for job_id, parents in dependencies.items():
+            self.upstream.setdefault(job_id, [])
+            self.downstream.setdefault(job_id, [])
+            for parent in parents:
+                self.upstream[job_id].append(parent)
+                self.upstream.setdefault(parent, [])
+                self.downstream.setdefault(parent, []).append(job_id)
+        self._check_acyclic()
+
+    def _check_acyclic(self):
+        remaining = {job_id: len(parents) for job_id, parents in self.upstream.items()}
+        queue = [job_id for job_id, count in remaining.items() if count == 0]
+        visited = 0
+        while queue:
+            job_id = queue.pop()
+            visited += 1
+            for child in self.downstream[job_id]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    queue.append(child)
+
+        if visited != len(self.upstream):
+            cycle = sorted(job_id for job_id, count in remaining.items() if count)
+            raise ValueError(f"Job dependencies contain a cycle between jobs {cycle}")
+
+    def _trigger(self, job_id: int) -> Optional[Dict]:
+        payload = self.payloads.get(job_id, {"cause": self.DEFAULT_CAUSE})
+        run = self._client.trigger_job(
+            self.account_id, job_id, payload, should_poll=False
+        )
+        if not run["status"]["is_success"]:
+            return None
+
+        self.poller.add(run)
+        return run
+
+    def _skip_downstream(self, job_id: int, skipped: set):
+        for child in self.downstream[job_id]:
+            if child not in skipped:
+                skipped.add(child)
+                self._skip_downstream(child, skipped)
+
+    def run(self) -> Dict[int, Optional[Dict]]:
+        """Trigger every job in the DAG and wait for all of them to finish.
+
+        Returns:
+            Dict[int, Optional[Dict]]: Mapping of job ID to the final run for that
+                job.  Jobs that were skipped because an upstream job failed (or that
+                could not be triggered) map to `None`.
+        """
+        results: Dict[int, Optional[Dict]] = {job_id: None for job_id in self.upstream}
+        waiting = {job_id: set(parents) for job_id, parents in self.upstream.items()}
+        retries_left = {job_id: self.retries for job_id in self.upstream}
+        job_for_run: Dict[int, int] = {}
+        skipped: set = set()
+
+        def start(job_ids: List[int]):
+            for job_id in job_ids:
+                del waiting[job_id]
+                run = self._trigger(job_id)
+                if run is None:
+                    self._client.console.log(
+                        f"Run NOT triggered for job {job_id}.  Skipping downstream "
+                        "jobs."
+                    )
+                    self._skip_downstream(job_id, skipped)
+                    continue
+
+                job_for_run[run["data"]["id"]] = job_id
+
+        start([job_id for job_id, parents in waiting.items() if not parents])
+        while len(self.poller):
+            self.poller.wait()
+            ready = []
+            for run in self.poller.poll():
+                job_id = job_for_run.pop(run["data"]["id"])
+                results[job_id] = run
+                status = run["data"]["status"]
+                if status == JobRunStatus.SUCCESS:
+                    for child in self.downstream[job_id]:
+                        waiting[child].discard(job_id)
+                        if not waiting[child] and child not in skipped:
+                            ready.append(child)
+                    continue
+
+                if status == JobRunStatus.ERROR and retries_left[job_id] > 0:
+                    retries_left[job_id] -= 1
+                    self._client.console.log(
+                        f"Retrying job {job_id} after failure.  Retries left: "
+                        f"{retries_left[job_id]}"
+                    )
+                    rerun = self._client.trigger_job_from_failure(
+                        self.account_id, job_id, should_poll=False
+                    )
+                    if rerun["status"]["is_success"] and rerun.get("data"):
+                        self.poller.add(rerun)
+                        job_for_run[rerun["data"]["id"]] = job_id
+                        continue
+
+                    # The failed run stays as the job's result
+                    self._client.console.log(
+                        f"Retry NOT triggered for job {job_id}.  Skipping downstream "
+                        "jobs."
+                    )
+                    self._skip_downstream(job_id, skipped)
+                    continue
+
+                self._client.console.log(
+                    f"Job {job_id} did not succeed.  Skipping downstream jobs."
+                )
+                self._skip_downstream(job_id, skipped)
+
+            start(ready)
+
+        return results
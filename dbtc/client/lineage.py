@@ -0,0 +1,211 @@
+# stdlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class ColumnLineageGraph:
+    """Column-level lineage for many nodes, indexed for local traversal
+
+    Lineage is fetched with `column_lineage` for each node once, batching and
+    running requests concurrently, and merged into a single graph of columns keyed
+    by their unique id (e.g. `model.tpch.dim_customers.customer_id`).  Upstream,
+    downstream, and impact queries are answered from the graph without further
+    requests, and their results are memoized until the graph changes.  Refreshing a
+    node only rebuilds the graph when its lineage comes from a new run.
+
+    Args:
+        client (_MetadataClient): Metadata client used to make requests
+        environment_id (int): The environment id
+        max_depth (int, optional): The max depth to traverse each node's lineage
+        batch_size (int, optional): Max number of nodes fetched in one request
+        max_workers (int, optional): Max number of requests made at once
+    """
+
+    def __init__(
+        self,
+        client,
+        environment_id: int,
+        *,
+        max_depth: int = None,
+        batch_size: int = 40,
+        max_workers: int = 8,
+    ):
+        self._client = client
+        self.environment_id = environment_id
+        self.max_depth = max_depth
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.columns: Dict[str, Dict] = {}
+        self.parents: Dict[str, Set[str]] = {}
+        self.children: Dict[str, Set[str]] = {}
+        self.node_columns: Dict[str, Set[str]] = {}
+        self.errors: Dict[str, List] = {}
+        self._lineage: Dict[str, Tuple[Optional[int], List[Dict]]] = {}
+        self._memo: Dict[Tuple[str, str, Optional[int]], frozenset] = {}
+        self._lock = threading.RLock()
+
+    def __contains__(self, column: str) -> bool:
+        return column in self.columns
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    @property
+    def nodes(self) -> List[str]:
+        """Unique ids of the nodes whose lineage has been fetched"""
+        return list(self._lineage)
+
+    def run_id(self, node_unique_id: str) -> Optional[int]:
+        """Most recent run the node's lineage was fetched from"""
+        return self._lineage.get(node_unique_id, (None, []))[0]
+
+    def _fetch_chunk(self, node_unique_ids: List[str]) -> Dict[str, Dict]:
+        return self._client.column_lineage(
+            self.environment_id,
+            node_unique_ids,
+            max_depth=self.max_depth,
+            batch_size=self.batch_size,
+        )
+
+    def fetch(
+        self, node_unique_ids: Iterable[str], *, refresh: bool = False
+    ) -> "ColumnLineageGraph":
+        """Add the lineage of each node to the graph
+
+        Nodes already in the graph, or repeated in `node_unique_ids`, are only
+        fetched once.  Nodes whose response contains errors are recorded in
+        `errors` and left out, so fetching them again retries them.
+
+        Args:
+            node_unique_ids (Iterable[str]): Unique ids of the nodes
+            refresh (bool, optional): Fetch nodes already in the graph again,
+                replacing their lineage if it comes from a different run
+
+        Returns:
+            ColumnLineageGraph: The graph, so calls can be chained
+        """
+        pending = [
+            node
+            for node in dict.fromkeys(node_unique_ids)
+            if refresh or node not in self._lineage
+        ]
+        if not pending:
+            return self
+
+        chunks = [
+            pending[start : start + self.batch_size]
+            for start in range(0, len(pending), self.batch_size)
+        ]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self._fetch_chunk, chunks))
+
+        changed = False
+        with self._lock:
+            for responses in results:
+                for node, response in responses.items():
+                    if response.get("errors"):
+                        self.errors[node] = response["errors"]
+                        continue
+
+                    self.errors.pop(node, None)
+                    records = ((response.get("data") or {}).get("column") or {}).get(
+                        "lineage"
+                    ) or []
+                    run_ids = [
+                        r["runId"] for r in records if r.get("runId") is not None
+                    ]
+                    run_id = max(run_ids) if run_ids else None
+                    if node in self._lineage and self._lineage[node][0] == run_id:
+                        continue
+
+                    self._lineage[node] = (run_id, records)
+                    changed = True
+            if changed:
+                self._rebuild()
+        return self
+
+    def _rebuild(self):
+        self.columns, self.parents, self.children, self.node_columns = {}, {}, {}, {}
+        self._memo = {}
+        for _, records in self._lineage.values():
+            for record in records:
+                column = record["uniqueId"]
+                self.columns.setdefault(column, record)
+                self.node_columns.setdefault(record["nodeUniqueId"], set()).add(column)
+                parents = self.parents.setdefault(column, set())
+                children = self.children.setdefault(column, set())
+                for parent in record.get("parentColumns") or []:
+                    parents.add(parent)
+                    self.children.setdefault(parent, set()).add(column)
+                    self.parents.setdefault(parent, set())
+                for child in record.get("childColumns") or []:
+                    children.add(child)
+                    self.parents.setdefault(child, set()).add(column)
+                    self.children.setdefault(child, set())
+
+    def _traverse(self, column: str, direction: str, depth: Optional[int]) -> frozenset:
+        key = (direction, column, depth)
+        with self._lock:
+            if key in self._memo:
+                return self._memo[key]
+
+            edges = self.parents if direction == "upstream" else self.children
+            seen: Set[str] = set()
+            frontier = {column}
+            level = 0
+            while frontier and (depth is None or level < depth):
+                level += 1
+                frontier = {
+                    neighbour
+                    for current in frontier
+                    for neighbour in edges.get(current, ())
+                    if neighbour not in seen and neighbour != column
+                }
+                seen.update(frontier)
+            self._memo[key] = frozenset(seen)
+            return self._memo[key]
+
+    def upstream(self, column: str, *, depth: int = None) -> Set[str]:
+        """Columns that `column` is derived from
+
+        Args:
+            column (str): Unique id of the column
+            depth (int, optional): Number of hops to follow.  Defaults to all.
+        """
+        return set(self._traverse(column, "upstream", depth))
+
+    def downstream(self, column: str, *, depth: int = None) -> Set[str]:
+        """Columns derived from `column`
+
+        Args:
+            column (str): Unique id of the column
+            depth (int, optional): Number of hops to follow.  Defaults to all.
+        """
+        return set(self._traverse(column, "downstream", depth))
+
+    def impact(self, unique_id: str, *, depth: int = None) -> Dict[str, Set[str]]:
+        """Columns affected by a change to a column, or to every column of a node
+
+        Args:
+            unique_id (str): Unique id of a column or of a node in the graph
+            depth (int, optional): Number of hops to follow.  Defaults to all.
+
+        Returns:
+            Dict[str, Set[str]]: Mapping of the unique id of each affected node to
+                the names of its affected columns
+        """
+        columns = self.node_columns.get(unique_id, {unique_id})
+        affected: Dict[str, Set[str]] = {}
+        for column in columns:
+            for downstream in self._traverse(column, "downstream", depth):
+                if downstream in columns:
+                    continue
+
+                record = self.columns.get(downstream)
+                if record is None:
+                    node, _, name = downstream.rpartition(".")
+                else:
+                    node, name = record["nodeUniqueId"], record["name"]
+                affected.setdefault(node, set()).add(name)
+        return affected
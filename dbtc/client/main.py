@@ -4,9 +4,12 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 # first party
+from dbtc.cache import ResponseCache, latest_run_version
 from dbtc.client.admin import _AdminClient
 from dbtc.client.metadata import _MetadataClient
 from dbtc.client.semantic_layer import _SemanticLayerClient
+from dbtc.instrumentation import Instrument
+from dbtc.schema import MetadataSchema
 
 
 class dbtCloudClient:
@@ -25,3 +28,72 @@ class dbtCloudClient:
         self.cloud = _AdminClient(session, **kwargs)
         self.metadata = _MetadataClient(session, **kwargs)
         self.sl = _SemanticLayerClient(session, **kwargs)
+
+    def add_instrument(self, instrument: Instrument):
+        """Call `instrument` before and after every request made by any client
+
+        Args:
+            instrument (Instrument): Hooks to call, e.g. a `HistogramCollector`
+        """
+        for client in (self.cloud, self.metadata, self.sl):
+            client.add_instrument(instrument)
+
+    def enable_metadata_cache(
+        self,
+        maxsize: int = 256,
+        *,
+        ttl: float = None,
+        directory: str = None,
+        account_id: int = None,
+        unversioned_ttl: float = 300,
+    ) -> ResponseCache:
+        """Cache responses from the Discovery API
+
+        Discovery API data only changes when a run completes, so with an
+        `account_id` each environment's responses are kept until a newer run has
+        completed in it.  Responses that can't be tied to a run, because there's no
+        `account_id` or the query has no `environmentId` variable (e.g.
+        account-level queries), expire after `unversioned_ttl` seconds.  Every
+        response also expires once it's `ttl` seconds old.
+
+        Args:
+            maxsize (int, optional): Max number of responses kept in memory
+            ttl (float, optional): Max age of a response in seconds.  Defaults to no
+                limit.
+            directory (str, optional): Directory to also store responses in, so they
+                can be reused by other processes
+            account_id (int, optional): Numeric ID of the account, used to look up
+                the latest completed run in each environment
+            unversioned_ttl (float, optional): Max age in seconds of a response that
+                can't be tied to a run.  Defaults to 5 minutes.
+
+        Returns:
+            ResponseCache: The cache, e.g. to `invalidate` it or check its `hits`
+        """
+        version = None
+        if account_id is not None:
+            version = latest_run_version(self.cloud, account_id)
+        self.metadata.cache = ResponseCache(
+            maxsize,
+            ttl=ttl,
+            directory=directory,
+            version=version,
+            unversioned_ttl=unversioned_ttl,
+        )
+        return self.metadata.cache
+
+    def enable_metadata_validation(
+        self, *, directory: str = None, ttl: float = 86_400
+    ) -> MetadataSchema:
+        """Validate Discovery API queries against its schema before sending them
+
+        Args:
+            directory (str, optional): Directory the introspected schema is cached
+                in, so other processes don't introspect it again
+            ttl (float, optional): Max age of the cached schema in seconds.
+                Defaults to a day.
+
+        Returns:
+            MetadataSchema: The schema queries are validated against
+        """
+        return self.metadata.enable_validation(directory=directory, ttl=ttl)
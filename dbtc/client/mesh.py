@@ -0,0 +1,282 @@
+# stdlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+
+def _topological_order(children: List[Set[int]]) -> List[int]:
+    """Indices ordered so each comes before its children"""
+    parent_counts = [0] * len(children)
+    for edges in children:
+        for child in edges:
+            parent_counts[child] += 1
+
+    ready = deque(i for i, count in enumerate(parent_counts) if count == 0)
+    order = []
+    while ready:
+        current = ready.popleft()
+        order.append(current)
+        for child in sorted(children[current]):
+            parent_counts[child] -= 1
+            if parent_counts[child] == 0:
+                ready.append(child)
+    if len(order) != len(children):
+        raise ValueError("The mesh contains a cycle")
+
+    return order
+
+
+class MeshGraph:
+    """Dependencies between the projects and public models of a dbt Mesh
+
+    Projects are fetched with `mesh_projects` and public models with
+    `public_models`, concurrently, and indexed into adjacency lists of integers:
+    each project points to the projects that depend on it, and each public model
+    to the public models built on it.  Impact and ordering queries are answered
+    from the index without further requests, and traversals are memoized until
+    the graph is built again.
+
+    Args:
+        client (_MetadataClient): Metadata client used to make requests
+        account_id (int): The account id
+        first (int, optional): Number of public models retrieved per request
+    """
+
+    def __init__(self, client, account_id: int, *, first: int = 500):
+        self._client = client
+        self.account_id = account_id
+        self.first = first
+        self.projects: Dict[int, Dict] = {}
+        self.models: Dict[str, Dict] = {}
+        self.errors: List[Dict] = []
+        self._project_ids: List[int] = []
+        self._project_index: Dict[int, int] = {}
+        self._project_children: List[Set[int]] = []
+        self._project_parents: List[Set[int]] = []
+        self._model_ids: List[str] = []
+        self._model_index: Dict[str, int] = {}
+        self._model_children: List[Set[int]] = []
+        self._model_parents: List[Set[int]] = []
+        self._model_project: List[int] = []
+        self._model_consumers: List[Set[int]] = []
+        self._memo: Dict[Tuple[str, int], frozenset] = {}
+        self._lock = threading.RLock()
+
+    def __contains__(self, key) -> bool:
+        return key in self._project_index or key in self._model_index
+
+    def __len__(self) -> int:
+        return len(self._project_ids)
+
+    def build(self) -> "MeshGraph":
+        """Fetch every project and public model and index them
+
+        Returns:
+            MeshGraph: The graph, so calls can be chained
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            projects_future = executor.submit(
+                self._client.mesh_projects, self.account_id
+            )
+            models_future = executor.submit(
+                self._client.public_models, self.account_id, first=self.first
+            )
+            projects_response = projects_future.result()
+            models_response = models_future.result()
+
+        account = (projects_response.get("data") or {}).get("account") or {}
+        projects = account.get("meshProjects") or []
+        account = (models_response.get("data") or {}).get("account") or {}
+        edges = (account.get("publicModels") or {}).get("edges") or []
+        with self._lock:
+            self.errors = (projects_response.get("errors") or []) + (
+                models_response.get("errors") or []
+            )
+            self._index(projects, [edge["node"] for edge in edges])
+        return self
+
+    def _add_project(self, project: Dict) -> int:
+        project_id = project["projectId"]
+        index = self._project_index.get(project_id)
+        if index is None:
+            index = self._project_index[project_id] = len(self._project_ids)
+            self._project_ids.append(project_id)
+            self._project_children.append(set())
+            self._project_parents.append(set())
+            self.projects[project_id] = project
+        elif "projectSummary" in project:
+            # Prefer the full record over a dependent project's summary of it
+            self.projects[project_id] = project
+        return index
+
+    def _index(self, projects: List[Dict], models: List[Dict]):
+        self.projects, self.models, self._memo = {}, {}, {}
+        self._project_ids, self._project_index = [], {}
+        self._project_children, self._project_parents = [], []
+        for project in projects:
+            producer = self._add_project(project)
+            for dependent in project.get("dependentProjects") or []:
+                consumer = self._add_project(dependent)
+                if consumer != producer:
+                    self._project_children[producer].add(consumer)
+                    self._project_parents[consumer].add(producer)
+
+        # A model is returned for each environment it's deployed to, so keep the
+        # one from its project's default environment when there's a choice
+        for model in models:
+            current = self.models.get(model["uniqueId"])
+            if current is None or (
+                model.get("isDefaultEnv") and not current.get("isDefaultEnv")
+            ):
+                self.models[model["uniqueId"]] = model
+
+        self._model_ids = list(self.models)
+        self._model_index = {u: i for i, u in enumerate(self._model_ids)}
+        self._model_children = [set() for _ in self._model_ids]
+        self._model_parents = [set() for _ in self._model_ids]
+        self._model_project = []
+        self._model_consumers = []
+        for index, model in enumerate(self.models.values()):
+            project = {
+                "projectId": model["projectId"],
+                "dbtCoreProject": model.get("dbtCoreProject"),
+            }
+            self._model_project.append(self._add_project(project))
+            self._model_consumers.append(
+                {
+                    self._add_project(dependent)
+                    for dependent in model.get("dependentProjects") or []
+                }
+            )
+            for ancestor in model.get("publicAncestors") or []:
+                parent = self._model_index.get(ancestor["uniqueId"])
+                if parent is not None and parent != index:
+                    self._model_children[parent].add(index)
+                    self._model_parents[index].add(parent)
+
+    def _traverse(self, kind: str, index: int) -> frozenset:
+        key = (kind, index)
+        with self._lock:
+            if key in self._memo:
+                return self._memo[key]
+
+            edges = {
+                "downstream_projects": self._project_children,
+                "upstream_projects": self._project_parents,
+                "downstream_models": self._model_children,
+                "upstream_models": self._model_parents,
+            }[kind]
+            seen = {index}
+            stack = [index]
+            while stack:
+                for neighbour in edges[stack.pop()]:
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        stack.append(neighbour)
+            seen.discard(index)
+            self._memo[key] = frozenset(seen)
+            return self._memo[key]
+
+    def _project(self, project_id: int) -> int:
+        if project_id not in self._project_index:
+            raise ValueError(f"Project {project_id} is not in the mesh")
+
+        return self._project_index[project_id]
+
+    def _model(self, unique_id: str) -> int:
+        if unique_id not in self._model_index:
+            raise ValueError(f"{unique_id} is not a public model in the mesh")
+
+        return self._model_index[unique_id]
+
+    def downstream_projects(self, project_id: int) -> Set[int]:
+        """IDs of the projects that depend on a project, directly or indirectly
+
+        Args:
+            project_id (int): The project id
+        """
+        indices = self._traverse("downstream_projects", self._project(project_id))
+        return {self._project_ids[i] for i in indices}
+
+    def upstream_projects(self, project_id: int) -> Set[int]:
+        """IDs of the projects a project depends on, directly or indirectly
+
+        Args:
+            project_id (int): The project id
+        """
+        indices = self._traverse("upstream_projects", self._project(project_id))
+        return {self._project_ids[i] for i in indices}
+
+    def downstream_models(self, unique_id: str) -> Set[str]:
+        """Public models built on a public model, directly or indirectly
+
+        Args:
+            unique_id (str): Unique id of the public model
+        """
+        indices = self._traverse("downstream_models", self._model(unique_id))
+        return {self._model_ids[i] for i in indices}
+
+    def upstream_models(self, unique_id: str) -> Set[str]:
+        """Public models a public model is built on, directly or indirectly
+
+        Args:
+            unique_id (str): Unique id of the public model
+        """
+        indices = self._traverse("upstream_models", self._model(unique_id))
+        return {self._model_ids[i] for i in indices}
+
+    def impact(self, unique_id: str) -> Dict[int, Set[str]]:
+        """Projects and public models affected by a change to a public model
+
+        A project is affected when it references the model or one of the public
+        models built on it.
+
+        Args:
+            unique_id (str): Unique id of the public model
+
+        Returns:
+            Dict[int, Set[str]]: Mapping of the ID of each affected project to the
+                unique ids of its public models that are affected, which is empty
+                for projects that only reference them
+        """
+        index = self._model(unique_id)
+        downstream = self._traverse("downstream_models", index)
+        affected: Dict[int, Set[str]] = {}
+        for model in downstream:
+            project_id = self._project_ids[self._model_project[model]]
+            affected.setdefault(project_id, set()).add(self._model_ids[model])
+        for model in downstream | {index}:
+            for project in self._model_consumers[model]:
+                affected.setdefault(self._project_ids[project], set())
+        return affected
+
+    def project_order(self) -> List[int]:
+        """Project IDs ordered so each comes before the projects depending on it
+
+        Raises:
+            ValueError: If projects depend on each other in a cycle
+        """
+        return [
+            self._project_ids[i] for i in _topological_order(self._project_children)
+        ]
+
+    def model_order(self, project_id: Optional[int] = None) -> List[str]:
+        """Public models ordered so each comes before the models built on it
+
+        Args:
+            project_id (int, optional): Only include this project's models
+
+        Raises:
+            ValueError: If public models are built on each other in a cycle
+        """
+        order = [self._model_ids[i] for i in _topological_order(self._model_children)]
+        if project_id is None:
+            return order
+
+        project = self._project(project_id)
+        return [
+            unique_id
+            for unique_id in order
+            if self._model_project[self._model_index[unique_id]] == project
+        ]
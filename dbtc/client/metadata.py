@@ -1,8 +1,27 @@
 # stdlib
-from typing import Any, Dict, List, Union
+import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+# third party
+import requests
 
 # first party
+from dbtc.cache import ResponseCache
 from dbtc.client.base import _Client
+from dbtc.client.lineage import ColumnLineageGraph
+from dbtc.client.mesh import MeshGraph
+from dbtc.graphql import (
+    PagePaths,
+    batch_document,
+    count_fields,
+    ensure_page_info,
+    lookup,
+    page_paths,
+    split_batch_response,
+)
+from dbtc.instrumentation import graphql_operation
+from dbtc.schema import DEFAULT_SCHEMA_DIRECTORY, INTROSPECTION_QUERY, MetadataSchema
 
 QUERIES = {
     "column_lineage": """
@@ -177,12 +196,71 @@ query Recommendations($environmentId: BigInt!, $first: Int!, $after: String, $fi
       totalCount
     }
   }
+}
+    """,  # noqa: E501
+    "performance_overview": """
+query PerformanceOverview($environmentId: BigInt!, $start: Date!, $end: Date!, $limit: Int, $jobLimit: Int, $jobId: BigInt, $orderBy: SortAggregation, $first: Int!) {
+  performance(environmentId: $environmentId) {
+    mostExecutedModels(start: $start, end: $end, limit: $limit, jobLimit: $jobLimit) {
+      uniqueId
+      totalExecutions
+      byJob {
+        jobId
+        totalExecutions
+      }
+    }
+    longestExecutedModels(start: $start, end: $end, limit: $limit, jobId: $jobId, orderBy: $orderBy, jobLimit: $jobLimit) {
+      uniqueId
+      maxExecutionTime
+      averageExecutionTime
+      byJob {
+        jobId
+        maxExecutionTime
+        averageExecutionTime
+      }
+    }
+    mostExecutionFailedModels(start: $start, end: $end, limit: $limit) {
+      uniqueId
+      failurePercentage
+      totalExecutions
+      totalFailedExecutions
+    }
+    mostTestFailedModels(start: $start, end: $end, limit: $limit) {
+      uniqueId
+      failurePercentage
+      totalRunsWithTests
+      totalRunsWithTestFailures
+    }
+  }
+  recommendations(environmentId: $environmentId) {
+    metrics {
+      name
+      value
+    }
+    rules(first: $first) {
+      edges {
+        node {
+          name
+          category
+          severity
+          uniqueId
+          violationId
+          description
+        }
+      }
+      totalCount
+    }
+  }
 }
     """,  # noqa: E501
     "public_models": """
 query Node($accountId: BigInt!, $after: String, $filter: PublicModelsFilter, $first: Int) {
   account(id: $accountId) {
     publicModels(after: $after, filter: $filter, first: $first) {
+      pageInfo {
+        endCursor
+        hasNextPage
+      }
       edges {
         node {
           accountId
@@ -249,6 +327,10 @@ query Search($filter: SearchQueryFilter!, $environmentId: BigInt!, $after: Strin
   environment(id: $environmentId) {
     applied {
       searchResults(filter: $filter, after: $after, first: $first) {
+        pageInfo {
+          endCursor
+          hasNextPage
+        }
         edges {
           cursor
           node {
@@ -275,6 +357,10 @@ query Search($filter: SearchQueryFilter!, $environmentId: BigInt!, $after: Strin
     """,  # noqa: E501
 }
 
+# Limits on the calls merged into a single request by `batch_query`
+DEFAULT_BATCH_SIZE = 40
+DEFAULT_MAX_FIELDS = 1_000
+
 ACCESS_LEVELS = ["private", "protected", "public"]
 SEARCH_FIELD_TYPES = ["code", "column", "description", "name", "relation"]
 RESOURCE_TYPES = [
@@ -290,9 +376,108 @@ RESOURCE_TYPES = [
 ]
 
 
+# Sub-ranges of a split date range return this many times more top models than
+# requested, so models ranked just outside the top of each sub-range are counted.
+# Models further down are still left out, so merged rankings are approximate.
+DATE_CHUNK_OVERFETCH = 4
+
+
+def _date_chunks(start_date: str, end_date: str, days: int) -> List[Tuple[str, str]]:
+    """Consecutive, inclusive sub-ranges of at most `days` days"""
+    if days < 1:
+        raise ValueError("chunk_days must be at least 1")
+
+    start = datetime.date.fromisoformat(start_date)
+    end = datetime.date.fromisoformat(end_date)
+    if end < start:
+        raise ValueError("end_date must not be before start_date")
+
+    chunks = []
+    while start <= end:
+        chunk_end = min(start + datetime.timedelta(days=days - 1), end)
+        chunks.append((start.isoformat(), chunk_end.isoformat()))
+        start = chunk_end + datetime.timedelta(days=1)
+    return chunks
+
+
+def _performance_rows(response: Dict, field: str) -> List[Dict]:
+    return ((response.get("data") or {}).get("performance") or {}).get(field) or []
+
+
+def _merge_performance(
+    responses: List[Dict], field: str, rows: List[Dict], limit: Optional[int]
+) -> Dict:
+    """A response shaped like one for the whole date range"""
+    merged: Dict[str, Any] = {
+        "data": {"performance": {field: rows[:limit] if limit is not None else rows}}
+    }
+    errors = [error for response in responses for error in response.get("errors") or []]
+    if errors:
+        merged["errors"] = errors
+    return merged
+
+
+def _combine(
+    rows: List[Dict],
+    key: str,
+    sums: Tuple[str, ...] = (),
+    maxima: Tuple[str, ...] = (),
+    means: Tuple[str, ...] = (),
+    weighted: Dict[str, str] = None,
+    nested: Dict[str, Callable[[List[Dict]], List[Dict]]] = None,
+) -> List[Dict]:
+    """Combine rows sharing `key` from different sub-ranges
+
+    Counts in `sums` are added, `maxima` take the largest value, `means` are
+    averaged, and each field in `weighted` is averaged weighted by the count it
+    maps to, e.g. a failure percentage by the number of executions.  Lists in
+    `nested`, where present, are concatenated and passed to the function they map
+    to.
+    """
+    weighted = weighted or {}
+    nested = nested or {}
+    combined: Dict[Any, Dict] = {}
+    for row in rows:
+        current = combined.get(row[key])
+        if current is None:
+            combined[row[key]] = current = {**row, "_rows": []}
+        current["_rows"].append(row)
+
+    for current in combined.values():
+        parts = current.pop("_rows")
+        for name in sums:
+            current[name] = sum(part.get(name) or 0 for part in parts)
+        for name in maxima:
+            values = [part[name] for part in parts if part.get(name) is not None]
+            current[name] = max(values) if values else None
+        for name in means:
+            values = [part[name] for part in parts if part.get(name) is not None]
+            current[name] = sum(values) / len(values) if values else None
+        for name, weight in weighted.items():
+            total = sum(part.get(weight) or 0 for part in parts)
+            current[name] = (
+                sum((part.get(name) or 0) * (part.get(weight) or 0) for part in parts)
+                / total
+                if total
+                else current.get(name)
+            )
+        for name, merge in nested.items():
+            if name not in current:
+                continue
+
+            current[name] = merge(
+                [item for part in parts for item in part.get(name) or []]
+            )
+    return list(combined.values())
+
+
 class _MetadataClient(_Client):
+    _client_name = "metadata"
+
     def __init__(self, session, **kwargs):
         super().__init__(session, **kwargs)
+        self.cache: Optional[ResponseCache] = None
+        self.schema: Optional[MetadataSchema] = None
 
     _header_property = "service_token"
 
@@ -319,6 +504,13 @@ class _MetadataClient(_Client):
 
         return None
 
+    def _page_items(self, response: Dict, paths: Optional[PagePaths]) -> List:
+        if paths is not None and paths.items is not None:
+            items = lookup(response, paths.items)
+        else:
+            items = self._find_list_element(response)
+        return items if items is not None else []
+
     def _find_list_element(self, response_data: Dict):
         for _, value in response_data.items():
             if isinstance(value, list):
@@ -332,16 +524,101 @@ class _MetadataClient(_Client):
         return None
 
     def _make_request(self, payload: Dict[str, Any], after_cursor: str = None):
+        # Payloads are never modified, so the same query and variables can be used
+        # from several threads, or run again, without their cursors interfering
         if after_cursor:
-            if "variables" not in payload:
-                payload["variables"] = {}
-            payload["variables"]["after"] = after_cursor
+            variables = {**(payload.get("variables") or {}), "after": after_cursor}
+            payload = {**payload, "variables": variables}
+
+        schema = self.schema
+        if schema is not None:
+            schema.check(payload["query"], payload.get("variables") or {})
+
+        cache = self.cache
+        if cache is not None:
+            cached = cache.get(payload, url=self.full_url())
+            if cached is not None:
+                return cached
+
+        endpoint = f"{self._path}/{graphql_operation(payload['query'])}"
+        with self._instrument("post", endpoint) as event:
+            response = self._post_graphql(payload)
+            self._raise_for_status(response)
+            with event.timer("decode_time"):
+                data = response.json()
+        if cache is not None:
+            cache.set(payload, data, url=self.full_url())
+        return data
+
+    @staticmethod
+    def _raise_for_status(response: requests.Response):
+        """Raise for an error status, with the GraphQL errors the server returned"""
+        if response.status_code < 400:
+            return
 
-        response = self.session.post(self.full_url(), json=payload)
-        return response.json()
+        try:
+            errors = response.json().get("errors") or []
+            messages = [error.get("message", str(error)) for error in errors]
+        except (ValueError, AttributeError):
+            messages = []
+        reason = "; ".join(messages) or response.reason
+        raise requests.HTTPError(
+            f"{response.status_code} Error: {reason} for url: {response.url}",
+            response=response,
+        )
+
+    def _introspect(self, etag: str = None) -> Tuple[Optional[Dict], Optional[str]]:
+        """Introspect the schema, unless it still matches `etag`
+
+        Returns:
+            Tuple[Optional[Dict], Optional[str]]: The schema, or None if it's
+                unchanged, and the ETag it was returned with
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        with self._instrument("post", f"{self._path}/Introspection") as event:
+            response = self._send(
+                "post",
+                self.full_url(),
+                json={"query": INTROSPECTION_QUERY},
+                headers=headers,
+            )
+            if response.status_code == 304:
+                return None, etag
 
-    def _get_next_page_cursor(self, response: Dict) -> Union[str, None]:
-        page_info = self._find_page_info(response)
+            self._raise_for_status(response)
+            with event.timer("decode_time"):
+                data = response.json()
+        return data["data"]["__schema"], response.headers.get("ETag")
+
+    def enable_validation(
+        self, *, directory: str = None, ttl: float = 86_400
+    ) -> MetadataSchema:
+        """Validate every query against the Discovery API schema before it's sent
+
+        The schema is introspected once and, with `directory`, cached on disk so
+        later clients don't introspect it again until it's `ttl` seconds old.
+        Invalid queries raise a ValueError listing every problem instead of being
+        sent.
+
+        Args:
+            directory (str, optional): Directory the schema is cached in.  Defaults
+                to only keeping it in memory.
+            ttl (float, optional): Max age of the cached schema in seconds.
+                Defaults to a day.
+
+        Returns:
+            MetadataSchema: The schema queries are validated against
+        """
+        self.schema = MetadataSchema.load(self, directory=directory, ttl=ttl)
+        return self.schema
+
+    def _get_next_page_cursor(
+        self, response: Dict, paths: Optional[PagePaths] = None
+    ) -> Union[str, None]:
+        if paths is not None:
+            page_info = lookup(response, paths.page_info)
+        else:
+            page_info = self._find_page_info(response)
         if page_info is None:
             return None
 
@@ -350,34 +627,347 @@ class _MetadataClient(_Client):
 
         return None
 
+    def _query_each(
+        self,
+        query: str,
+        variables: Dict,
+        name: str,
+        values: Union[str, List[str]],
+        batch_size: int,
+    ) -> Union[Dict, Dict[str, Dict]]:
+        """`query` for a single value of `name`, or `batch_query` for a list"""
+        if isinstance(values, str):
+            return self.query(query, variables={**variables, name: values})
+
+        responses = self.batch_query(
+            query, [{**variables, name: v} for v in values], batch_size=batch_size
+        )
+        return dict(zip(values, responses))
+
+    def _query_date_range(
+        self,
+        fetch: Callable[[str, str], Any],
+        start_date: str,
+        end_date: str,
+        chunk_days: int,
+        max_workers: int,
+    ) -> List[Any]:
+        """Results of `fetch` for each sub-range, run concurrently, in date order"""
+        chunks = _date_chunks(start_date, end_date, chunk_days)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            return list(executor.map(lambda chunk: fetch(*chunk), chunks))
+
+    def _query_ranked(
+        self,
+        query: str,
+        variables: Dict,
+        field: str,
+        start_date: str,
+        end_date: str,
+        chunk_days: int,
+        max_workers: int,
+        merge: Callable[[List[Dict]], List[Dict]],
+    ) -> Dict:
+        """Run a top models query for each sub-range and `merge` their rows"""
+        chunk_variables = dict(variables)
+        for name in ("limit", "jobLimit"):
+            if chunk_variables.get(name) is not None:
+                chunk_variables[name] *= DATE_CHUNK_OVERFETCH
+
+        def fetch(start: str, end: str) -> Dict:
+            return self.query(
+                query, variables={**chunk_variables, "start": start, "end": end}
+            )
+
+        responses = self._query_date_range(
+            fetch, start_date, end_date, chunk_days, max_workers
+        )
+        rows = merge([row for r in responses for row in _performance_rows(r, field)])
+        return _merge_performance(responses, field, rows, variables.get("limit"))
+
+    def _query_all(
+        self, query: str, variables: Dict, max_results: Optional[int]
+    ) -> Dict:
+        """Every page of a paginated query merged into the first page's response"""
+        paths = page_paths(query)
+        merged: Optional[Dict] = None
+        for response in self.iter_query(query, variables, max_results=max_results):
+            if merged is None:
+                merged = response
+                continue
+
+            self._page_items(merged, paths).extend(self._page_items(response, paths))
+            if paths is not None:
+                page_info = lookup(merged, paths.page_info)
+                latest = lookup(response, paths.page_info)
+            else:
+                page_info = self._find_page_info(merged)
+                latest = self._find_page_info(response)
+            if page_info is not None and latest is not None:
+                page_info.update(latest)
+            if response.get("errors"):
+                merged.setdefault("errors", []).extend(response["errors"])
+        return merged  # type: ignore[return-value]
+
+    def batch_query(
+        self,
+        query: str,
+        variables_list: List[Dict],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_fields: int = DEFAULT_MAX_FIELDS,
+    ) -> List[Dict]:
+        """Run the same query for many sets of variables in as few requests as possible
+
+        Up to `batch_size` copies of the query are merged into a single GraphQL
+        document, each with its top-level fields aliased and its own copy of the
+        variables that differ between calls.  Fewer are merged when the document
+        would otherwise select more than `max_fields` fields.  Paginated queries
+        can't be batched; use `query_many` instead.
+
+        Args:
+            query (str): The GraphQL query to execute.  It must contain a single
+                query operation.
+            variables_list (List[Dict]): Variables for each call
+            batch_size (int, optional): Max number of calls merged into one request.
+                Defaults to 40.
+            max_fields (int, optional): Max number of fields selected by one
+                request.  Defaults to 1,000.
+
+        Returns:
+            List[Dict]: One response per set of variables, in the same order and
+                shaped as if each call had been made on its own
+        """
+        if "pageInfo" in query:
+            raise ValueError("Paginated queries can't be batched.")
+
+        if not variables_list:
+            return []
+
+        names = list(dict.fromkeys(k for v in variables_list for k in v))
+        per_call = tuple(
+            name
+            for name in names
+            if any(
+                name not in v or v[name] != variables_list[0].get(name)
+                for v in variables_list
+            )
+        )
+        shared = {
+            name: variables_list[0][name] for name in names if name not in per_call
+        }
+        size = max(1, min(batch_size, max_fields // max(count_fields(query), 1)))
+
+        results: List[Dict] = []
+        for start in range(0, len(variables_list), size):
+            chunk = variables_list[start : start + size]
+            document, keys = batch_document(query, len(chunk), per_call)
+            variables = dict(shared)
+            for i, call_variables in enumerate(chunk):
+                for name in per_call:
+                    variables[f"{name}_{i}"] = call_variables.get(name)
+            response = self._make_request({"query": document, "variables": variables})
+            results.extend(split_batch_response(response, len(chunk), keys))
+        return results
+
+    def catalog_index(
+        self,
+        environment_id: int,
+        *,
+        resource_types: List[str] = None,
+        first: int = 500,
+    ):
+        """Build a local full-text index of an environment's resources
+
+        The returned `CatalogIndex` answers `search`-style queries in-process,
+        without making requests.  Call its `refresh` method to pick up changes to
+        the environment's applied state.
+
+        Args:
+            environment_id (int): The environment id.
+            resource_types (List[str], optional): Resource types to index.  Defaults
+                to models, sources, seeds, snapshots, and exposures.
+            first (int, optional): The number of resources to retrieve per request.
+                Defaults to 500.
+        """
+        # first party
+        from dbtc.client.catalog import CatalogIndex
+
+        return CatalogIndex(
+            self, environment_id, resource_types=resource_types, first=first
+        ).build()
+
     def column_lineage(
         self,
         environment_id: int,
-        node_unique_id: str,
+        node_unique_id: Union[str, List[str]],
         *,
         max_depth: int = None,
         column_name: str = None,
         is_error: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ):
         """Retrieve column lineage for a given node.
 
         Args:
             environment_id (int): The environment id.
-            node_unique_id (str): The unique id of the node.
+            node_unique_id (str): The unique id of the node.  Pass a list to retrieve
+                lineage for many nodes with as few requests as possible; a dictionary
+                of responses keyed by unique id is returned instead.
             max_depth: (int): The max depth to traverse the lineage. Defaults to None.
             column_name: (str): The column name to filter by. Defaults to None.
             is_error: (bool): Whether to return only error nodes. Defaults to False.
+            batch_size (int, optional): Max number of nodes per request when
+                `node_unique_id` is a list.  Defaults to 40.
         """
         variables = {
             "environmentId": environment_id,
-            "nodeUniqueId": node_unique_id,
             "filters": {
                 "maxDepth": max_depth,
                 "columnName": column_name,
                 "isError": is_error,
             },
         }
-        return self.query(QUERIES["column_lineage"], variables=variables)
+        return self._query_each(
+            QUERIES["column_lineage"],
+            variables,
+            "nodeUniqueId",
+            node_unique_id,
+            batch_size,
+        )
+
+    def column_lineage_graph(
+        self,
+        environment_id: int,
+        node_unique_ids: List[str],
+        *,
+        max_depth: int = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = 8,
+    ) -> ColumnLineageGraph:
+        """Fetch column lineage for many nodes into one graph
+
+        Each node is fetched once, in batches made concurrently.  The graph answers
+        `upstream`, `downstream`, and `impact` queries for any column it contains
+        without making further requests; call `fetch` on it to add more nodes.
+
+        Args:
+            environment_id (int): The environment id.
+            node_unique_ids (List[str]): Unique ids of the nodes.
+            max_depth: (int): The max depth to traverse the lineage. Defaults to None.
+            batch_size (int, optional): Max number of nodes per request.  Defaults
+                to 40.
+            max_workers (int, optional): Max number of requests made at once.
+                Defaults to 8.
+        """
+        return ColumnLineageGraph(
+            self,
+            environment_id,
+            max_depth=max_depth,
+            batch_size=batch_size,
+            max_workers=max_workers,
+        ).fetch(node_unique_ids)
+
+    def iter_query(
+        self,
+        query: str,
+        variables: Dict = None,
+        max_pages: int = None,
+        paginated_request_to_list: bool = False,
+        *,
+        after: str = None,
+        checkpoint: Callable[[Optional[str]], None] = None,
+        max_results: int = None,
+    ) -> Iterator[Dict]:
+        """Query the Discovery API, yielding results as each page arrives
+
+        Unlike `query`, nothing is held onto once it's been yielded, so large
+        exports use a constant amount of memory.
+
+        Args:
+            query (str): The GraphQL query to execute.
+            variables (Dict, optional): Dictionary containing the variables to include
+                in the payload of the request.  Defaults to None.
+            max_pages (int, optional): The max number of pages to paginate through.
+                Defaults to None.
+            paginated_request_to_list (bool, optional): Yield each element of the
+                list within each page instead of the pages themselves.  Defaults to
+                False.
+            after (str, optional): Cursor to start paginating from, e.g. one saved
+                by `checkpoint` before an export was interrupted.  Defaults to None.
+            checkpoint (Callable, optional): Called with the `endCursor` of each page
+                once everything in that page has been yielded, or with None after
+                the last page.  Passing the saved value as `after` resumes from the
+                following page.  A page cut short by `max_results` isn't
+                checkpointed, so resuming fetches it again.  Defaults to None.
+            max_results (int, optional): Stop once this many elements of the
+                paginated list have been retrieved.  The page size is reduced for the
+                last page so no more than needed are requested.  Defaults to None.
+
+        Yields:
+            Dict: Each page of results, or each element of each page when
+                `paginated_request_to_list` is True.
+        """
+        payload: Dict[str, Any] = {"query": query}
+        if variables:
+            payload.update({"variables": variables})
+            if "first" in payload["variables"] and payload["variables"]["first"] > 500:
+                raise ValueError("The maximum page size is 500.")
+
+        paginate = "pageInfo" in query and query.count("$after") >= 2
+        if "pageInfo" in query and not paginate:
+            self.console.log(
+                'Query not properly set up with an "$after" variable to paginate '
+                "results properly so making a single request."
+            )
+
+        # Locations of `pageInfo` and the list of results are parsed from the query
+        # once, falling back to searching each response if the query can't be parsed
+        paths = page_paths(query)
+        cursor = after
+        page = 0
+        remaining = max_results
+        while True:
+            page_payload = payload
+            if remaining is not None and "first" in (variables or {}):
+                first = min(variables["first"], remaining)  # type: ignore[index]
+                page_payload = {**payload, "variables": {**variables, "first": first}}
+            response = self._make_request(page_payload, cursor)
+            cursor = self._get_next_page_cursor(response, paths) if paginate else None
+            page += 1
+            reached = truncated = False
+            if remaining is not None:
+                items = self._page_items(response, paths)
+                reached = len(items) >= remaining
+                truncated = len(items) > remaining
+                del items[remaining:]
+                remaining -= len(items)
+            if paginated_request_to_list:
+                yield from self._page_items(response, paths)
+            else:
+                yield response
+
+            if reached and (cursor or truncated):
+                # The cursor of a page that was cut short is past the elements
+                # dropped from it, so resuming from it would skip them
+                if checkpoint is not None and not truncated:
+                    checkpoint(cursor)
+                self.console.log(f"Reached max results limit of {max_results}.")
+                return
+
+            if not cursor:
+                if checkpoint is not None:
+                    checkpoint(None)
+                return
+
+            if checkpoint is not None:
+                checkpoint(cursor)
+
+            if max_pages and page >= max_pages:
+                self.console.log(f"Reached max page limit of {max_pages}.")
+                return
+
+            self.console.log(f"Fetching page {page} for query...")
 
     def longest_executed_models(
         self,
@@ -389,6 +979,8 @@ class _MetadataClient(_Client):
         job_limit: int = 5,
         job_id: int = None,
         order_by: str = "MAX",
+        chunk_days: int = None,
+        max_workers: int = 8,
     ):
         """Retrieve the longest executed models for a given environment.
 
@@ -402,6 +994,17 @@ class _MetadataClient(_Client):
             job_id (int, optional): The job id to filter by. Defaults to None.
             order_by (str, optional): The order by clause. One of "AVG" or "MAX".
                 Defaults to "MAX".
+            chunk_days (int, optional): Split the date range into sub-ranges of this
+                many days, fetched concurrently and merged into a single response.
+                Defaults to None, making a single request.
+            max_workers (int, optional): Max number of sub-ranges fetched at once.
+                Defaults to 8.
+
+        When split, each sub-range only returns its top `limit` times
+        `DATE_CHUNK_OVERFETCH` (4) models, so a model that's never in the top of
+        a sub-range is missing.  Each model's max execution time is the max of
+        the sub-ranges it was returned for, while its average execution time is
+        the mean of their averages.
         """
         if order_by not in ["AVG", "MAX"]:
             raise ValueError("order_by must be one of 'AVG' or 'MAX'")
@@ -415,7 +1018,46 @@ class _MetadataClient(_Client):
             "jobId": job_id,
             "orderBy": order_by,
         }
-        return self.query(QUERIES["longest_executed_models"], variables=variables)
+        if chunk_days is None:
+            return self.query(QUERIES["longest_executed_models"], variables=variables)
+
+        statistic = "maxExecutionTime" if order_by == "MAX" else "averageExecutionTime"
+
+        def merge(rows: List[Dict], key: str = "uniqueId", top: int = None):
+            combined = _combine(
+                rows,
+                key,
+                maxima=("maxExecutionTime",),
+                means=("averageExecutionTime",),
+                nested={"byJob": lambda jobs: merge(jobs, "jobId", job_limit)},
+            )
+            combined.sort(key=lambda row: -(row[statistic] or 0))
+            return combined[:top] if top is not None else combined
+
+        return self._query_ranked(
+            QUERIES["longest_executed_models"],
+            variables,
+            "longestExecutedModels",
+            start_date,
+            end_date,
+            chunk_days,
+            max_workers,
+            merge,
+        )
+
+    def mesh_graph(self, account_id: int, *, first: int = 500) -> MeshGraph:
+        """Build a graph of the dependencies between mesh projects and public models
+
+        Projects and public models are fetched concurrently and indexed once.  The
+        graph answers `impact`, upstream and downstream, and ordering queries
+        without making further requests; call `build` on it to fetch them again.
+
+        Args:
+            account_id (int): The account id.
+            first (int, optional): The number of public models to retrieve per
+                request.  Defaults to 500.
+        """
+        return MeshGraph(self, account_id, first=first).build()
 
     def mesh_projects(self, account_id: int):
         """Retrieve mesh projects for a given account.
@@ -427,7 +1069,15 @@ class _MetadataClient(_Client):
         return self.query(QUERIES["mesh_projects"], variables=variables)
 
     def model_execution_history(
-        self, environment_id: int, start_date: str, end_date: str, unique_id: str
+        self,
+        environment_id: int,
+        start_date: str,
+        end_date: str,
+        unique_id: Union[str, List[str]],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        chunk_days: int = None,
+        max_workers: int = 8,
     ):
         """Retrieve model execution history for a given environment.
 
@@ -435,18 +1085,51 @@ class _MetadataClient(_Client):
             environment_id (int): The environment id.
             start_date (str): The start date in the format YYYY-MM-DD.
             end_date (str): The end date in the format YYYY-MM-DD.
-            unique_id (str): The unique id of the model.
+            unique_id (str): The unique id of the model.  Pass a list to retrieve
+                many models with as few requests as possible; a dictionary of
+                responses keyed by unique id is returned instead.
+            batch_size (int, optional): Max number of models per request when
+                `unique_id` is a list.  Defaults to 40.
+            chunk_days (int, optional): Split the date range into sub-ranges of this
+                many days, fetched concurrently and merged into a single response.
+                Defaults to None, making a single request.
+            max_workers (int, optional): Max number of sub-ranges fetched at once.
+                Defaults to 8.
         """
-        variables = {
-            "environmentId": environment_id,
-            "startDate": start_date,
-            "endDate": end_date,
-            "uniqueId": unique_id,
-        }
-        return self.query(QUERIES["model_execution_history"], variables=variables)
+
+        def fetch(start: str, end: str):
+            return self._query_each(
+                QUERIES["model_execution_history"],
+                {"environmentId": environment_id, "startDate": start, "endDate": end},
+                "uniqueId",
+                unique_id,
+                batch_size,
+            )
+
+        if chunk_days is None:
+            return fetch(start_date, end_date)
+
+        def merge(responses: List[Dict]) -> Dict:
+            field = "modelExecutionHistory"
+            rows = [row for r in responses for row in _performance_rows(r, field)]
+            return _merge_performance(responses, field, rows, None)
+
+        results = self._query_date_range(
+            fetch, start_date, end_date, chunk_days, max_workers
+        )
+        if isinstance(unique_id, str):
+            return merge(results)
+
+        return {u: merge([result[u] for result in results]) for u in unique_id}
 
     def model_job_information(
-        self, environment_id: int, start_date: str, end_date: str, unique_id: str
+        self,
+        environment_id: int,
+        start_date: str,
+        end_date: str,
+        unique_id: Union[str, List[str]],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ):
         """Retrieve model job information for a given environment.
 
@@ -454,15 +1137,24 @@ class _MetadataClient(_Client):
             environment_id (int): The environment id.
             start_date (str): The start date in the format YYYY-MM-DD.
             end_date (str): The end date in the format YYYY-MM-DD.
-            unique_id (str): The unique id of the model.
+            unique_id (str): The unique id of the model.  Pass a list to retrieve
+                many models with as few requests as possible; a dictionary of
+                responses keyed by unique id is returned instead.
+            batch_size (int, optional): Max number of models per request when
+                `unique_id` is a list.  Defaults to 40.
         """
         variables = {
             "environmentId": environment_id,
             "start": start_date,
             "end": end_date,
-            "uniqueId": unique_id,
         }
-        return self.query(QUERIES["model_job_information"], variables=variables)
+        return self._query_each(
+            QUERIES["model_job_information"],
+            variables,
+            "uniqueId",
+            unique_id,
+            batch_size,
+        )
 
     def most_executed_models(
         self,
@@ -472,6 +1164,8 @@ class _MetadataClient(_Client):
         *,
         limit: int = 5,
         job_limit: int = 5,
+        chunk_days: int = None,
+        max_workers: int = 8,
     ):
         """Retrieve the most executed models for a given environment.
 
@@ -482,6 +1176,17 @@ class _MetadataClient(_Client):
             limit (int, optional): The max number of models to return. Defaults to 5.
             job_limit (int, optional): The max number of jobs to return for each model.
                 Defaults to 5.
+            chunk_days (int, optional): Split the date range into sub-ranges of this
+                many days, fetched concurrently and merged into a single response.
+                Defaults to None, making a single request.
+            max_workers (int, optional): Max number of sub-ranges fetched at once.
+                Defaults to 8.
+
+        When split, each sub-range only returns its top `limit` times
+        `DATE_CHUNK_OVERFETCH` (4) models, and `jobLimit` times 4 jobs, so the
+        result is approximate: a model's `totalExecutions` leaves out sub-ranges
+        it wasn't in the top of, and a model that's never in the top of a
+        sub-range is missing entirely.
         """
         variables = {
             "environmentId": environment_id,
@@ -490,10 +1195,39 @@ class _MetadataClient(_Client):
             "limit": limit,
             "jobLimit": job_limit,
         }
-        return self.query(QUERIES["most_executed_models"], variables=variables)
+        if chunk_days is None:
+            return self.query(QUERIES["most_executed_models"], variables=variables)
+
+        def merge(rows: List[Dict], key: str = "uniqueId", top: int = None):
+            combined = _combine(
+                rows,
+                key,
+                sums=("totalExecutions",),
+                nested={"byJob": lambda jobs: merge(jobs, "jobId", job_limit)},
+            )
+            combined.sort(key=lambda row: -row["totalExecutions"])
+            return combined[:top] if top is not None else combined
+
+        return self._query_ranked(
+            QUERIES["most_executed_models"],
+            variables,
+            "mostExecutedModels",
+            start_date,
+            end_date,
+            chunk_days,
+            max_workers,
+            merge,
+        )
 
     def most_failed_models(
-        self, environment_id: int, start_date: str, end_date: str, *, limit: int = 5
+        self,
+        environment_id: int,
+        start_date: str,
+        end_date: str,
+        *,
+        limit: int = 5,
+        chunk_days: int = None,
+        max_workers: int = 8,
     ):
         """Retrieve the most failed models for a given environment.
 
@@ -502,6 +1236,17 @@ class _MetadataClient(_Client):
             start_date (str): The start date in the format YYYY-MM-DD.
             end_date (str): The end date in the format YYYY-MM-DD.
             limit (int, optional): The max number of models to return. Defaults to 5.
+            chunk_days (int, optional): Split the date range into sub-ranges of this
+                many days, fetched concurrently and merged into a single response.
+                Defaults to None, making a single request.
+            max_workers (int, optional): Max number of sub-ranges fetched at once.
+                Defaults to 8.
+
+        When split, each sub-range only returns its top `limit` times
+        `DATE_CHUNK_OVERFETCH` (4) models, so the result is approximate: a
+        model's `totalExecutions` and `totalFailedExecutions` leave out
+        sub-ranges it wasn't in the top of, and a model that's never in the top
+        of a sub-range is missing entirely.
         """
         variables = {
             "environmentId": environment_id,
@@ -509,10 +1254,46 @@ class _MetadataClient(_Client):
             "end": end_date,
             "limit": limit,
         }
-        return self.query(QUERIES["most_execution_failed_models"], variables=variables)
+        if chunk_days is None:
+            return self.query(
+                QUERIES["most_execution_failed_models"], variables=variables
+            )
+
+        def merge(rows: List[Dict]) -> List[Dict]:
+            combined = _combine(
+                rows,
+                "uniqueId",
+                sums=("totalExecutions", "totalFailedExecutions"),
+                weighted={"failurePercentage": "totalExecutions"},
+            )
+            combined.sort(
+                key=lambda row: (
+                    -(row["failurePercentage"] or 0),
+                    -row["totalFailedExecutions"],
+                )
+            )
+            return combined
+
+        return self._query_ranked(
+            QUERIES["most_execution_failed_models"],
+            variables,
+            "mostExecutionFailedModels",
+            start_date,
+            end_date,
+            chunk_days,
+            max_workers,
+            merge,
+        )
 
     def most_models_test_failures(
-        self, environment_id: int, start_date: str, end_date: str, *, limit: int = 5
+        self,
+        environment_id: int,
+        start_date: str,
+        end_date: str,
+        *,
+        limit: int = 5,
+        chunk_days: int = None,
+        max_workers: int = 8,
     ):
         """Retrieve the most models with test failures for a given environment.
 
@@ -521,14 +1302,158 @@ class _MetadataClient(_Client):
             start_date (str): The start date in the format YYYY-MM-DD.
             end_date (str): The end date in the format YYYY-MM-DD.
             limit (int, optional): The max number of models to return. Defaults to 5.
+            chunk_days (int, optional): Split the date range into sub-ranges of this
+                many days, fetched concurrently and merged into a single response.
+                Defaults to None, making a single request.
+            max_workers (int, optional): Max number of sub-ranges fetched at once.
+                Defaults to 8.
+
+        When split, each sub-range only returns its top `limit` times
+        `DATE_CHUNK_OVERFETCH` (4) models, so the result is approximate: a
+        model's `totalRunsWithTests` and `totalRunsWithTestFailures` leave out
+        sub-ranges it wasn't in the top of, and a model that's never in the top
+        of a sub-range is missing entirely.
+        """
+        variables = {
+            "environmentId": environment_id,
+            "start": start_date,
+            "end": end_date,
+            "limit": limit,
+        }
+        if chunk_days is None:
+            return self.query(QUERIES["most_test_failed_models"], variables=variables)
+
+        def merge(rows: List[Dict]) -> List[Dict]:
+            combined = _combine(
+                rows,
+                "uniqueId",
+                sums=("totalRunsWithTests", "totalRunsWithTestFailures"),
+                weighted={"failurePercentage": "totalRunsWithTests"},
+            )
+            combined.sort(
+                key=lambda row: (
+                    -(row["failurePercentage"] or 0),
+                    -row["totalRunsWithTestFailures"],
+                )
+            )
+            return combined
+
+        return self._query_ranked(
+            QUERIES["most_test_failed_models"],
+            variables,
+            "mostTestFailedModels",
+            start_date,
+            end_date,
+            chunk_days,
+            max_workers,
+            merge,
+        )
+
+    def performance_frame(
+        self,
+        environment_id: int,
+        start_date: str,
+        end_date: str,
+        unique_ids: List[str],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """Retrieve execution history for many models as a `PerformanceFrame`
+
+        The frame flattens every execution into NumPy arrays and computes
+        percentiles, trends, and regression flags for every model, or every model
+        and job, at once.
+
+        Args:
+            environment_id (int): The environment id.
+            start_date (str): The start date in the format YYYY-MM-DD.
+            end_date (str): The end date in the format YYYY-MM-DD.
+            unique_ids (List[str]): The unique ids of the models.
+            batch_size (int, optional): Max number of models per request.
+                Defaults to 40.
+        """
+        # first party
+        from dbtc.performance import PerformanceFrame
+
+        responses = self.model_execution_history(
+            environment_id, start_date, end_date, unique_ids, batch_size=batch_size
+        )
+        return PerformanceFrame.from_history(responses)
+
+    def performance_overview(
+        self,
+        environment_id: int,
+        start_date: str,
+        end_date: str,
+        *,
+        limit: int = 5,
+        job_limit: int = 5,
+        job_id: int = None,
+        order_by: str = "MAX",
+        first: int = 500,
+    ) -> Dict[str, Any]:
+        """Retrieve an environment's performance and recommendations in one request.
+
+        A single document selects the fields of `most_executed_models`,
+        `longest_executed_models`, `most_failed_models`,
+        `most_models_test_failures`, and `recommendations`, so they're fetched in
+        one round trip instead of five.
+
+        Args:
+            environment_id (int): The environment id.
+            start_date (str): The start date in the format YYYY-MM-DD.
+            end_date (str): The end date in the format YYYY-MM-DD.
+            limit (int, optional): The max number of models to return for each
+                ranking.  Defaults to 5.
+            job_limit (int, optional): The max number of jobs to return for each
+                model.  Defaults to 5.
+            job_id (int, optional): The job id to filter the longest executed
+                models by.  Defaults to None.
+            order_by (str, optional): Order the longest executed models by "AVG" or
+                "MAX".  Defaults to "MAX".
+            first (int, optional): The max number of recommendations to return.
+                Use `recommendations` to filter them or page through more.
+                Defaults to 500.
+
+        Returns:
+            Dict[str, Any]: The models returned by each of the methods above, keyed
+                by the method's name, e.g. `most_executed_models`.
+                `recommendations` contains the `metrics`, a list of `rules`, and
+                their `totalCount`.  `errors` lists any errors returned with the
+                data; a section that couldn't be retrieved is None.
         """
+        if order_by not in ["AVG", "MAX"]:
+            raise ValueError("order_by must be one of 'AVG' or 'MAX'")
+
         variables = {
             "environmentId": environment_id,
             "start": start_date,
             "end": end_date,
             "limit": limit,
+            "jobLimit": job_limit,
+            "jobId": job_id,
+            "orderBy": order_by,
+            "first": first,
+        }
+        response = self.query(QUERIES["performance_overview"], variables=variables)
+        data = response.get("data") or {}
+        performance = data.get("performance") or {}
+        recommendations = data.get("recommendations")
+        if recommendations is not None:
+            rules = recommendations.get("rules") or {}
+            recommendations = {
+                "metrics": recommendations.get("metrics"),
+                "rules": [edge["node"] for edge in rules.get("edges") or []],
+                "totalCount": rules.get("totalCount"),
+            }
+        return {
+            "most_executed_models": performance.get("mostExecutedModels"),
+            "longest_executed_models": performance.get("longestExecutedModels"),
+            "most_failed_models": performance.get("mostExecutionFailedModels"),
+            "most_models_test_failures": performance.get("mostTestFailedModels"),
+            "recommendations": recommendations,
+            "errors": response.get("errors") or [],
         }
-        return self.query(QUERIES["most_test_failed_models"], variables=variables)
 
     def public_models(
         self,
@@ -538,9 +1463,13 @@ class _MetadataClient(_Client):
         environment_ids: List[int] = None,
         project_id: int = None,
         unique_ids: List[str] = None,
+        first: int = 500,
+        max_results: int = None,
     ):
         """Retrieve public models for a given account.
 
+        Every page of results is retrieved and merged into a single response.
+
         Args:
             account_id (int): The account id.
             project_name (str, optional): The project name. Defaults to None.
@@ -548,6 +1477,10 @@ class _MetadataClient(_Client):
                 Defaults to None.
             project_id (int, optional): The project id. Defaults to None.
             unique_ids (list[str], optional): The unique ids. Defaults to None.
+            first (int, optional): The number of models to retrieve per request.
+                Defaults to 500.
+            max_results (int, optional): The max number of models to return.
+                Defaults to None, returning every model.
         """
         variables = {
             "accountId": account_id,
@@ -557,8 +1490,9 @@ class _MetadataClient(_Client):
                 "projectId": project_id,
                 "uniqueIds": unique_ids,
             },
+            "first": first,
         }
-        return self.query(QUERIES["public_models"], variables=variables)
+        return self._query_all(QUERIES["public_models"], variables, max_results)
 
     def query(
         self,
@@ -566,6 +1500,9 @@ class _MetadataClient(_Client):
         variables: Dict = None,
         max_pages: int = None,
         paginated_request_to_list: bool = False,
+        *,
+        max_results: int = None,
+        validate: bool = False,
     ) -> Union[List[Dict], Dict]:
         """Query the Discovery API
 
@@ -578,57 +1515,95 @@ class _MetadataClient(_Client):
             paginated_request_to_list (bool, optional): When paginating through a
                 request, the elements of the list within each request will be
                 combined into a single list of dictionaries. Defaults to False.
+            max_results (int, optional): The max number of elements of the
+                paginated list to retrieve across all pages.  Defaults to None.
+            validate (bool, optional): Validate this query against the schema
+                before sending it, even if `enable_validation` hasn't been called.
+                The schema is introspected and cached in `~/.cache/dbtc`, but later
+                queries aren't validated unless `enable_validation` is called.
+                Queries are always validated once it has.  Defaults to False.
 
         Returns:
             Union[List[Dict], Dict]: _description_
         """
-        payload: Dict[str, Any] = {"query": query}
-        if variables:
-            payload.update({"variables": variables})
-            if "first" in payload["variables"] and payload["variables"]["first"] > 500:
-                raise ValueError("The maximum page size is 500.")
+        if validate and self.schema is None:
+            schema = MetadataSchema.load(self, directory=DEFAULT_SCHEMA_DIRECTORY)
+            schema.check(query, variables or {})
 
         # If we're not paginating, just make the request and return the results
-        if "pageInfo" not in query:
-            return self._make_request(payload)
+        if "pageInfo" not in query or query.count("$after") < 2:
+            return next(self.iter_query(query, variables))
 
-        # If we're paginating but the query isn't setup properly for paginating,
-        # then make a single request
-        if query.count("$after") < 2:
-            self.console.log(
-                'Query not properly set up with an "$after" variable to paginate '
-                "results properly so making a single request."
+        return list(
+            self.iter_query(
+                query,
+                variables,
+                max_pages=max_pages,
+                paginated_request_to_list=paginated_request_to_list,
+                max_results=max_results,
             )
-            return self._make_request(payload)
+        )
 
-        cursor = None
-        all_results = []
-        page = 0
+    def query_many(
+        self,
+        query: str,
+        variables_list: List[Dict],
+        max_workers: int = 8,
+        *,
+        max_pages: int = None,
+        paginated_request_to_list: bool = False,
+        return_exceptions: bool = False,
+    ) -> Iterator[Tuple[Dict, Any]]:
+        """Run the same query, including its pagination, for many sets of variables
 
-        while True:
-            response = self._make_request(payload, cursor)
-            cursor = self._get_next_page_cursor(response)
-            paginated_results = (
-                self._find_list_element(response)
-                if paginated_request_to_list
-                else response
-            )
+        Queries run concurrently on a pool of threads sharing this client's session,
+        e.g. to run `recommendations` against every production environment at once.
 
-            all_results.extend(
-                paginated_results
-            ) if paginated_request_to_list else all_results.append(paginated_results)
-            page += 1
+        Args:
+            query (str): The GraphQL query to execute.
+            variables_list (List[Dict]): Variables for each run of the query, e.g.
+                `[{"environmentId": 1, "first": 500}, ...]`
+            max_workers (int, optional): Max number of queries to run at once.
+                Defaults to 8.
+            max_pages (int, optional): The max number of pages to paginate through
+                for each set of variables.  Defaults to None.
+            paginated_request_to_list (bool, optional): Combine the elements of the
+                list within each page into a single list.  Defaults to False.
+            return_exceptions (bool, optional): Yield an exception raised by one of
+                the queries in place of its result instead of raising it.  Defaults
+                to False.
 
-            if not cursor:
-                break
+        Yields:
+            Tuple[Dict, Any]: The variables and the result of `query` for them, in
+                the order they finish.
+        """
 
-            if max_pages and page >= max_pages:
-                self.console.log(f"Reached max page limit of {max_pages}.")
-                break
+        def run(variables: Dict):
+            return self.query(
+                query,
+                variables,
+                max_pages=max_pages,
+                paginated_request_to_list=paginated_request_to_list,
+            )
 
-            self.console.log(f"Fetching page {page} for query...")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(run, variables): variables
+                for variables in variables_list
+            }
+            try:
+                for future in as_completed(futures):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        if not return_exceptions:
+                            raise
 
-        return all_results
+                        result = e
+                    yield futures[future], result
+            finally:
+                for future in futures:
+                    future.cancel()
 
     def recommendations(
         self,
@@ -668,6 +1643,53 @@ class _MetadataClient(_Client):
         }
         return self.query(QUERIES["recommendations"], variables=variables)
 
+    def snapshot_environment(
+        self,
+        environment_id: int,
+        store: str,
+        *,
+        resource_types: List[str] = None,
+        first: int = 500,
+        max_workers: int = 5,
+        force: bool = False,
+    ) -> Dict[str, List[str]]:
+        """Sync an environment's applied state into a local snapshot
+
+        Models, sources, tests, and exposures are stored in Parquet files in
+        `store`.  The first sync fetches every resource; later ones only fetch
+        models and tests that are new or were generated by a newer run, and do
+        nothing at all when the applied state hasn't been updated.  Read the
+        snapshot with `EnvironmentSnapshot`.
+
+        Args:
+            environment_id (int): The environment id.
+            store (str): Directory the snapshot is stored in.
+            resource_types (List[str], optional): Resource types to snapshot, any
+                of "Model", "Source", "Test", or "Exposure".  Defaults to all of
+                them.
+            first (int, optional): The number of resources to retrieve per
+                request.  Defaults to 500.
+            max_workers (int, optional): Max number of requests made at once.
+                Defaults to 5.
+            force (bool, optional): Check every resource even if the applied
+                state hasn't been updated.  Defaults to False.
+
+        Returns:
+            Dict[str, List[str]]: Unique ids of the resources `added`, `removed`,
+                and `modified` since the last sync
+        """
+        # first party
+        from dbtc.client.snapshot import EnvironmentSnapshot
+
+        return EnvironmentSnapshot(
+            self,
+            environment_id,
+            store,
+            resource_types=resource_types,
+            first=first,
+            max_workers=max_workers,
+        ).sync(force=force)
+
     def search(
         self,
         environment_id: int,
@@ -681,6 +1703,7 @@ class _MetadataClient(_Client):
         modeling_layer: str = None,
         resource_type: str = None,
         tags: str = None,
+        max_results: int = None,
     ):
         """
         Search for resources in the metadata service.
@@ -690,8 +1713,10 @@ class _MetadataClient(_Client):
             search_query (str): The search query to filter by.
             gql_query (str, optional): Override the default GraphQL query with your own.
                 Defaults to None and will use the default given by the package.
-            first (int, optional): The max number of search results to return.
-                Defaults to 500.
+                `pageInfo` is selected within `searchResults` if it isn't already,
+                so results are paginated as long as the query uses `$after`.
+            first (int, optional): The number of search results to retrieve per
+                request.  Defaults to 500.
             access_levels (str, optional): The access levels to filter by.
                 Defaults to None.
             search_fields (List[str], optional): The fields to search by. Defaults to
@@ -704,8 +1729,12 @@ class _MetadataClient(_Client):
                 Defaults to None.
             tags (str, optional): The tags to filter by.
                 Defaults to None.
+            max_results (int, optional): The max number of search results to return.
+                Defaults to None, returning every result.
+
+        Every page of results is retrieved and merged into a single response.
         """
-        query = gql_query or QUERIES["search"]
+        query = ensure_page_info(gql_query or QUERIES["search"], "searchResults")
         if access_level and access_level not in ACCESS_LEVELS:
             raise ValueError(f"access_level must be one of {ACCESS_LEVELS}")
 
@@ -730,4 +1759,4 @@ class _MetadataClient(_Client):
             "environmentId": environment_id,
             "first": first,
         }
-        return self.query(query, variables=variables)
+        return self._query_all(query, variables, max_results)
@@ -0,0 +1,312 @@
+# stdlib
+import concurrent.futures
+import enum
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class JobRunStatus(enum.IntEnum):
+    QUEUED = 1
+    STARTING = 2
+    RUNNING = 3
+    SUCCESS = 10
+    ERROR = 20
+    CANCELLED = 30
+
+
+TERMINAL_STATUSES = (
+    JobRunStatus.SUCCESS,
+    JobRunStatus.ERROR,
+    JobRunStatus.CANCELLED,
+)
+IN_PROGRESS_STATUSES = ["queued", "starting", "running"]
+
+# Max page size accepted by the v2 runs endpoint
+LIST_RUNS_LIMIT = 100
+
+
+class RunPoller:
+    """Track the status of many in-flight runs with a shared set of requests.
+
+    Rather than polling each run individually, every call to `poll` issues a single
+    `list_runs` request per account for the runs that are still in progress.  Only
+    tracked runs that have dropped out of that list are fetched individually to
+    retrieve their final state.
+
+    When the client has a `webhook_receiver` attached, `wait` returns as soon as a
+    completion event arrives and `poll` only fetches the runs that were pushed,
+    falling back to a full poll when no event arrives in time.
+
+    Args:
+        client (_AdminClient): Admin client used to make requests
+        poll_interval (int, optional): Number of seconds to wait in between
+            polling
+    """
+
+    def __init__(self, client, *, poll_interval: int = 10):
+        self._client = client
+        self.poll_interval = poll_interval
+        self._runs: Dict[int, Dict] = {}
+        self._started: Dict[int, float] = {}
+        self._pushed: Set[int] = set()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._runs)
+
+    def add(self, run: Dict) -> int:
+        """Start tracking a run.
+
+        Args:
+            run (dict): Response returned when triggering a run
+        """
+        run_id = run["data"]["id"]
+        with self._lock:
+            self._runs[run_id] = run
+            self._started[run_id] = time.time()
+        return run_id
+
+    def run_ids(self) -> List[int]:
+        """Numeric IDs of the runs being tracked"""
+        with self._lock:
+            return list(self._runs)
+
+    def remove(self, run_id: int):
+        """Stop tracking a run.
+
+        Args:
+            run_id (int): Numeric ID of the run
+        """
+        with self._lock:
+            self._runs.pop(run_id, None)
+            self._started.pop(run_id, None)
+            self._pushed.discard(run_id)
+
+    def wait(self):
+        """Block until it's time to `poll` again.
+
+        Sleeps for `poll_interval`, or, with a webhook receiver attached, until a
+        tracked run is pushed as complete or the receiver's fallback interval passes.
+        """
+        receiver = getattr(self._client, "webhook_receiver", None)
+        if receiver is None:
+            time.sleep(self.poll_interval)
+            return
+
+        pushed = receiver.wait_for(self.run_ids)
+        with self._lock:
+            self._pushed.update(pushed)
+
+    def _in_progress_run_ids(self, account_id: int) -> set:
+        run_ids: set = set()
+        offset = 0
+        while True:
+            runs = self._client.list_runs(
+                account_id,
+                status=IN_PROGRESS_STATUSES,
+                order_by="-id",
+                offset=offset,
+                limit=LIST_RUNS_LIMIT,
+            ).get("data", [])
+            run_ids.update(r["id"] for r in runs)
+            if len(runs) < LIST_RUNS_LIMIT:
+                return run_ids
+
+            offset += LIST_RUNS_LIMIT
+
+    def poll(self) -> List[Dict]:
+        """Make a single round of status requests for every tracked run.
+
+        Returns:
+            List[Dict]: Runs that have reached a terminal status (success, error,
+                or cancelled) during this round.  They are no longer tracked.
+        """
+        with self._lock:
+            # Runs pushed by a webhook are the only ones worth fetching, otherwise
+            # poll everything
+            pushed, self._pushed = self._pushed, set()
+            by_account: Dict[int, List[int]] = {}
+            for run_id, run in self._runs.items():
+                if pushed and run_id not in pushed:
+                    continue
+
+                by_account.setdefault(run["data"]["account_id"], []).append(run_id)
+
+        completed = []
+        for account_id, run_ids in by_account.items():
+            # A single tracked run is cheaper to fetch directly
+            in_progress = (
+                self._in_progress_run_ids(account_id)
+                if len(run_ids) > 1 and not pushed
+                else set()
+            )
+            for run_id in run_ids:
+                if run_id in in_progress:
+                    continue
+
+                run = self._client.get_run(account_id, run_id)
+                if run["data"]["status"] not in TERMINAL_STATUSES:
+                    continue
+
+                elapsed = time.time() - self._started.get(run_id, time.time())
+                self._client.console.log(
+                    self._client._run_status_formatted(run, elapsed)
+                )
+                self.remove(run_id)
+                completed.append(run)
+
+        return completed
+
+
+class RunFuture(concurrent.futures.Future):
+    """The eventual result of a triggered run.
+
+    `result()` returns the final run response (the same dictionary `trigger_job`
+    returns after polling).  Because this is a `concurrent.futures.Future`, it can
+    also be used with `concurrent.futures.wait` and `as_completed`.
+
+    Args:
+        account_id (int): Numeric ID of the account
+        job_id (int): Numeric ID of the triggered job
+        retries (int, optional): Number of times to retry a failed run from the
+            point of failure
+    """
+
+    def __init__(self, account_id: int, job_id: int, *, retries: int = 0):
+        super().__init__()
+        self.account_id = account_id
+        self.job_id = job_id
+        self.retries_left = retries
+        self.run: Optional[Dict] = None
+
+    @property
+    def run_id(self) -> Optional[int]:
+        """Numeric ID of the most recent run triggered for this future"""
+        try:
+            return self.run["data"]["id"]  # type: ignore[index]
+        except (KeyError, TypeError):
+            return None
+
+
+class BackgroundRunPoller(RunPoller):
+    """Resolve `RunFuture` objects from a single background thread.
+
+    The thread is started when the first run is submitted and exits once there is
+    nothing left to track, so an idle client holds no threads.
+
+    Args:
+        client (_AdminClient): Admin client used to make requests
+        poll_interval (int, optional): Number of seconds to wait in between
+            polling
+    """
+
+    def __init__(self, client, *, poll_interval: int = 10):
+        super().__init__(client, poll_interval=poll_interval)
+        self._futures: Dict[int, RunFuture] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(
+        self, future: RunFuture, run: Dict, *, poll_interval: int = None
+    ) -> RunFuture:
+        """Track `run` and resolve `future` with its final state.
+
+        Args:
+            future (RunFuture): Future to resolve when the run completes
+            run (dict): Response returned when triggering the run
+            poll_interval (int, optional): Number of seconds to wait in between
+                polling.  The shared thread polls at the shortest interval
+                requested by any outstanding run.
+        """
+        future.run = run
+        with self._lock:
+            self._futures[self.add(run)] = future
+            if self._thread is None:
+                if poll_interval is not None:
+                    self.poll_interval = poll_interval
+                self._thread = threading.Thread(
+                    target=self._loop, name="dbtc-run-poller", daemon=True
+                )
+                self._thread.start()
+            elif poll_interval is not None:
+                self.poll_interval = min(self.poll_interval, poll_interval)
+        return future
+
+    def _resolve(self, run: Dict):
+        with self._lock:
+            future = self._futures.pop(run["data"]["id"])
+        future.run = run
+        if run["data"]["status"] == JobRunStatus.ERROR and future.retries_left > 0:
+            future.retries_left -= 1
+            self._client.console.log(
+                f"Retrying job {future.job_id} after failure.  Retries left: "
+                f"{future.retries_left}"
+            )
+            # The future is no longer tracked, so it has to be failed here
+            try:
+                rerun = self._client.trigger_job_from_failure(
+                    future.account_id, future.job_id, should_poll=False
+                )
+            except Exception as e:
+                future.set_exception(e)
+                return
+
+            if rerun.get("data"):
+                self.submit(future, rerun)
+                return
+
+            run = rerun
+
+        future.set_result(run)
+
+    def _loop(self):
+        while True:
+            self.wait()
+            try:
+                for run in self.poll():
+                    self._resolve(run)
+            except Exception as e:
+                with self._lock:
+                    futures = list(self._futures.values())
+                    self._futures.clear()
+                    self._runs.clear()
+                    self._thread = None
+                for future in futures:
+                    future.set_exception(e)
+                return
+
+            with self._lock:
+                if not self._runs:
+                    self._thread = None
+                    return
+
+
+def as_completed(
+    futures: Iterable[RunFuture], timeout: float = None
+) -> Iterator[RunFuture]:
+    """Yield futures as their runs complete.
+
+    Args:
+        futures (Iterable[RunFuture]): Futures returned from `trigger_job_async`
+        timeout (float, optional): Max number of seconds to wait overall.  Raises
+            `TimeoutError` if runs are still in progress after that.
+    """
+    return concurrent.futures.as_completed(futures, timeout=timeout)
+
+
+def wait_all(
+    futures: Iterable[RunFuture], timeout: float = None
+) -> Tuple[Set[RunFuture], Set[RunFuture]]:
+    """Wait for all runs to complete.
+
+    Args:
+        futures (Iterable[RunFuture]): Futures returned from `trigger_job_async`
+        timeout (float, optional): Max number of seconds to wait
+
+    Returns:
+        Tuple[Set[RunFuture], Set[RunFuture]]: The completed and the still pending
+            futures
+    """
+    done, not_done = concurrent.futures.wait(futures, timeout=timeout)
+    return done, not_done
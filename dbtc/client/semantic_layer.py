@@ -4,6 +4,7 @@ from typing import Dict, List, Optional, Union
 
 # first party
 from dbtc.client.base import _Client
+from dbtc.instrumentation import graphql_operation
 from dbtc.models import semantic_layer as sl_models
 
 MULTI_TENANT_HOSTS = [
@@ -21,6 +22,8 @@ class OutputFormatType(Enum):
 
 
 class _SemanticLayerClient(_Client):
+    _client_name = "sl"
+
     QUERIES = {
         "entities": """
 query GetEntities($environmentId: BigInt!, $metrics: [MetricInput!]!) {
@@ -409,17 +412,20 @@ query GetMeasures($environmentId: BigInt!, $metrics: [MetricInput!]!) {
 
     def _poll_for_results(self, payload: Dict) -> List[sl_models.QueryResponse]:
         responses = []
+        endpoint = f"{self._path}/{graphql_operation(payload['query'])}"
         while True:
-            json_response = self.make_request(payload)
-            try:
-                data = json_response["data"]["query"]
-            except TypeError:
-                error = json_response["errors"][0]["message"]
-                raise ValueError(error)
-            else:
+            with self._instrument("post", endpoint) as event:
+                json_response = self.make_request(payload)
+                try:
+                    data = json_response["data"]["query"]
+                except TypeError:
+                    error = json_response["errors"][0]["message"]
+                    raise ValueError(error)
+
                 status = data["status"].lower()
                 if status in ["successful", "failed"]:
-                    responses.append(sl_models.QueryPage(**data))
+                    with event.timer("validation_time"):
+                        responses.append(sl_models.QueryPage(**data))
                     if (
                         data["totalPages"]
                         and data["totalPages"] > payload["variables"]["pageNum"]
@@ -434,9 +440,12 @@ query GetMeasures($environmentId: BigInt!, $metrics: [MetricInput!]!) {
         if "variables" not in payload:
             payload["variables"] = {}
         payload["variables"]["environmentId"] = self.environment_id
-        response = self.session.post(self.full_url(), json=payload)
-        response.raise_for_status()
-        return response.json()
+        endpoint = f"{self._path}/{graphql_operation(payload['query'])}"
+        with self._instrument("post", endpoint) as event:
+            response = self._post_graphql(payload)
+            response.raise_for_status()
+            with event.timer("decode_time"):
+                return response.json()
 
     def list_dimensions(self, metrics: List[str]) -> Dict:
         return self.make_request(
@@ -0,0 +1,301 @@
+# stdlib
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# third party
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+# first party
+from dbtc.client.catalog import (
+    applied_query,
+    fetch_applied,
+    fetch_changed,
+    fetch_last_updated_at,
+)
+from dbtc.utils import write_atomic, write_json_atomic
+
+__all__ = ["EnvironmentSnapshot", "SNAPSHOT_QUERIES"]
+
+_COLUMNS = "catalog { columns { name description type } }"
+
+
+def _query(field: str, fields: str, filter_type: str = None) -> str:
+    return applied_query(field, fields, filter_type, operation="Snapshot")
+
+
+_COMMON = "uniqueId name description resourceType tags filePath packageName"
+
+# Paginated applied state query used to snapshot each resource type
+SNAPSHOT_QUERIES = {
+    "Model": _query(
+        "models",
+        f"{_COMMON} database schema alias access materializedType rawCode "
+        "compiledCode executionInfo { lastRunGeneratedAt lastRunStatus "
+        f"executeCompletedAt executionTime }} {_COLUMNS}",
+        "ModelAppliedFilter",
+    ),
+    "Source": _query(
+        "sources",
+        f"{_COMMON} sourceName database schema identifier "
+        f"freshness {{ maxLoadedAt freshnessStatus }} {_COLUMNS}",
+    ),
+    "Test": _query(
+        "tests",
+        f"{_COMMON} columnName executionInfo {{ lastRunGeneratedAt lastRunStatus "
+        "lastRunError }",
+        "TestAppliedFilter",
+    ),
+    "Exposure": _query(
+        "exposures", f"{_COMMON} exposureType maturity ownerName ownerEmail url"
+    ),
+}
+
+# Lightweight queries listing the run that last generated each resource, so only
+# resources generated by a newer run are fetched in full.  Resource types without
+# one are small enough to fetch in full every time.
+VERSION_QUERIES = {
+    "Model": _query("models", "uniqueId executionInfo { lastRunGeneratedAt }"),
+    "Test": _query("tests", "uniqueId executionInfo { lastRunGeneratedAt }"),
+}
+
+_SCHEMA = pa.schema(
+    [
+        ("unique_id", pa.string()),
+        ("version", pa.string()),
+        ("checksum", pa.string()),
+        ("node", pa.string()),
+    ]
+)
+
+
+def _version(node: Dict) -> Optional[str]:
+    return (node.get("executionInfo") or {}).get("lastRunGeneratedAt")
+
+
+# Fields that change whenever a resource is run or checked, not when it's changed
+_RUN_FIELDS = ("executionInfo", "freshness")
+
+
+def _checksum(node: Dict) -> str:
+    """Checksum of a node's definition, ignoring when and how it last ran"""
+    definition = {k: v for k, v in node.items() if k not in _RUN_FIELDS}
+    return hashlib.sha1(
+        json.dumps(definition, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+class EnvironmentSnapshot:
+    """Local, incrementally updated copy of an environment's applied state
+
+    Each resource type is stored in a Parquet file in `store`, with a row per
+    resource holding its unique id, the time the run that generated it finished,
+    a checksum of its definition, and the resource itself as JSON.  The first
+    `sync` fetches every resource.  Later ones do nothing if the environment's
+    applied state hasn't been updated; otherwise they list when each model and
+    test was last generated and fetch only those that are new or were generated
+    by a newer run.
+
+    Args:
+        client (_MetadataClient): Metadata client used to make requests
+        environment_id (int): The environment id
+        store (str): Directory the snapshot is stored in
+        resource_types (List[str], optional): Resource types to snapshot.
+            Defaults to every type in `SNAPSHOT_QUERIES`.
+        first (int, optional): Number of resources retrieved per request
+        max_workers (int, optional): Max number of requests made at once
+    """
+
+    def __init__(
+        self,
+        client,
+        environment_id: int,
+        store: str,
+        *,
+        resource_types: List[str] = None,
+        first: int = 500,
+        max_workers: int = 5,
+    ):
+        resource_types = resource_types or list(SNAPSHOT_QUERIES)
+        unsupported = [t for t in resource_types if t not in SNAPSHOT_QUERIES]
+        if unsupported:
+            raise ValueError(
+                f"resource_types must be one of {', '.join(SNAPSHOT_QUERIES)}"
+            )
+
+        self._client = client
+        self.environment_id = environment_id
+        self.store = store
+        self.resource_types = resource_types
+        self.first = first
+        self.max_workers = max_workers
+        os.makedirs(store, exist_ok=True)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.store, name)
+
+    def _read_state(self) -> Dict:
+        try:
+            with open(self._path("state.json")) as f:
+                return json.load(f)
+
+        except (OSError, ValueError):
+            return {}
+
+    def _fetch(self, resource_type: str) -> List[Dict]:
+        return fetch_applied(
+            self._client,
+            SNAPSHOT_QUERIES[resource_type],
+            self.environment_id,
+            first=self.first,
+        )
+
+    def table(self, resource_type: str) -> Optional[pa.Table]:
+        """The stored snapshot of a resource type, or None before its first sync"""
+        path = self._path(f"{resource_type}.parquet")
+        if not os.path.exists(path):
+            return None
+
+        return pq.read_table(path)
+
+    def nodes(self, resource_type: str = None) -> Iterator[Dict]:
+        """Every stored resource, or every resource of one type
+
+        Args:
+            resource_type (str, optional): Resource type to read.  Defaults to every
+                type in the snapshot.
+        """
+        for current in [resource_type] if resource_type else self.resource_types:
+            table = self.table(current)
+            for node in table.column("node").to_pylist() if table is not None else []:
+                yield json.loads(node)
+
+    def _stored(self, resource_type: str) -> Dict[str, Tuple[str, str]]:
+        path = self._path(f"{resource_type}.parquet")
+        if not os.path.exists(path):
+            return {}
+
+        table = pq.read_table(path, columns=["unique_id", "version", "checksum"])
+        return {
+            unique_id: (version, checksum)
+            for unique_id, version, checksum in zip(
+                *(table.column(name).to_pylist() for name in table.column_names)
+            )
+        }
+
+    def _changes(
+        self, resource_type: str
+    ) -> Tuple[List[str], Dict[str, Dict], Dict[str, str], Dict[str, List[str]]]:
+        """Stored resources to keep, resources to store with their checksums, and
+        the unique ids that were added, removed, and modified
+        """
+        stored = self._stored(resource_type)
+        current: Set[str]
+        if resource_type in VERSION_QUERIES and stored:
+            current, nodes = fetch_changed(
+                self._client,
+                SNAPSHOT_QUERIES[resource_type],
+                VERSION_QUERIES[resource_type],
+                self.environment_id,
+                {unique_id: version for unique_id, (version, _) in stored.items()},
+                first=self.first,
+                max_workers=self.max_workers,
+            )
+        else:
+            nodes = self._fetch(resource_type)
+            current = {node["uniqueId"] for node in nodes}
+
+        rows = {node["uniqueId"]: node for node in nodes}
+        checksums = {unique_id: _checksum(node) for unique_id, node in rows.items()}
+        keep = [u for u in stored if u in current and u not in rows]
+        return (
+            keep,
+            rows,
+            checksums,
+            {
+                "added": [u for u in rows if u not in stored],
+                "removed": [u for u in stored if u not in current],
+                "modified": [
+                    u for u in rows if u in stored and stored[u][1] != checksums[u]
+                ],
+            },
+        )
+
+    def _store(
+        self,
+        resource_type: str,
+        keep: Iterable[str],
+        rows: Dict[str, Dict],
+        checksums: Dict[str, str],
+    ):
+        new = pa.table(
+            {
+                "unique_id": list(rows),
+                "version": [_version(node) for node in rows.values()],
+                "checksum": [checksums[unique_id] for unique_id in rows],
+                "node": [json.dumps(node) for node in rows.values()],
+            },
+            schema=_SCHEMA,
+        )
+        tables = [new]
+        existing = self.table(resource_type)
+        if existing is not None:
+            value_set = pa.array(list(keep), pa.string())
+            tables.insert(
+                0, existing.filter(pc.is_in(existing["unique_id"], value_set))
+            )
+        table = pa.concat_tables(tables)
+        # A failed sync never leaves a partially written snapshot
+        write_atomic(
+            self._path(f"{resource_type}.parquet"),
+            lambda path: pq.write_table(table, path),
+        )
+
+    def sync(self, *, force: bool = False) -> Dict[str, List[str]]:
+        """Bring the snapshot up to date with the environment's applied state
+
+        Args:
+            force (bool, optional): Check every resource even if the environment's
+                applied state hasn't been updated.  Defaults to False.
+
+        Returns:
+            Dict[str, List[str]]: Unique ids of the resources that were `added`,
+                `removed`, and `modified` since the last sync.  A resource is
+                modified when its definition changes, not when it's simply run
+                again.  Nothing is stored unless every resource type was fetched.
+        """
+        last_updated_at = fetch_last_updated_at(self._client, self.environment_id)
+        state = self._read_state()
+        diff: Dict[str, List[str]] = {"added": [], "removed": [], "modified": []}
+        if (
+            not force
+            and last_updated_at is not None
+            and state.get("last_updated_at") == last_updated_at
+            and set(self.resource_types) <= set(state.get("resource_types") or [])
+        ):
+            return diff
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            changes = list(executor.map(self._changes, self.resource_types))
+        # Only written once every resource type has been fetched, so a failed sync
+        # leaves the whole snapshot as it was and the next one reports its changes
+        for resource_type, (keep, rows, checksums, changed) in zip(
+            self.resource_types, changes
+        ):
+            self._store(resource_type, keep, rows, checksums)
+            for key, unique_ids in changed.items():
+                diff[key].extend(unique_ids)
+
+        state = {
+            "environment_id": self.environment_id,
+            "last_updated_at": last_updated_at,
+            "resource_types": sorted(
+                set(self.resource_types) | set(state.get("resource_types") or [])
+            ),
+        }
+        write_json_atomic(self._path("state.json"), state)
+        return {key: sorted(unique_ids) for key, unique_ids in diff.items()}
@@ -0,0 +1,187 @@
+# stdlib
+import hashlib
+import hmac
+import json
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterable, List, Optional, Set
+
+# third party
+from pydantic import ValidationError
+
+# first party
+from dbtc.console import err_console
+from dbtc.models import WebhookEvent
+
+# Completed run events kept around for waiters that haven't asked for them yet
+MAX_PENDING_EVENTS = 10_000
+
+
+class WebhookReceiver:
+    """Embeddable HTTP server that turns dbt Cloud webhook deliveries into run events
+
+    Each delivery is verified against the webhook's secret: dbt Cloud sends the
+    HMAC-SHA256 hex digest of the raw request body in the `Authorization` header.
+    Deliveries that fail verification are rejected with a 401.
+
+    Attach the receiver to a client with `client.cloud.webhook_receiver = receiver`
+    (or use `start_webhook_receiver`), and anything waiting on a run, e.g.
+    `trigger_job`, `trigger_job_async`, or `trigger_job_dag`, will finish as soon as
+    the `job.run.completed` or `job.run.errored` event arrives.  Polling is used as a
+    fallback when no event has arrived within `fallback_interval` seconds.
+
+    Args:
+        hmac_secret (str): Secret returned when the webhook subscription was created
+        host (str, optional): Interface to listen on
+        port (int, optional): Port to listen on.  Use 0 to pick a free port.
+        fallback_interval (int, optional): Number of seconds to wait for an event
+            before polling the run instead
+    """
+
+    def __init__(
+        self,
+        hmac_secret: str,
+        *,
+        host: str = "0.0.0.0",
+        port: int = 8080,
+        fallback_interval: int = 60,
+    ):
+        self._secret = hmac_secret
+        self.fallback_interval = fallback_interval
+        self.console = err_console
+        self._listeners: List[Callable[[WebhookEvent], None]] = []
+        self._completed: "OrderedDict[int, WebhookEvent]" = OrderedDict()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def _handler_class(self):
+        receiver = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                status = receiver._handle(body, self.headers.get("Authorization"))
+                self.send_response(status)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        return _Handler
+
+    def verify(self, body: bytes, signature: Optional[str]) -> bool:
+        """Check the `Authorization` header sent with a delivery.
+
+        Args:
+            body (bytes): Raw request body
+            signature (str): Value of the `Authorization` header
+        """
+        if not signature:
+            return False
+
+        return hmac.compare_digest(sign(self._secret, body), signature)
+
+    def _handle(self, body: bytes, signature: Optional[str]) -> int:
+        if not self.verify(body, signature):
+            return 401
+
+        try:
+            event = WebhookEvent(**json.loads(body))
+        except (ValueError, TypeError, ValidationError):
+            return 400
+
+        self.publish(event)
+        return 200
+
+    def add_listener(self, callback: Callable[[WebhookEvent], None]):
+        """Call `callback` with every verified event.
+
+        Callbacks run on the server's request thread, so they should return quickly.
+
+        Args:
+            callback (Callable): Function accepting a `WebhookEvent`
+        """
+        self._listeners.append(callback)
+
+    def publish(self, event: WebhookEvent):
+        """Dispatch an event to listeners and wake anything waiting on its run.
+
+        Args:
+            event (WebhookEvent): Event received from dbt Cloud
+        """
+        if event.is_complete:
+            with self._condition:
+                self._completed[event.data.runId] = event
+                while len(self._completed) > MAX_PENDING_EVENTS:
+                    self._completed.popitem(last=False)
+                self._condition.notify_all()
+
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                self.console.log(f"Webhook listener raised an exception: {e}")
+
+    def wait_for(
+        self, run_ids: Callable[[], Iterable[int]], timeout: float = None
+    ) -> Set[int]:
+        """Block until a completion event arrives for any of the given runs.
+
+        Args:
+            run_ids (Callable): Returns the run IDs currently being waited on.  It's
+                re-evaluated whenever an event arrives, so runs added while waiting
+                are picked up.
+            timeout (float, optional): Max number of seconds to wait.  Defaults to
+                `fallback_interval`.
+
+        Returns:
+            Set[int]: Run IDs that have completed.  Their events are consumed, so an
+                empty set means the wait timed out and the caller should poll.
+        """
+        timeout = self.fallback_interval if timeout is None else timeout
+
+        def completed() -> Set[int]:
+            return {run_id for run_id in run_ids() if run_id in self._completed}
+
+        with self._condition:
+            self._condition.wait_for(completed, timeout)
+            done = completed()
+            for run_id in done:
+                del self._completed[run_id]
+        return done
+
+    def start(self) -> "WebhookReceiver":
+        """Start serving in a background thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="dbtc-webhooks", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port"""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+
+def sign(hmac_secret: str, body: bytes) -> str:
+    """Compute the `Authorization` header dbt Cloud sends with a webhook delivery"""
+    return hmac.new(hmac_secret.encode(), body, hashlib.sha256).hexdigest()
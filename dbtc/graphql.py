@@ -0,0 +1,610 @@
+# stdlib
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+__all__ = [
+    "Field",
+    "Operation",
+    "PagePaths",
+    "PreparedQuery",
+    "batch_document",
+    "child",
+    "count_fields",
+    "encode_payload",
+    "ensure_page_info",
+    "find_connection",
+    "lookup",
+    "normalize",
+    "page_paths",
+    "parse_operation",
+    "parse_selections",
+    "persisted_payload",
+    "prepare",
+    "split_batch_response",
+]
+
+_TOKEN = re.compile(
+    r"""
+    (?P<ignored>[\s,]+|\#[^\n]*)
+    | (?P<block_string>\"\"\"(?:\\\"\"\"|[^\"]|\"(?!\"\"))*\"\"\")
+    | (?P<string>"(?:\\.|[^"\\])*")
+    | (?P<spread>\.\.\.)
+    | (?P<name>[_A-Za-z][_0-9A-Za-z]*)
+    | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+    | (?P<punctuator>[!$&()\:=@\[\]{|}])
+    """,
+    re.VERBOSE,
+)
+
+
+@dataclass
+class Field:
+    """A field selected in a GraphQL document
+
+    Attributes:
+        name (str): Name of the field in the schema
+        alias (str): Alias given to the field, if any
+        selections (List[Field]): Fields selected within this one, with fragments
+            already expanded
+        arguments (Dict[str, str]): Source of the value passed to each argument,
+            e.g. `$after` for a variable
+    """
+
+    name: str
+    alias: Optional[str] = None
+    selections: List["Field"] = field(default_factory=list)
+    arguments: Dict[str, str] = field(default_factory=dict, compare=False)
+
+    @property
+    def key(self) -> str:
+        """Key of this field in the response"""
+        return self.alias or self.name
+
+
+@dataclass(frozen=True)
+class PagePaths:
+    """Where the pagination details of a paginated query are found in its response
+
+    Attributes:
+        page_info (Tuple[str, ...]): Keys leading to the connection's `pageInfo`
+        items (Tuple[str, ...]): Keys leading to the connection's list of `edges`
+            or `nodes`, if either is selected
+    """
+
+    page_info: Tuple[str, ...]
+    items: Optional[Tuple[str, ...]]
+
+
+def _tokenize(document: str) -> Iterator[str]:
+    position = 0
+    while position < len(document):
+        match = _TOKEN.match(document, position)
+        if match is None:
+            raise ValueError(
+                f"Unexpected character {document[position]!r} at position {position}"
+            )
+
+        position = match.end()
+        if match.lastgroup != "ignored":
+            yield match.group()
+
+
+class _Parser:
+    def __init__(self, document: str):
+        self.tokens = list(_tokenize(document))
+        self.position = 0
+
+    def peek(self, offset: int = 0) -> Optional[str]:
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def next(self) -> str:
+        token = self.peek()
+        if token is None:
+            raise ValueError("Unexpected end of GraphQL document")
+
+        self.position += 1
+        return token
+
+    def expect(self, expected: str):
+        token = self.next()
+        if token != expected:
+            raise ValueError(f"Expected {expected!r} but found {token!r}")
+
+    def skip_balanced(self, opening: str, closing: str):
+        self.expect(opening)
+        depth = 1
+        while depth:
+            token = self.next()
+            if token == opening:
+                depth += 1
+            elif token == closing:
+                depth -= 1
+
+    def skip_directives(self):
+        while self.peek() == "@":
+            self.next()
+            self.next()
+            if self.peek() == "(":
+                self.skip_balanced("(", ")")
+
+    def value(self):
+        token = self.peek()
+        if token == "$":
+            self.next()
+            self.next()
+        elif token == "[":
+            self.skip_balanced("[", "]")
+        elif token == "{":
+            self.skip_balanced("{", "}")
+        else:
+            self.next()
+
+    def arguments(self) -> Dict[str, str]:
+        self.expect("(")
+        arguments = {}
+        while self.peek() != ")":
+            name = self.next()
+            self.expect(":")
+            start = self.position
+            self.value()
+            arguments[name] = _join(self.tokens[start : self.position])
+        self.next()
+        return arguments
+
+    def definitions(self) -> Tuple[List[List[Any]], Dict[str, List[Any]]]:
+        """Raw selection sets of each operation, and of each fragment by name"""
+        operations: List[List[Any]] = []
+        fragments: Dict[str, List[Any]] = {}
+        while self.peek() is not None:
+            token = self.peek()
+            if token == "{":
+                operations.append(self.selection_set())
+            elif token == "fragment":
+                self.next()
+                name = self.next()
+                self.expect("on")
+                self.next()
+                self.skip_directives()
+                fragments[name] = self.selection_set()
+            elif token in ("query", "mutation", "subscription"):
+                self.next()
+                while self.peek() not in ("{", "(", "@"):
+                    self.next()
+                if self.peek() == "(":
+                    self.skip_balanced("(", ")")
+                self.skip_directives()
+                operations.append(self.selection_set())
+            else:
+                raise ValueError(f"Unexpected token {token!r}")
+        return operations, fragments
+
+    def selection_set(self) -> List[Any]:
+        """Selections are `Field`s, fragment names, or nested lists for fragments"""
+        self.expect("{")
+        selections: List[Any] = []
+        while self.peek() != "}":
+            if self.peek() == "...":
+                self.next()
+                if self.peek() == "on":
+                    self.next()
+                    self.next()
+                if self.peek() in ("{", "@"):
+                    self.skip_directives()
+                    selections.append(self.selection_set())
+                else:
+                    selections.append(self.next())
+                    self.skip_directives()
+                continue
+
+            name = self.next()
+            alias = None
+            if self.peek() == ":":
+                self.next()
+                alias, name = name, self.next()
+            arguments = self.arguments() if self.peek() == "(" else {}
+            self.skip_directives()
+            children = self.selection_set() if self.peek() == "{" else []
+            selections.append((name, alias, children, arguments))
+        self.next()
+        return selections
+
+
+def _expand(raw: List[Any], fragments: Dict[str, List[Any]]) -> List[Field]:
+    expanded: List[Field] = []
+    for selection in raw:
+        if isinstance(selection, str):
+            if selection in fragments:
+                expanded.extend(_expand(fragments[selection], fragments))
+        elif isinstance(selection, list):
+            expanded.extend(_expand(selection, fragments))
+        else:
+            name, alias, children, arguments = selection
+            expanded.append(Field(name, alias, _expand(children, fragments), arguments))
+    return expanded
+
+
+@lru_cache(maxsize=256)
+def parse_selections(document: str) -> Tuple[Field, ...]:
+    """Top-level fields selected by the first operation in a GraphQL document
+
+    Variables and directives are skipped, and arguments are kept as source text;
+    fragment spreads and inline fragments are expanded in place.  Results are
+    cached per document.
+
+    Raises:
+        ValueError: If the document can't be parsed
+    """
+    operations, fragments = _Parser(document).definitions()
+    if not operations:
+        raise ValueError("GraphQL document does not contain an operation")
+
+    return tuple(_expand(operations[0], fragments))
+
+
+@dataclass(frozen=True)
+class Operation:
+    """The type and variables of the first operation in a GraphQL document
+
+    Attributes:
+        type (str): One of "query", "mutation", or "subscription"
+        variables (Dict[str, Tuple[str, bool]]): Type of each variable the
+            operation defines, e.g. `[String!]!`, and whether it has a default
+        used (Tuple[str, ...]): Variables referenced anywhere in the document
+    """
+
+    type: str
+    variables: Dict[str, Tuple[str, bool]]
+    used: Tuple[str, ...]
+
+
+@lru_cache(maxsize=256)
+def parse_operation(document: str) -> Operation:
+    """The type and variables of the first operation in a GraphQL document
+
+    Raises:
+        ValueError: If the document can't be parsed
+    """
+    parser = _Parser(document)
+    operation_type = "query"
+    definitions: Dict[str, List[str]] = {}
+    # Position of the variable definitions, which aren't uses of the variables
+    header = (0, 0)
+    while parser.peek() == "fragment":
+        parser.next()
+        parser.next()
+        parser.expect("on")
+        parser.next()
+        parser.skip_directives()
+        parser.skip_balanced("{", "}")
+    if parser.peek() in ("query", "mutation", "subscription"):
+        operation_type = parser.next()
+        if parser.peek() not in ("(", "{", "@"):
+            parser.next()
+        if parser.peek() == "(":
+            start = parser.position
+            parser.skip_balanced("(", ")")
+            header = (start, parser.position)
+            definitions = _split_variable_definitions(
+                parser.tokens[start + 1 : parser.position - 1]
+            )
+    body = parser.tokens[: header[0]] + parser.tokens[header[1] :]
+
+    variables = {}
+    for name, tokens in definitions.items():
+        # Tokens are `$ name : Type` optionally followed by `= default`
+        default = tokens.index("=") if "=" in tokens else len(tokens)
+        variables[name] = (_join(tokens[3:default]).replace(" ", ""), "=" in tokens)
+    used = tuple(
+        dict.fromkeys(
+            token for previous, token in zip([""] + body, body) if previous == "$"
+        )
+    )
+    return Operation(operation_type, variables, used)
+
+
+def child(selection: Field, name: str) -> Optional[Field]:
+    """The first selection of a field named `name`, or None"""
+    return next(
+        (selected for selected in selection.selections if selected.name == name), None
+    )
+
+
+def find_connection(
+    selections: List[Field], path: Tuple[str, ...]
+) -> Optional[Tuple[Tuple[str, ...], Field]]:
+    """The first field selecting `pageInfo`, in document order, and its path
+
+    Args:
+        selections (List[Field]): Selections to search, e.g. from
+            `parse_selections`
+        path (Tuple[str, ...]): Path of the selections, prefixed to the result
+    """
+    for selection in selections:
+        if child(selection, "pageInfo") is not None:
+            return path + (selection.key,), selection
+
+        found = find_connection(selection.selections, path + (selection.key,))
+        if found is not None:
+            return found
+
+    return None
+
+
+@lru_cache(maxsize=256)
+def page_paths(document: str) -> Optional[PagePaths]:
+    """Paths to the first connection selecting `pageInfo`, in document order
+
+    Returns None when the document can't be parsed or nothing selects `pageInfo`.
+    Results are cached per document.
+    """
+    try:
+        selections = parse_selections(document)
+    except ValueError:
+        return None
+
+    found = find_connection(list(selections), ("data",))
+    if found is None:
+        return None
+
+    path, connection = found
+    items = child(connection, "edges") or child(connection, "nodes")
+    return PagePaths(
+        page_info=path + (child(connection, "pageInfo").key,),  # type: ignore[union-attr]
+        items=path + (items.key,) if items is not None else None,
+    )
+
+
+def ensure_page_info(document: str, connection: str) -> str:
+    """Select `pageInfo` within the first field named `connection`, if needed
+
+    Documents that already select `pageInfo` somewhere, that don't select
+    `connection`, or that don't define an `$after` variable to paginate with are
+    returned unchanged.
+    """
+    if page_paths(document) is not None:
+        return document
+
+    try:
+        if "after" not in parse_operation(document).variables:
+            return document
+
+    except ValueError:
+        return document
+
+    match = re.search(rf"\b{connection}\s*(?:\([^)]*\))?\s*{{", document)
+    if match is None:
+        return document
+
+    return (
+        f"{document[: match.end()]} pageInfo {{ endCursor hasNextPage }}"
+        f"{document[match.end() :]}"
+    )
+
+
+def lookup(data: Any, path: Tuple[str, ...]) -> Any:
+    """Follow `path` through nested dictionaries, returning None if it's missing"""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+
+        data = data.get(key)
+    return data
+
+
+def count_fields(document: str) -> int:
+    """Number of fields selected by a document, a rough measure of its complexity"""
+
+    def count(selections) -> int:
+        return sum(1 + count(selection.selections) for selection in selections)
+
+    return count(parse_selections(document))
+
+
+def _split_variable_definitions(tokens: List[str]) -> Dict[str, List[str]]:
+    definitions: Dict[str, List[str]] = {}
+    current: List[str] = []
+    depth = 0
+    for token in tokens:
+        if token == "$" and depth == 0:
+            current = [token]
+        else:
+            current.append(token)
+        if token in ("(", "["):
+            depth += 1
+        elif token in (")", "]"):
+            depth -= 1
+        if len(current) == 2:
+            definitions[current[1]] = current
+    return definitions
+
+
+def _top_level_fields(parser: _Parser) -> List[Tuple[str, List[str]]]:
+    parser.expect("{")
+    fields = []
+    while parser.peek() != "}":
+        start = parser.position
+        if parser.peek() == "...":
+            raise ValueError("Fragments can't be used at the top level of a batch")
+
+        key = parser.next()
+        if parser.peek() == ":":
+            parser.next()
+            parser.next()
+        if parser.peek() == "(":
+            parser.skip_balanced("(", ")")
+        parser.skip_directives()
+        if parser.peek() == "{":
+            parser.skip_balanced("{", "}")
+        fields.append((key, parser.tokens[start : parser.position]))
+    return fields
+
+
+def _join(tokens: List[str]) -> str:
+    joined = []
+    for previous, token in zip([""] + tokens, tokens):
+        joined.append(token if previous == "$" or not joined else f" {token}")
+    return "".join(joined)
+
+
+@lru_cache(maxsize=256)
+def normalize(document: str) -> str:
+    """The document with comments and insignificant whitespace and commas removed
+
+    Documents that only differ in formatting normalize to the same string.
+
+    Raises:
+        ValueError: If the document contains an unexpected character
+    """
+    return _join(list(_tokenize(document)))
+
+
+@lru_cache(maxsize=256)
+def batch_document(
+    document: str, count: int, per_call: Tuple[str, ...]
+) -> Tuple[str, Tuple[str, ...]]:
+    """Merge `count` copies of a query into one document using aliases
+
+    Each copy's top-level fields are aliased `m{i}` (or `m{i}_{key}` when the query
+    selects several), and the variables in `per_call` are renamed `{name}_{i}`;
+    every other variable is shared by all copies.
+
+    Returns:
+        Tuple[str, Tuple[str, ...]]: The merged document and the response keys of
+            the original query's top-level fields
+
+    Raises:
+        ValueError: If the document isn't a single query operation
+    """
+    parser = _Parser(document)
+    if parser.peek() != "query":
+        raise ValueError("Only query operations can be batched")
+
+    parser.next()
+    if parser.peek() not in ("(", "{", "@"):
+        parser.next()
+    definitions: Dict[str, List[str]] = {}
+    if parser.peek() == "(":
+        start = parser.position
+        parser.skip_balanced("(", ")")
+        definitions = _split_variable_definitions(
+            parser.tokens[start + 1 : parser.position - 1]
+        )
+    parser.skip_directives()
+    fields = _top_level_fields(parser)
+    parser.next()
+    if parser.peek() is not None:
+        raise ValueError("Only documents with a single operation can be batched")
+
+    def rename(tokens: List[str], i: int) -> List[str]:
+        return [
+            f"{token}_{i}" if token in per_call and previous == "$" else token
+            for previous, token in zip([""] + tokens, tokens)
+        ]
+
+    variables = [
+        token
+        for name, tokens in definitions.items()
+        if name not in per_call
+        for token in tokens
+    ]
+    selections = []
+    for i in range(count):
+        variables += [
+            token
+            for name, tokens in definitions.items()
+            if name in per_call
+            for token in rename(tokens, i)
+        ]
+        for key, tokens in fields:
+            alias = f"m{i}" if len(fields) == 1 else f"m{i}_{key}"
+            # An alias is replaced rather than aliased again
+            tokens = tokens[2:] if len(tokens) > 1 and tokens[1] == ":" else tokens
+            selections += [alias, ":"] + rename(tokens, i)
+
+    header = f"query Batch({_join(variables)})" if variables else "query Batch"
+    merged = f"{header} {{ {_join(selections)} }}"
+    return merged, tuple(key for key, _ in fields)
+
+
+def split_batch_response(response: Dict, count: int, keys: Tuple[str, ...]) -> List:
+    """Split the response to a `batch_document` into one response per copy
+
+    Each response has the same shape as if its query had been sent on its own.
+    Errors are given to the copy named by their `path`, or to every copy if they
+    don't have one.
+    """
+
+    def alias(i: int, key: str) -> str:
+        return f"m{i}" if len(keys) == 1 else f"m{i}_{key}"
+
+    data = response.get("data") or {}
+    results: List[Dict] = [
+        {"data": {key: data.get(alias(i, key)) for key in keys}} for i in range(count)
+    ]
+    owners = {alias(i, key): (i, key) for i in range(count) for key in keys}
+    for error in response.get("errors") or []:
+        path = error.get("path") or []
+        if path and path[0] in owners:
+            i, key = owners[path[0]]
+            targets = [(i, {**error, "path": [key] + path[1:]})]
+        else:
+            targets = [(i, error) for i in range(count)]
+        for i, routed in targets:
+            results[i].setdefault("errors", []).append(routed)
+    return results
+
+
+class PreparedQuery:
+    """A query serialized once, so it can be spliced into every request body
+
+    Attributes:
+        query (str): The query
+        encoded (bytes): The query encoded as a JSON string
+        sha256 (str): Hex digest of the query, used to send it as a persisted query
+    """
+
+    __slots__ = ("query", "encoded", "sha256")
+
+    def __init__(self, query: str):
+        self.query = query
+        self.encoded = json.dumps(query).encode()
+        self.sha256 = hashlib.sha256(query.encode()).hexdigest()
+
+
+@lru_cache(maxsize=256)
+def prepare(query: str) -> PreparedQuery:
+    """The `PreparedQuery` for a query, serialized the first time it's seen"""
+    return PreparedQuery(query)
+
+
+def encode_payload(payload: Dict) -> bytes:
+    """JSON body of a request payload, reusing its query's serialized form
+
+    Only the variables and other members are encoded on each call.
+    """
+    rest = json.dumps({k: v for k, v in payload.items() if k != "query"}).encode()
+    if "query" not in payload:
+        return rest
+
+    head = b'{"query": ' + prepare(payload["query"]).encoded
+    return head + (b"}" if rest == b"{}" else b", " + rest[1:])
+
+
+def persisted_payload(payload: Dict, include_query: bool = False) -> Dict:
+    """The payload as an automatic persisted query
+
+    The query is identified by its hash, and only included when the server
+    doesn't know it yet.
+    """
+    prepared = prepare(payload["query"])
+    persisted = {k: v for k, v in payload.items() if k != "query" or include_query}
+    persisted["extensions"] = {
+        **(payload.get("extensions") or {}),
+        "persistedQuery": {"version": 1, "sha256Hash": prepared.sha256},
+    }
+    return persisted
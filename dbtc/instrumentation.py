@@ -0,0 +1,293 @@
+# stdlib
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+__all__ = [
+    "HistogramCollector",
+    "Instrument",
+    "LatencyHistogram",
+    "RequestEvent",
+    "endpoint_template",
+    "graphql_operation",
+]
+
+_NUMERIC_SEGMENT = re.compile(r"(?<=/)\d+(?=/|$)|^\d+(?=/)")
+_OPERATION = re.compile(r"^\s*(?:query|mutation|subscription)\s+(\w+)")
+
+# Upper bounds, in seconds, of the buckets exported to Prometheus
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+PHASES = ("total", "network", "decode", "validation")
+
+
+def _prometheus_labels(**kwargs) -> str:
+    values = ",".join(
+        '{}="{}"'.format(
+            k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for k, v in kwargs.items()
+    )
+    return "{" + values + "}"
+
+
+def endpoint_template(path: str) -> str:
+    """Replace numeric IDs in a request path, e.g. `accounts/{id}/runs/{id}`"""
+    return _NUMERIC_SEGMENT.sub("{id}", path)
+
+
+def graphql_operation(query: str) -> str:
+    """Name of the operation within a GraphQL document, or `anonymous`"""
+    match = _OPERATION.match(query)
+    return match.group(1) if match else "anonymous"
+
+
+@dataclass
+class RequestEvent:
+    """Details about a single request, passed to every `Instrument`
+
+    Times are in seconds.  `network_time` covers sending the request and reading
+    the response, `decode_time` parsing the JSON body, and `validation_time`
+    building pydantic models from the payload or response.
+    """
+
+    client: str
+    method: str
+    endpoint: str
+    status_code: Optional[int] = None
+    request_bytes: int = 0
+    response_bytes: int = 0
+    retries: int = 0
+    network_time: float = 0.0
+    decode_time: float = 0.0
+    validation_time: float = 0.0
+    total_time: float = 0.0
+    error: Optional[str] = None
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @contextmanager
+    def timer(self, attribute: str) -> Iterator[None]:
+        """Add the time spent within the block to `attribute`"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            setattr(
+                self, attribute, getattr(self, attribute) + time.perf_counter() - start
+            )
+
+
+class Instrument:
+    """Receive a callback before and after every request a client makes
+
+    Subclass and override either method, then pass instances to `dbtCloudClient`
+    with the `instruments` argument or `dbtCloudClient.add_instrument`.  Hooks run on
+    the thread making the request, so they should be quick and thread-safe.
+    """
+
+    def before_request(self, event: RequestEvent):
+        """Called before the request is sent; only identifying fields are set"""
+
+    def after_request(self, event: RequestEvent):
+        """Called once the response has been decoded and validated"""
+
+
+class LatencyHistogram:
+    """Log-linear histogram in the style of HdrHistogram
+
+    Values are bucketed with a fixed relative precision (about 0.8% with the default
+    7 sub-bucket bits) across any range, so percentiles are accurate for both
+    millisecond and minute-long requests while memory stays bounded.
+
+    Args:
+        sub_bucket_bits (int, optional): Precision of each bucket, in bits
+        unit (float, optional): Smallest distinguishable value, in seconds
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7, unit: float = 1e-6):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.unit = unit
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def _index(self, value: float) -> int:
+        scaled = int(value / self.unit)
+        shift = max(scaled.bit_length() - self.sub_bucket_bits, 0)
+        return ((scaled >> shift) << shift) + ((1 << shift) - 1)
+
+    def record(self, value: float):
+        """Record a value, in seconds"""
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram"):
+        """Add the values recorded by another histogram with the same precision"""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.sum += other.sum
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Value below which `percentile` percent of recorded values fall"""
+        if not self.count:
+            return None
+
+        target = max(1, round(self.count * percentile / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(index * self.unit, self.max)  # type: ignore[type-var]
+
+        return self.max
+
+    def count_at_or_below(self, value: float) -> int:
+        """Number of recorded values no greater than `value`"""
+        limit = self._index(value)
+        return sum(count for index, count in self.counts.items() if index <= limit)
+
+
+class HistogramCollector(Instrument):
+    """Keep latency histograms and counters per client, method, and endpoint
+
+    Each request is recorded in one histogram per phase (`total`, `network`,
+    `decode`, and `validation`), along with status codes, bytes, and retries.  Use
+    `summary` for a dictionary of percentiles or `prometheus_text` for the
+    Prometheus text exposition format.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.histograms: Dict[Tuple[str, str, str, str], LatencyHistogram] = {}
+        self.statuses: Dict[Tuple[str, str, str, str], int] = {}
+        self.counters: Dict[Tuple[str, str, str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def after_request(self, event: RequestEvent):
+        key = (event.client, event.method, event.endpoint)
+        status = str(event.status_code) if event.error is None else "error"
+        with self._lock:
+            for phase in PHASES:
+                histogram = self.histograms.get((*key, phase))
+                if histogram is None:
+                    histogram = LatencyHistogram(self.sub_bucket_bits)
+                    self.histograms[(*key, phase)] = histogram
+                histogram.record(getattr(event, f"{phase}_time"))
+            self.statuses[(*key, status)] = self.statuses.get((*key, status), 0) + 1
+            for counter, value in (
+                ("request_bytes", event.request_bytes),
+                ("response_bytes", event.response_bytes),
+                ("retries", event.retries),
+            ):
+                self.counters[(*key, counter)] = (
+                    self.counters.get((*key, counter), 0) + value
+                )
+
+    def summary(self, percentiles: Tuple[float, ...] = (50, 95, 99)) -> List[Dict]:
+        """Percentiles, in seconds, for each endpoint and phase"""
+        with self._lock:
+            return [
+                {
+                    "client": client,
+                    "method": method,
+                    "endpoint": endpoint,
+                    "phase": phase,
+                    "count": histogram.count,
+                    "mean": histogram.mean,
+                    "max": histogram.max,
+                    **{f"p{p:g}": histogram.percentile(p) for p in percentiles},
+                }
+                for (client, method, endpoint, phase), histogram in sorted(
+                    self.histograms.items()
+                )
+            ]
+
+    def prometheus_text(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        labels = _prometheus_labels
+        lines = [
+            "# HELP dbtc_request_duration_seconds Time spent per request phase.",
+            "# TYPE dbtc_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            for (client, method, endpoint, phase), histogram in sorted(
+                self.histograms.items()
+            ):
+                common = {
+                    "client": client,
+                    "method": method,
+                    "endpoint": endpoint,
+                    "phase": phase,
+                }
+                for bound in buckets:
+                    lines.append(
+                        "dbtc_request_duration_seconds_bucket"
+                        f"{labels(**common, le=bound)} "
+                        f"{histogram.count_at_or_below(bound)}"
+                    )
+                lines.append(
+                    "dbtc_request_duration_seconds_bucket"
+                    f"{labels(**common, le='+Inf')} {histogram.count}"
+                )
+                lines.append(
+                    f"dbtc_request_duration_seconds_sum{labels(**common)} "
+                    f"{histogram.sum}"
+                )
+                lines.append(
+                    f"dbtc_request_duration_seconds_count{labels(**common)} "
+                    f"{histogram.count}"
+                )
+
+            lines.append("# HELP dbtc_requests_total Requests made by status code.")
+            lines.append("# TYPE dbtc_requests_total counter")
+            for (client, method, endpoint, status), count in sorted(
+                self.statuses.items()
+            ):
+                request_labels = labels(
+                    client=client, method=method, endpoint=endpoint, status=status
+                )
+                lines.append(f"dbtc_requests_total{request_labels} {count}")
+
+            for counter in ("request_bytes", "response_bytes", "retries"):
+                lines.append(f"# TYPE dbtc_{counter}_total counter")
+                for (client, method, endpoint, name), value in sorted(
+                    self.counters.items()
+                ):
+                    if name == counter:
+                        counter_labels = labels(
+                            client=client, method=method, endpoint=endpoint
+                        )
+                        lines.append(f"dbtc_{counter}_total{counter_labels} {value}")
+
+        return "\n".join(lines) + "\n"
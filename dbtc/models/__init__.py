@@ -1 +1 @@
-from .webhooks import Webhook  # noqa: F401
+from .webhooks import Webhook, WebhookEvent  # noqa: F401
@@ -1,11 +1,9 @@
 # stdlib
 import base64
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, List, Optional
 
 # third party
-import pandas as pd
-import pyarrow as pa
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -14,6 +12,10 @@ from pydantic import (
     model_validator,
 )
 
+if TYPE_CHECKING:
+    # pyarrow is slow to import, so it's only loaded once a result is materialized
+    import pyarrow as pa
+
 
 class TimeGranularity(str, Enum):
     day = "DAY"
@@ -98,14 +100,19 @@ class QueryPage(BaseModel):
 
     @computed_field  # type: ignore[misc]
     @property
-    def arrow_table(self) -> pa.Table:
+    def arrow_table(self) -> Any:
         if self.arrowResult is not None:
+            # third party
+            import pyarrow as pa
+
             with pa.ipc.open_stream(base64.b64decode(self.arrowResult)) as reader:
                 return pa.Table.from_batches(reader, reader.schema)
 
 
 class QueryResponse(BaseModel):
-    result: Optional[Union[pd.DataFrame, pa.Table, List[Dict], List[str]]]
+    # A `pd.DataFrame`, `pa.Table`, list of dicts, or list of strings, depending on
+    # the output format
+    result: Optional[Any]
     query_id: Optional[str]
     sql: Optional[str]
     status: str
@@ -128,7 +135,10 @@ class QueryResponseConstructor:
         self.output_format = output_format
         valid_tables = [page.arrow_table for page in query_pages if page.arrow_table]
         if valid_tables:
-            self.concatenated_arrow_table = pa.concat_tables(valid_tables)
+            # third party
+            import pyarrow as pa
+
+            self.concatenated_arrow_table: "pa.Table" = pa.concat_tables(valid_tables)
         self._set_common_page_attributes()
 
     def _is_same_for_each_page(self, attribute: str) -> bool:
@@ -2,7 +2,7 @@
 from typing import Literal, Optional
 
 # third party
-from pydantic import BaseModel, conlist
+from pydantic import BaseModel, ConfigDict, conlist
 
 
 class Webhook(BaseModel):
@@ -19,3 +19,44 @@ class Webhook(BaseModel):
     description: Optional[str] = None
     id: Optional[str] = None
     job_ids: Optional[int] = None
+
+
+class WebhookRunData(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    # Required
+    jobId: int
+    runId: int
+
+    # Optional
+    accountId: Optional[int] = None
+    environmentId: Optional[int] = None
+    environmentName: Optional[str] = None
+    jobName: Optional[str] = None
+    projectId: Optional[int] = None
+    projectName: Optional[str] = None
+    runReason: Optional[str] = None
+    runStatus: Optional[str] = None
+    runStatusCode: Optional[int] = None
+    runStatusMessage: Optional[str] = None
+    runStartedAt: Optional[str] = None
+    runFinishedAt: Optional[str] = None
+
+
+class WebhookEvent(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    # Required
+    accountId: int
+    eventType: Literal["job.run.started", "job.run.completed", "job.run.errored"]
+    data: WebhookRunData
+
+    # Optional
+    eventId: Optional[str] = None
+    timestamp: Optional[str] = None
+    webhookName: Optional[str] = None
+    webhooksID: Optional[str] = None
+
+    @property
+    def is_complete(self) -> bool:
+        return self.eventType in ("job.run.completed", "job.run.errored")
@@ -0,0 +1,315 @@
+# stdlib
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple, Union
+
+# third party
+import numpy as np
+
+if TYPE_CHECKING:
+    # third party
+    import pyarrow as pa
+
+__all__ = ["PerformanceFrame"]
+
+# Job ID used for execution times that aren't broken down by job
+NO_JOB = -1
+
+
+def _group_stats(groups: np.ndarray, values: np.ndarray, size: int):
+    """Count, sum, and sum of squares of `values` for each group"""
+    count = np.bincount(groups, minlength=size).astype(np.float64)
+    total = np.bincount(groups, weights=values, minlength=size)
+    squares = np.bincount(groups, weights=values * values, minlength=size)
+    return count, total, squares
+
+
+def _divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator != 0, numerator / denominator, np.nan)
+
+
+class PerformanceFrame:
+    """Model execution history flattened into columns for vectorized analysis
+
+    Each row is a single execution of a model, with the index of the model in
+    `unique_ids`, the job that ran it (`NO_JOB` when the history isn't broken down
+    by job), the run (-1 when unknown), the date it ran as days since the epoch,
+    its execution time in seconds, and its status.  Statistics are computed for
+    every model, or every model and job, at once with NumPy rather than by looping
+    over the nested responses.
+
+    Build one with `from_history` or `_MetadataClient.performance_frame`.
+
+    Args:
+        unique_ids (List[str]): Unique id of each model, indexed by `model`
+        model (np.ndarray): Index of each execution's model in `unique_ids`
+        job_id (np.ndarray): Job ID of each execution
+        run_id (np.ndarray): Run ID of each execution
+        day (np.ndarray): Date of each execution, as days since the epoch
+        execution_time (np.ndarray): Execution time of each execution, in seconds
+        status (np.ndarray): Status of each execution
+    """
+
+    def __init__(
+        self,
+        unique_ids: List[str],
+        model: np.ndarray,
+        job_id: np.ndarray,
+        run_id: np.ndarray,
+        day: np.ndarray,
+        execution_time: np.ndarray,
+        status: np.ndarray,
+    ):
+        self.unique_ids = unique_ids
+        self.model = model
+        self.job_id = job_id
+        self.run_id = run_id
+        self.day = day
+        self.execution_time = execution_time
+        self.status = status
+
+    def __len__(self) -> int:
+        return len(self.execution_time)
+
+    @classmethod
+    def from_history(
+        cls, responses: Union[Dict[str, Dict], Iterable[Tuple[str, Dict]]]
+    ) -> "PerformanceFrame":
+        """Flatten `model_execution_history` responses
+
+        Individual executions are used when the response includes them, falling
+        back to each job's, then each date's, `executionTimes`.
+
+        Args:
+            responses (dict): Mapping of each model's unique id to its response, as
+                returned by `model_execution_history` given a list of unique ids
+        """
+        items = responses.items() if isinstance(responses, dict) else responses
+        unique_ids: List[str] = []
+        model: List[int] = []
+        job_id: List[int] = []
+        run_id: List[int] = []
+        dates: List[str] = []
+        execution_time: List[float] = []
+        status: List[str] = []
+
+        def extend(index, date, times, job=NO_JOB, runs=None, statuses=None):
+            times = [t for t in times if t is not None]
+            model.extend([index] * len(times))
+            job_id.extend([job] * len(times))
+            run_id.extend(runs if runs is not None else [-1] * len(times))
+            dates.extend([date] * len(times))
+            execution_time.extend(times)
+            status.extend(statuses if statuses is not None else [""] * len(times))
+
+        for index, (unique_id, response) in enumerate(items):
+            unique_ids.append(unique_id)
+            performance = (response.get("data") or {}).get("performance") or {}
+            for entry in performance.get("modelExecutionHistory") or []:
+                date = entry["date"]
+                jobs = entry.get("executionsByJob") or []
+                if not jobs:
+                    extend(index, date, entry.get("executionTimes") or [])
+
+                for job in jobs:
+                    executions = [
+                        e
+                        for e in job.get("executions") or []
+                        if e.get("executionTime") is not None
+                    ]
+                    if executions:
+                        extend(
+                            index,
+                            date,
+                            [e["executionTime"] for e in executions],
+                            job["jobId"],
+                            [
+                                -1 if e.get("runId") is None else e["runId"]
+                                for e in executions
+                            ],
+                            [e.get("status") or "" for e in executions],
+                        )
+                    else:
+                        extend(
+                            index, date, job.get("executionTimes") or [], job["jobId"]
+                        )
+
+        return cls(
+            unique_ids,
+            np.array(model, dtype=np.int64),
+            np.array(job_id, dtype=np.int64),
+            np.array(run_id, dtype=np.int64),
+            np.array(dates, dtype="datetime64[D]").astype(np.int64),
+            np.array(execution_time, dtype=np.float64),
+            np.array(status, dtype=object),
+        )
+
+    def _groups(self, by: str) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Group index of every row, and the key columns of each group"""
+        if by == "model":
+            groups = self.model
+            keys = {"unique_id": np.array(self.unique_ids, dtype=object)}
+            return groups, keys
+
+        if by == "job":
+            jobs, job_index = np.unique(self.job_id, return_inverse=True)
+            # One integer per model and job sorts far faster than pairs of columns
+            pairs, groups = np.unique(
+                self.model * len(jobs) + job_index.reshape(-1), return_inverse=True
+            )
+            unique_ids = np.array(self.unique_ids, dtype=object)
+            keys = {
+                "unique_id": unique_ids[pairs // max(len(jobs), 1)],
+                "job_id": jobs[pairs % max(len(jobs), 1)],
+            }
+            return groups.reshape(-1), keys
+
+        raise ValueError("by must be one of 'model' or 'job'")
+
+    def percentiles(
+        self, by: str = "model", q: Tuple[float, ...] = (50, 95, 99)
+    ) -> Dict[str, np.ndarray]:
+        """Count, mean, and percentiles of execution time
+
+        Percentiles are linearly interpolated between executions, like
+        `numpy.percentile`.
+
+        Args:
+            by (str, optional): Compute for each "model" or each "job" of each model
+            q (Tuple[float, ...], optional): Percentiles to compute
+
+        Returns:
+            Dict[str, np.ndarray]: Columns of key values, `count`, `mean`, and
+                `p{q}` for each percentile, with a row per group.  Groups without
+                executions have NaN statistics.
+        """
+        groups, keys = self._groups(by)
+        size = len(next(iter(keys.values())))
+        count, total, _ = _group_stats(groups, self.execution_time, size)
+        order = np.lexsort((self.execution_time, groups))
+        ordered = self.execution_time[order]
+        starts = np.cumsum(count) - count
+        columns = {
+            **keys,
+            "count": count.astype(np.int64),
+            "mean": _divide(total, count),
+        }
+        has_rows = count > 0
+        for percentile in q:
+            position = starts + (count - 1) * percentile / 100
+            low = np.floor(position).astype(np.int64)
+            high = np.ceil(position).astype(np.int64)
+            low_values = np.full(size, np.nan)
+            high_values = np.full(size, np.nan)
+            low_values[has_rows] = ordered[low[has_rows]]
+            high_values[has_rows] = ordered[high[has_rows]]
+            columns[f"p{percentile:g}"] = low_values + (high_values - low_values) * (
+                position - low
+            )
+        return columns
+
+    def trends(self, by: str = "model") -> Dict[str, np.ndarray]:
+        """Linear trend of execution time over time
+
+        Args:
+            by (str, optional): Compute for each "model" or each "job" of each model
+
+        Returns:
+            Dict[str, np.ndarray]: Columns of key values, `slope` in seconds per
+                day from a least squares fit, and `relative_slope`, the slope as a
+                fraction of the mean execution time.  Groups whose executions all
+                ran on the same day have NaN trends.
+        """
+        groups, keys = self._groups(by)
+        size = len(next(iter(keys.values())))
+        x = self.day.astype(np.float64)
+        # Center days on the first one to keep the sums small
+        x -= x.min() if len(x) else 0
+        y = self.execution_time
+        n, sum_x, sum_xx = _group_stats(groups, x, size)
+        sum_y = np.bincount(groups, weights=y, minlength=size)
+        sum_xy = np.bincount(groups, weights=x * y, minlength=size)
+        slope = _divide(n * sum_xy - sum_x * sum_y, n * sum_xx - sum_x * sum_x)
+        return {
+            **keys,
+            "slope": slope,
+            "relative_slope": _divide(slope, _divide(sum_y, n)),
+        }
+
+    def regressions(
+        self,
+        by: str = "model",
+        *,
+        recent_days: int = 7,
+        z: float = 3.0,
+        min_increase: float = 0.2,
+    ) -> Dict[str, np.ndarray]:
+        """Flag models whose recent executions are significantly slower
+
+        Executions within the last `recent_days` days of the frame are compared
+        with everything before them.  A group is flagged when its recent mean
+        exceeds its baseline mean by at least `min_increase` and by `z` standard
+        errors of the baseline.
+
+        Args:
+            by (str, optional): Compute for each "model" or each "job" of each model
+            recent_days (int, optional): Number of days treated as recent
+            z (float, optional): Standard errors required to flag a regression
+            min_increase (float, optional): Fractional increase required to flag a
+                regression, e.g. 0.2 for 20% slower
+
+        Returns:
+            Dict[str, np.ndarray]: Columns of key values, `baseline_mean`,
+                `recent_mean`, `change` as a fraction of the baseline mean,
+                `z_score`, and `regressed`
+        """
+        groups, keys = self._groups(by)
+        size = len(next(iter(keys.values())))
+        cutoff = (self.day.max() if len(self.day) else 0) - recent_days
+        recent = self.day > cutoff
+        base_n, base_sum, base_squares = _group_stats(
+            groups[~recent], self.execution_time[~recent], size
+        )
+        recent_n, recent_sum, _ = _group_stats(
+            groups[recent], self.execution_time[recent], size
+        )
+        baseline_mean = _divide(base_sum, base_n)
+        recent_mean = _divide(recent_sum, recent_n)
+        change = _divide(recent_mean - baseline_mean, baseline_mean)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variance = _divide(base_squares - base_n * baseline_mean**2, base_n - 1)
+            standard_error = np.sqrt(np.maximum(variance, 0)) / np.sqrt(recent_n)
+            # A perfectly steady baseline makes any increase infinitely significant,
+            # while a single baseline execution says nothing about its spread
+            z_score = np.where(
+                standard_error > 0,
+                _divide(recent_mean - baseline_mean, standard_error),
+                np.where(recent_mean > baseline_mean, np.inf, 0.0),
+            )
+            z_score[np.isnan(standard_error)] = np.nan
+            regressed = (change >= min_increase) & (z_score >= z)
+        return {
+            **keys,
+            "baseline_mean": baseline_mean,
+            "recent_mean": recent_mean,
+            "change": change,
+            "z_score": z_score,
+            "regressed": regressed,
+        }
+
+    def to_arrow(self) -> "pa.Table":
+        """Every execution as a pyarrow Table"""
+        # third party
+        import pyarrow as pa
+
+        return pa.table(
+            {
+                "unique_id": pa.DictionaryArray.from_arrays(
+                    pa.array(self.model, pa.int32()), pa.array(self.unique_ids)
+                ),
+                "job_id": self.job_id,
+                "run_id": self.run_id,
+                "date": pa.array(self.day.astype("datetime64[D]")),
+                "execution_time": self.execution_time,
+                "status": pa.array(self.status.tolist(), pa.string()),
+            }
+        )
@@ -0,0 +1,313 @@
+# stdlib
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Set
+
+# first party
+from dbtc.graphql import (
+    Field,
+    child,
+    find_connection,
+    parse_operation,
+    parse_selections,
+)
+from dbtc.utils import write_json_atomic
+
+__all__ = ["DEFAULT_SCHEMA_DIRECTORY", "INTROSPECTION_QUERY", "MetadataSchema"]
+
+# Where the CLI caches the schema between invocations
+DEFAULT_SCHEMA_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "dbtc")
+
+INTROSPECTION_QUERY = """
+query Introspection {
+  __schema {
+    queryType {
+      name
+    }
+    mutationType {
+      name
+    }
+    types {
+      kind
+      name
+      fields(includeDeprecated: true) {
+        name
+        args {
+          name
+          defaultValue
+          type {
+            ...TypeRef
+          }
+        }
+        type {
+          ...TypeRef
+        }
+      }
+      possibleTypes {
+        name
+      }
+    }
+  }
+}
+fragment TypeRef on __Type {
+  kind
+  name
+  ofType {
+    kind
+    name
+    ofType {
+      kind
+      name
+      ofType {
+        kind
+        name
+        ofType {
+          kind
+          name
+        }
+      }
+    }
+  }
+}
+"""
+
+_INPUT_KINDS = ("SCALAR", "ENUM", "INPUT_OBJECT")
+
+_COMPOSITE_KINDS = ("OBJECT", "INTERFACE", "UNION")
+
+
+def _named_type(type_ref: Dict) -> str:
+    while type_ref.get("ofType") is not None:
+        type_ref = type_ref["ofType"]
+    return type_ref["name"]
+
+
+def _type_string(type_ref: Dict) -> str:
+    if type_ref["kind"] == "NON_NULL":
+        return f"{_type_string(type_ref['ofType'])}!"
+
+    if type_ref["kind"] == "LIST":
+        return f"[{_type_string(type_ref['ofType'])}]"
+
+    return type_ref["name"]
+
+
+class MetadataSchema:
+    """The Discovery API schema, used to validate queries before they're sent
+
+    Queries are checked for fields and arguments the schema doesn't have, missing
+    required arguments and variables, undefined or unused variables, selections on
+    fields that don't allow them (or that require them), and pagination that
+    `query` can't follow.  Each document is checked once; later checks of the
+    same document only look at its variables.
+
+    Load the schema with `load`, which introspects it once and caches it on disk.
+
+    Args:
+        schema (Dict): The `__schema` of an introspection query's response
+    """
+
+    def __init__(self, schema: Dict):
+        self.query_type = (schema.get("queryType") or {}).get("name")
+        self.mutation_type = (schema.get("mutationType") or {}).get("name")
+        self.types: Dict[str, Dict] = {t["name"]: t for t in schema["types"]}
+        self._fields: Dict[str, Dict[str, Dict]] = {
+            t["name"]: {f["name"]: f for f in t.get("fields") or []}
+            for t in schema["types"]
+        }
+        self._errors: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls, client, *, directory: str = None, ttl: float = 86_400
+    ) -> "MetadataSchema":
+        """Introspect the schema, or read it from the cache in `directory`
+
+        A cached schema is used until it's `ttl` seconds old.  It's then
+        introspected again, sending the ETag it was returned with so an unchanged
+        schema isn't downloaded again.
+
+        Args:
+            client (_MetadataClient): Metadata client used to introspect the schema
+            directory (str, optional): Directory the schema is cached in.
+                Defaults to only keeping it in memory.
+            ttl (float, optional): Max age of the cached schema in seconds
+        """
+        path = None
+        cached: Dict = {}
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            # Each host, and the beta endpoint, has its own schema
+            url = hashlib.sha256(client.full_url().encode()).hexdigest()[:16]
+            path = os.path.join(directory, f"schema-{url}.json")
+            try:
+                with open(path) as f:
+                    cached = json.load(f)
+
+            except (OSError, ValueError):
+                cached = {}
+            if cached and time.time() - cached["fetched_at"] < ttl:
+                return cls(cached["schema"])
+
+        schema, etag = client._introspect(etag=cached.get("etag"))
+        if schema is None:
+            schema = cached["schema"]
+        if path is not None:
+            entry = {"fetched_at": time.time(), "etag": etag, "schema": schema}
+            write_json_atomic(path, entry)
+        return cls(schema)
+
+    def _field(self, type_name: str, name: str) -> Optional[Dict]:
+        field = self._fields.get(type_name, {}).get(name)
+        if field is not None:
+            return field
+
+        # Fields of an interface or union may be selected through fragments on
+        # any of its possible types
+        for possible in self.types.get(type_name, {}).get("possibleTypes") or []:
+            field = self._fields.get(possible["name"], {}).get(name)
+            if field is not None:
+                return field
+
+        return None
+
+    def _check_selections(
+        self, type_name: str, selections: List[Field], errors: List[str]
+    ):
+        for selection in selections:
+            if selection.name.startswith("__"):
+                continue
+
+            field = self._field(type_name, selection.name)
+            if field is None:
+                errors.append(
+                    f"Cannot query field '{selection.name}' on type '{type_name}'"
+                )
+                continue
+
+            arguments = {argument["name"]: argument for argument in field["args"]}
+            for name in selection.arguments:
+                if name not in arguments:
+                    errors.append(
+                        f"Unknown argument '{name}' on field "
+                        f"'{type_name}.{selection.name}'"
+                    )
+            for name, argument in arguments.items():
+                if (
+                    argument["type"]["kind"] == "NON_NULL"
+                    and argument.get("defaultValue") is None
+                    and name not in selection.arguments
+                ):
+                    errors.append(
+                        f"Field '{type_name}.{selection.name}' argument '{name}' of "
+                        f"type '{_type_string(argument['type'])}' is required"
+                    )
+
+            named = _named_type(field["type"])
+            kind = self.types.get(named, {}).get("kind")
+            if kind in _COMPOSITE_KINDS and not selection.selections:
+                errors.append(
+                    f"Field '{selection.name}' of type '{named}' must have a "
+                    "selection of subfields"
+                )
+            elif kind not in _COMPOSITE_KINDS and selection.selections:
+                errors.append(
+                    f"Field '{selection.name}' must not have a selection since "
+                    f"type '{named}' has no subfields"
+                )
+            else:
+                self._check_selections(named, selection.selections, errors)
+
+    def _check_document(self, document: str) -> List[str]:
+        try:
+            operation = parse_operation(document)
+            selections = parse_selections(document)
+        except ValueError as e:
+            return [f"Syntax error: {e}"]
+
+        errors: List[str] = []
+        root = self.mutation_type if operation.type == "mutation" else self.query_type
+        if root is None:
+            return [f"The schema doesn't support {operation.type} operations"]
+
+        self._check_selections(root, list(selections), errors)
+        for name, (type_, _) in operation.variables.items():
+            named = type_.strip("[]!")
+            if self.types.get(named, {}).get("kind") not in _INPUT_KINDS:
+                errors.append(f"Variable '${name}' has unknown input type '{type_}'")
+            if name not in operation.used:
+                errors.append(f"Variable '${name}' is never used")
+        for name in operation.used:
+            if name not in operation.variables:
+                errors.append(f"Variable '${name}' is not defined")
+
+        # `query` follows the first connection selecting `pageInfo`, passing its
+        # end cursor as `$after`
+        if "after" in operation.variables:
+            found = find_connection(list(selections), ())
+            if found is None:
+                errors.append(
+                    "Queries defining '$after' must select 'pageInfo' on the "
+                    "connection to paginate"
+                )
+            else:
+                _, connection = found
+                if connection.arguments.get("after") != "$after":
+                    errors.append(
+                        f"The paginated field '{connection.name}' must be passed "
+                        "'after: $after'"
+                    )
+                page_info = child(connection, "pageInfo")
+                selected = {f.name for f in page_info.selections}  # type: ignore[union-attr]
+                if not {"endCursor", "hasNextPage"} <= selected:
+                    errors.append(
+                        "'pageInfo' must select 'endCursor' and 'hasNextPage' to "
+                        "paginate"
+                    )
+        return errors
+
+    def validate(self, document: str, variables: Dict = None) -> List[str]:
+        """Problems with a query, or an empty list if it's valid
+
+        Args:
+            document (str): The GraphQL query
+            variables (Dict, optional): Variables to send with the query, checked
+                for required variables that are missing
+        """
+        with self._lock:
+            errors = self._errors.get(document)
+        if errors is None:
+            errors = self._check_document(document)
+            with self._lock:
+                self._errors[document] = errors
+
+        if errors or variables is None:
+            return list(errors)
+
+        definitions = parse_operation(document).variables
+        return [
+            f"Variable '${name}' of required type '{type_}' was not provided"
+            for name, (type_, has_default) in definitions.items()
+            if type_.endswith("!") and not has_default and variables.get(name) is None
+        ]
+
+    def check(self, document: str, variables: Dict = None):
+        """Raise if a query isn't valid
+
+        Raises:
+            ValueError: With every problem found by `validate`
+        """
+        errors = self.validate(document, variables)
+        if errors:
+            raise ValueError("Invalid query:\n" + "\n".join(errors))
+
+    def __contains__(self, type_name: str) -> bool:
+        return type_name in self.types
+
+    def fields(self, type_name: str) -> Set[str]:
+        """Names of the fields of a type"""
+        return set(self._fields.get(type_name, {}))
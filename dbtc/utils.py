@@ -1,8 +1,10 @@
 # stdlib
 import json
-from typing import Any
+import os
+import threading
+from typing import Any, Callable
 
-__all__ = ["listify", "json_listify"]
+__all__ = ["listify", "json_listify", "write_atomic", "write_json_atomic"]
 
 
 def listify(value: Any):
@@ -17,3 +19,35 @@ def json_listify(value: Any):
         return json.dumps(listify(value))
 
     return value
+
+
+def write_atomic(path: str, write: Callable[[str], Any]):
+    """Write a file with `write` and rename it into place
+
+    Readers never see a partially written file, and a failed write leaves the
+    previous file as it was.
+
+    Args:
+        path (str): Path of the file
+        write (Callable): Writes the file's contents to the path it's given
+    """
+    temporary = f"{path}.{os.getpid()}.{threading.get_ident()}"
+    try:
+        write(temporary)
+        os.replace(temporary, path)
+    except BaseException:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+        raise
+
+
+def write_json_atomic(path: str, data: Any):
+    """Write `data` as JSON to a file with `write_atomic`"""
+
+    def write(temporary: str):
+        with open(temporary, "w") as f:
+            json.dump(data, f)
+
+    write_atomic(path, write)
@@ -1,11 +1,16 @@
 # stdlib
+import copy
+import json
 import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
 
 # third party
 import pytest
 
 # first party
 from dbtc import dbtCloudClient
+from dbtc.graphql import child, find_connection, parse_selections
 
 
 @pytest.fixture(scope="session")
@@ -15,3 +20,131 @@ def dbtc_client():
         api_key=os.getenv("DBT_CLOUD_API_KEY"),
         environment_id=218762,
     )
+
+
+class FakeResponse:
+    """Stands in for the `requests.Response` to a Discovery API request"""
+
+    reason = "Bad Request"
+    url = "https://metadata.cloud.getdbt.com/graphql"
+
+    def __init__(self, data: Dict, status_code: int = 200, headers: Dict = None):
+        self._data = data
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = json.dumps(data).encode()
+
+    def json(self):
+        return self._data
+
+
+class FakeDiscovery:
+    """Base for fake Discovery API servers, recording a copy of every payload
+
+    Subclasses answer each request in `respond`.
+    """
+
+    def __init__(self):
+        self.payloads: List[Dict] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, method: str, url: str, json: Dict, **kwargs):
+        with self._lock:
+            self.payloads.append(copy.deepcopy(json))
+        return self.respond(json["query"], json.get("variables") or {})
+
+    def respond(self, query: str, variables: Dict):
+        raise NotImplementedError
+
+
+def answer_aliases(
+    query: str, variables: Dict, name: str, answer: Callable[[Any], Dict]
+) -> Dict:
+    """Response to a query batched by `batch_query`, one aliased field at a time
+
+    Each field is answered with `answer` called with its `name` variable, which is
+    `{name}_{i}` for the i-th field of a batched query.
+    """
+    return {
+        "data": {
+            selection.key: answer(variables.get(f"{name}_{i}", variables.get(name)))
+            for i, selection in enumerate(parse_selections(query))
+        }
+    }
+
+
+class FakeAppliedState(FakeDiscovery):
+    """Serves an environment's applied state, `page_size` resources per page
+
+    Like the API, resources are filtered by a `uniqueIds` filter and only keep the
+    fields the query selects.
+
+    Args:
+        resources (Dict[str, List[Dict]]): Resources of each field of `applied`,
+            e.g. `models`
+        page_size (int, optional): Number of resources per page
+    """
+
+    def __init__(self, resources: Dict[str, List[Dict]], *, page_size: int = 1):
+        super().__init__()
+        self.resources = resources
+        self.page_size = page_size
+        self.last_updated_at = "2024-01-01T00:00:00Z"
+        # Field of `applied` whose requests fail
+        self.failing: Optional[str] = None
+
+    def respond(self, query: str, variables: Dict):
+        if "lastUpdatedAt" in query:
+            applied = {"lastUpdatedAt": self.last_updated_at}
+            return {"data": {"environment": {"applied": applied}}}
+
+        _, connection = find_connection(list(parse_selections(query)), ())
+        if connection.name == self.failing:
+            raise RuntimeError(f"{connection.name} unavailable")
+
+        node = child(child(connection, "edges"), "node")  # type: ignore[arg-type]
+        selected = {field.name for field in node.selections}  # type: ignore[union-attr]
+        unique_ids = (variables.get("filter") or {}).get("uniqueIds")
+        nodes = [
+            {key: value for key, value in resource.items() if key in selected}
+            for resource in copy.deepcopy(self.resources.get(connection.name, []))
+            if unique_ids is None or resource["uniqueId"] in unique_ids
+        ]
+        start = int(variables.get("after") or 0)
+        end = start + self.page_size
+        page = {
+            "pageInfo": {"endCursor": str(end), "hasNextPage": end < len(nodes)},
+            "edges": [{"node": node} for node in nodes[start:end]],
+        }
+        return {"data": {"environment": {"applied": {connection.name: page}}}}
+
+
+@pytest.fixture
+def fake_discovery(monkeypatch):
+    """Build clients whose Discovery API requests are answered by a fake server
+
+    Call it with the server, e.g. a `FakeDiscovery`, or any callable taking
+    `(method, url, json, **kwargs)` that returns the response body, or a
+    `FakeResponse` for another status or headers.  Keyword arguments are passed
+    to `dbtCloudClient`.
+    """
+    clients: List[dbtCloudClient] = []
+
+    def connect(server: Callable, **kwargs) -> dbtCloudClient:
+        client = dbtCloudClient(service_token="fake", **kwargs)
+
+        def send(method: str, url: str, json: Dict, **kwargs):
+            response = server(method, url, json, **kwargs)
+            if isinstance(response, FakeResponse):
+                return response
+
+            return FakeResponse(response)
+
+        monkeypatch.setattr(client.metadata, "_send", send)
+        client.metadata.console.quiet = True
+        clients.append(client)
+        return client
+
+    yield connect
+    for client in clients:
+        client.metadata.console.quiet = False
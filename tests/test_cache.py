@@ -0,0 +1,184 @@
+# stdlib
+from typing import Dict, List
+
+# third party
+import pytest
+
+# first party
+from dbtc.cache import ResponseCache
+
+QUERY = """
+query MeshProjects($environmentId: BigInt!) {
+  environment(id: $environmentId) { name }
+}
+"""
+
+
+def _payload(environment_id: int = 1, query: str = QUERY) -> Dict:
+    return {"query": query, "variables": {"environmentId": environment_id}}
+
+
+def _response(name: str) -> Dict:
+    return {"data": {"environment": {"name": name}}}
+
+
+@pytest.fixture
+def client(fake_discovery):
+    payloads: List[Dict] = []
+
+    def send(method, url, json, **kwargs):
+        payloads.append(json)
+        return _response(f"environment {len(payloads)}")
+
+    return fake_discovery(send), payloads
+
+
+def test_key_ignores_formatting():
+    reformatted = "query MeshProjects($environmentId: BigInt!) { environment(id: $environmentId) { name } }"  # noqa: E501
+    assert ResponseCache.key(_payload()) == ResponseCache.key(
+        _payload(query=reformatted)
+    )
+    assert ResponseCache.key(_payload()) != ResponseCache.key(_payload(2))
+
+
+def test_lru_eviction_and_copies():
+    cache = ResponseCache(maxsize=2)
+    for environment_id in range(3):
+        cache.set(_payload(environment_id), _response(str(environment_id)))
+    assert len(cache) == 2
+    assert cache.get(_payload(0)) is None
+
+    cached = cache.get(_payload(1))
+    cached["data"] = None
+    assert cache.get(_payload(1)) == _response("1")
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_ttl(monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr("dbtc.cache.time.time", lambda: now[0])
+    cache = ResponseCache(ttl=60)
+    cache.set(_payload(), _response("a"))
+    now[0] += 30
+    assert cache.get(_payload()) == _response("a")
+    now[0] += 31
+    assert cache.get(_payload()) is None
+
+
+def test_version_invalidates_per_environment():
+    runs = {1: 100, 2: 200}
+    cache = ResponseCache(version=runs.get, version_ttl=0)
+    cache.set(_payload(1), _response("a"))
+    cache.set(_payload(2), _response("b"))
+    runs[1] = 101
+    assert cache.get(_payload(1)) is None
+    assert cache.get(_payload(2)) == _response("b")
+
+    cache.invalidate(2)
+    assert cache.get(_payload(2)) is None
+
+
+def test_disk_tier_is_shared(tmp_path):
+    ResponseCache(directory=str(tmp_path)).set(_payload(), _response("a"))
+    cache = ResponseCache(directory=str(tmp_path))
+    assert cache.get(_payload()) == _response("a")
+
+    cache.invalidate(1)
+    assert ResponseCache(directory=str(tmp_path)).get(_payload()) is None
+
+
+def test_metadata_queries_use_the_cache(client):
+    client, payloads = client
+    cache = client.enable_metadata_cache(ttl=300)
+    first = client.metadata.query(QUERY, {"environmentId": 1})
+    assert client.metadata.query(QUERY, {"environmentId": 1}) == first
+    client.metadata.query(QUERY, {"environmentId": 2})
+    assert len(payloads) == 2
+    assert cache.hits == 1
+
+
+def test_errors_are_not_cached(fake_discovery):
+    payloads: List[Dict] = []
+    client = fake_discovery(
+        lambda *args, **kwargs: payloads.append(1) or {"errors": [{}]}
+    )
+    client.enable_metadata_cache()
+    client.metadata.query(QUERY, {"environmentId": 1})
+    client.metadata.query(QUERY, {"environmentId": 1})
+    assert len(payloads) == 2
+
+
+def test_latest_run_version(client, monkeypatch):
+    client, payloads = client
+    calls = []
+
+    def list_runs(account_id, **kwargs):
+        calls.append(kwargs["environment_id"])
+        return {"data": [{"id": 10}]}
+
+    monkeypatch.setattr(client.cloud, "list_runs", list_runs)
+    client.enable_metadata_cache(account_id=1)
+    for _ in range(3):
+        client.metadata.query(QUERY, {"environmentId": 1})
+    assert len(payloads) == 1
+    assert calls == [1]
+
+
+def test_unversioned_entries_expire(monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr("dbtc.cache.time.time", lambda: now[0])
+    runs = {1: 100}
+    cache = ResponseCache(version=runs.get, unversioned_ttl=60)
+    account_payload = {"query": QUERY, "variables": {"accountId": 1}}
+    cache.set(account_payload, _response("account"))
+    cache.set(_payload(1), _response("a"))
+    now[0] += 61
+    assert cache.get(account_payload) is None
+    assert cache.get(_payload(1)) == _response("a")
+
+
+def test_key_includes_url(tmp_path):
+    ResponseCache(directory=str(tmp_path)).set(
+        _payload(), _response("a"), url="https://one.example.com/graphql"
+    )
+    cache = ResponseCache(directory=str(tmp_path))
+    assert cache.get(_payload(), url="https://two.example.com/graphql") is None
+    assert cache.get(_payload(), url="https://one.example.com/graphql") == _response(
+        "a"
+    )
+
+
+def test_invalidate_all_forgets_versions():
+    runs = {1: 100}
+    calls = []
+
+    def version(environment_id):
+        calls.append(environment_id)
+        return runs[environment_id]
+
+    cache = ResponseCache(version=version, version_ttl=3_600)
+    cache.set(_payload(1), _response("a"))
+    runs[1] = 101
+    cache.invalidate()
+    cache.set(_payload(1), _response("b"))
+    assert calls == [1, 1]
+    assert cache.get(_payload(1)) == _response("b")
+
+
+def test_invalidate_keeps_other_files(tmp_path):
+    cache = ResponseCache(directory=str(tmp_path))
+    (tmp_path / "notes.txt").write_text("keep me")
+    (tmp_path / "settings.json").write_text("{}")
+    (tmp_path / f"{'0' * 64}.json").write_text("not an entry")
+    cache.set(_payload(1), _response("a"))
+    cache.set(_payload(2), _response("b"))
+
+    cache.invalidate(1)
+    assert cache.get(_payload(2)) == _response("b")
+    assert len(list(tmp_path.iterdir())) == 4
+
+    cache.invalidate()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "notes.txt",
+        "settings.json",
+    ]
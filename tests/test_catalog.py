@@ -0,0 +1,135 @@
+# stdlib
+import copy
+from typing import Dict, List
+
+# third party
+import pytest
+
+# first party
+from dbtc.client.catalog import CatalogIndex
+from tests.conftest import FakeAppliedState
+
+MODELS = [
+    {
+        "uniqueId": "model.tpch.dim_customers",
+        "name": "dim_customers",
+        "description": "One row per customer",
+        "resourceType": "model",
+        "tags": ["core"],
+        "filePath": "models/marts/dim_customers.sql",
+        "database": "analytics",
+        "schema": "marts",
+        "alias": "dim_customers",
+        "access": "public",
+        "materializedType": "table",
+        "modelingLayer": "marts",
+        "rawCode": "select * from {{ ref('stg_customers') }}",
+        "catalog": {"columns": [{"name": "customer_id", "description": "Key"}]},
+    },
+    {
+        "uniqueId": "model.tpch.stg_customers",
+        "name": "stg_customers",
+        "description": "Customers, renamed",
+        "resourceType": "model",
+        "tags": [],
+        "filePath": "models/staging/stg_customers.sql",
+        "database": "analytics",
+        "schema": "staging",
+        "alias": "stg_customers",
+        "access": "protected",
+        "materializedType": "view",
+        "modelingLayer": "staging",
+        "rawCode": "select id as customer_id from {{ source('tpch', 'customer') }}",
+        "catalog": {"columns": [{"name": "customer_id", "description": None}]},
+    },
+    {
+        "uniqueId": "model.tpch.fct_orders",
+        "name": "fct_orders",
+        "description": "Orders with the customer who placed them",
+        "resourceType": "model",
+        "tags": ["core"],
+        "filePath": "models/marts/fct_orders.sql",
+        "database": "analytics",
+        "schema": "marts",
+        "alias": "fct_orders",
+        "access": "public",
+        "materializedType": "incremental",
+        "modelingLayer": "marts",
+        "rawCode": "select * from {{ ref('stg_orders') }}",
+        "catalog": {"columns": [{"name": "order_id", "description": None}]},
+    },
+]
+
+
+@pytest.fixture
+def index(fake_discovery):
+    models = copy.deepcopy(MODELS)
+    for model in models:
+        model["executionInfo"] = {"lastRunGeneratedAt": "2024-01-01T00:00:00Z"}
+    fake = FakeAppliedState({"models": models})
+    return fake_discovery(fake).metadata.catalog_index(1), fake
+
+
+def _ids(results: List[Dict]) -> List[str]:
+    return [result["hit"]["uniqueId"] for result in results]
+
+
+def test_search_ranks_names_first(index):
+    catalog, _ = index
+    assert len(catalog) == 3
+    results = catalog.search("customer")
+    assert _ids(results)[2] == "model.tpch.fct_orders"
+    assert [r["matchedField"] for r in results] == ["name", "name", "description"]
+    assert "rawCode" not in results[0]["hit"]
+    assert _ids(catalog.search("dim_customers"))[0] == "model.tpch.dim_customers"
+
+
+def test_search_prefixes_and_every_word(index):
+    catalog, _ = index
+    assert _ids(catalog.search("dim_cust")) == ["model.tpch.dim_customers"]
+    assert _ids(catalog.search("customer ord")) == ["model.tpch.fct_orders"]
+    assert catalog.search("   ") == []
+
+
+def test_search_filters(index):
+    catalog, _ = index
+    assert _ids(catalog.search("customers", access_level="protected")) == [
+        "model.tpch.stg_customers"
+    ]
+    assert _ids(catalog.search("customer", tags="core", first=1)) == [
+        "model.tpch.dim_customers"
+    ]
+    assert _ids(catalog.search("source", search_fields=["code"])) == [
+        "model.tpch.stg_customers"
+    ]
+    assert catalog.search("customers", resource_type="Source") == []
+    with pytest.raises(ValueError):
+        catalog.search("customers", resource_type="Table")
+    with pytest.raises(ValueError):
+        CatalogIndex(None, 1, resource_types=["Metric"])
+
+
+def test_refresh_only_when_applied_state_changes(index):
+    catalog, fake = index
+    requests = len(fake.payloads)
+    assert catalog.refresh() is False
+    assert len(fake.payloads) == requests + 1
+
+    models = fake.resources["models"]
+    models[2]["name"] = "fct_purchases"
+    models[2]["executionInfo"]["lastRunGeneratedAt"] = "2024-01-02T00:00:00Z"
+    del models[1]
+    fake.last_updated_at = "2024-01-02T00:00:00Z"
+    requests = len(fake.payloads)
+    assert catalog.refresh() is True
+    assert "model.tpch.stg_customers" not in catalog
+    assert _ids(catalog.search("purchases")) == ["model.tpch.fct_orders"]
+    assert catalog.search("fct_orders", search_fields=["name"]) == []
+
+    # Only the model generated by a newer run is fetched in full again
+    fetched = [
+        p["variables"]["filter"]["uniqueIds"]
+        for p in fake.payloads[requests:]
+        if "models(" in p["query"] and "rawCode" in p["query"]
+    ]
+    assert fetched == [["model.tpch.fct_orders"]]
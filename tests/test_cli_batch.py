@@ -0,0 +1,121 @@
+# stdlib
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+# third party
+import pytest
+import typer
+from typer.testing import CliRunner
+
+# first party
+from dbtc.cli import app
+from dbtc.cli import batch as batch_module
+
+runner = CliRunner()
+
+
+class FakeCloud:
+    def __init__(self):
+        self.threads = set()
+
+    def get_run(self, account_id, run_id, include_related=None):
+        self.threads.add(threading.get_ident())
+        # Finish later lines first to check results are written in input order
+        time.sleep(0.01 * (5 - run_id % 5))
+        return {"data": {"id": run_id, "account_id": account_id}}
+
+    def list_runs(self, account_id, offset=None, limit=None, **kwargs):
+        runs = [{"id": run_id} for run_id in range(5)]
+        return {"data": runs[offset or 0 :][: limit or len(runs)]}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = SimpleNamespace(cloud=FakeCloud())
+    monkeypatch.setattr(batch_module, "dbtc", lambda **kwargs: fake)
+    return fake
+
+
+def _invoke(lines, *args):
+    result = runner.invoke(app, ["batch", *args], input="\n".join(lines))
+    return result, [json.loads(line) for line in result.stdout.splitlines()]
+
+
+def test_batch_commands_in_input_order(client):
+    lines = [f"runs get --account-id 1 --run-id {i}" for i in range(10)]
+    result, results = _invoke(lines, "--concurrency", "4")
+    assert result.exit_code == 0
+    assert [r["line"] for r in results] == list(range(1, 11))
+    assert [r["response"]["data"]["id"] for r in results] == list(range(10))
+    assert len(client.cloud.threads) > 1
+
+
+def test_batch_json_operations_and_legacy_commands(client):
+    lines = [
+        "# skipped",
+        "",
+        '{"method": "get_run", "args": [1, 2]}',
+        "get-run --account-id 1 --run-id 3",
+    ]
+    result, results = _invoke(lines)
+    assert result.exit_code == 0
+    assert [(r["line"], r["response"]["data"]["id"]) for r in results] == [
+        (3, 2),
+        (4, 3),
+    ]
+
+
+def test_batch_reports_errors(client):
+    lines = [
+        "runs get --run-id 1",
+        '{"method": "_make_request"}',
+        "not-a-command",
+        "runs get --account-id 1 --run-id 1",
+    ]
+    result, results = _invoke(lines)
+    assert result.exit_code == 1
+    assert [r["ok"] for r in results] == [False, False, False, True]
+    assert "--account-id" in results[0]["error"]
+
+
+def test_batch_has_no_completion_options():
+    params = [param.name for param in typer.main.get_command(batch_module.app).params]
+    assert params == ["file", "concurrency"]
+
+
+def test_batch_rejects_lines_that_write_elsewhere(client, tmp_path):
+    output = tmp_path / "runs.json"
+    lines = [
+        f"--output {output} runs get --account-id 1 --run-id 1",
+        "--format=csv runs get --account-id 1 --run-id 1",
+        "runs get --account-id 1 --run-id 1 --help",
+        "--version",
+        "batch",
+        "--host example.com runs get --account-id 1 --run-id 1",
+    ]
+    result, results = _invoke(lines)
+    assert result.exit_code == 1
+    assert [r["ok"] for r in results] == [False] * 5 + [True]
+    assert "--output" in results[0]["error"]
+    assert "--format" in results[1]["error"]
+    assert "--help" in results[2]["error"]
+    assert "--version" in results[3]["error"]
+    assert "batch" in results[4]["error"]
+    assert not output.exists()
+
+
+def test_batch_all_pages_applies_to_every_line(client):
+    result = runner.invoke(
+        app,
+        ["--all-pages", "batch"],
+        input="runs list --account-id 1 --limit 2",
+    )
+    (line,) = [json.loads(line) for line in result.stdout.splitlines()]
+    assert line["response"]["data"] == [{"id": run_id} for run_id in range(5)]
+
+
+def test_batch_rejects_other_formats(client):
+    result = runner.invoke(app, ["--format", "csv", "batch"], input="")
+    assert result.exit_code != 0
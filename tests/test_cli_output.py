@@ -0,0 +1,86 @@
+# stdlib
+import csv
+import io
+import json
+
+# first party
+from dbtc.cli._output import infer_format, iter_pages, write_responses
+
+RUNS = [{"id": i, "trigger": {"cause": "test"}} for i in range(250)]
+
+
+def list_runs(account_id, *, offset=None, limit=None, status=None):
+    offset = offset or 0
+    limit = limit or 100
+    return {
+        "status": {"code": 200},
+        "data": RUNS[offset : offset + limit],
+        "extra": {"pagination": {"total_count": len(RUNS)}},
+    }
+
+
+def test_iter_pages_single_request():
+    pages = list(iter_pages(list_runs, 1, offset=None, limit=10))
+    assert len(pages) == 1
+    assert len(pages[0]["data"]) == 10
+
+
+def test_iter_pages_all_pages():
+    pages = list(iter_pages(list_runs, 1, all_pages=True, offset=None, limit=None))
+    assert [len(page["data"]) for page in pages] == [100, 100, 50]
+
+
+def test_iter_pages_ignores_commands_without_offset():
+    pages = list(iter_pages(lambda: {"data": []}, all_pages=True))
+    assert len(pages) == 1
+
+
+def test_infer_format():
+    assert infer_format(None) == "json"
+    assert infer_format("runs.jsonl") == "ndjson"
+    assert infer_format("runs.CSV") == "csv"
+    assert infer_format("runs.json") == "json"
+
+
+def _write(capsys, output_format, all_pages=True):
+    pages = iter_pages(list_runs, 1, all_pages=all_pages, offset=None, limit=None)
+    write_responses(pages, output_format=output_format, all_pages=all_pages)
+    return capsys.readouterr().out
+
+
+def test_write_json_all_pages(capsys):
+    assert json.loads(_write(capsys, "json"))["data"] == RUNS
+
+
+def test_write_json_single_page(capsys):
+    assert json.loads(_write(capsys, "json", all_pages=False)) == list_runs(1)
+
+
+def test_write_ndjson(capsys):
+    lines = _write(capsys, "ndjson").splitlines()
+    assert [json.loads(line) for line in lines] == RUNS
+
+
+def test_write_csv(capsys):
+    rows = list(csv.DictReader(io.StringIO(_write(capsys, "csv"))))
+    assert len(rows) == len(RUNS)
+    assert json.loads(rows[0]["trigger"]) == {"cause": "test"}
+
+
+def test_write_parquet(tmp_path):
+    # third party
+    import pyarrow.parquet as pq
+
+    output = str(tmp_path / "runs.parquet")
+    pages = iter_pages(list_runs, 1, all_pages=True, offset=None, limit=None)
+    write_responses(pages, output=output, all_pages=True)
+    assert pq.read_table(output).column("id").to_pylist() == list(range(250))
+
+
+def test_write_parquet_text_response(tmp_path):
+    # third party
+    import pyarrow.parquet as pq
+
+    output = str(tmp_path / "sql.parquet")
+    write_responses(iter(["select 1"]), output=output)
+    assert pq.read_table(output).column("value").to_pylist() == ["select 1"]
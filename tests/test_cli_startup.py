@@ -0,0 +1,42 @@
+# stdlib
+import subprocess
+import sys
+
+# third party
+import pytest
+from typer.testing import CliRunner
+
+# first party
+from dbtc.cli import SUB_APPS, _load, app
+
+runner = CliRunner()
+
+
+@pytest.mark.parametrize("name,module_name", SUB_APPS.items())
+def test_sub_app_names_match_registry(name, module_name):
+    assert _load(module_name).app.info.name == name
+
+
+def test_only_invoked_sub_app_is_imported():
+    script = (
+        "import sys; from typer.testing import CliRunner; from dbtc.cli import app; "
+        "CliRunner().invoke(app, ['runs', 'get', '--run-id', '1']); "
+        "print(','.join(sorted(m for m in sys.modules if m.startswith('dbtc.cli.'))))"
+    )
+    loaded = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout.strip()
+    sub_apps = [m for m in loaded.split(",") if not m.startswith("dbtc.cli._")]
+    assert sub_apps == ["dbtc.cli.runs"]
+
+
+def test_legacy_alias_resolves():
+    result = runner.invoke(app, ["get-run", "--run-id", "1"])
+    assert "No such command" not in result.output
+    assert "--account-id" in result.output
+
+
+def test_unknown_command():
+    result = runner.invoke(app, ["not-a-command"])
+    assert result.exit_code != 0
+    assert "No such command" in result.output
@@ -0,0 +1,213 @@
+# stdlib
+import itertools
+
+# third party
+import pytest
+import requests
+
+# first party
+from dbtc.client.admin import _AdminClient
+from dbtc.client.dag import JobDAG
+from dbtc.client.runs import JobRunStatus, RunPoller, as_completed, wait_all
+from dbtc.console import err_console
+
+ACCOUNT_ID = 1
+
+
+class FakeAdminClient:
+    """Completes every run on the first poll with a status determined by `outcomes`"""
+
+    _run_status_formatted = _AdminClient._run_status_formatted
+
+    def __init__(self, outcomes=None, untriggerable=None, unretriable=None):
+        self.console = err_console
+        self.outcomes = {k: list(v) for k, v in (outcomes or {}).items()}
+        self.untriggerable = untriggerable or []
+        self.unretriable = unretriable or []
+        self.triggered = []
+        self.reruns = []
+        self.list_calls = 0
+        self._ids = itertools.count(1)
+        self._runs = {}
+
+    def _new_run(self, job_id):
+        outcomes = self.outcomes.get(job_id, [])
+        status = outcomes.pop(0) if outcomes else JobRunStatus.SUCCESS
+        run_id = next(self._ids)
+        self._runs[run_id] = status
+        return {
+            "status": {"is_success": True},
+            "data": {
+                "id": run_id,
+                "account_id": ACCOUNT_ID,
+                "job_definition_id": job_id,
+                "status": JobRunStatus.QUEUED,
+                "href": "",
+            },
+        }
+
+    def trigger_job(self, account_id, job_id, payload, *, should_poll=True):
+        if job_id in self.untriggerable:
+            return {"status": {"is_success": False}, "data": None}
+
+        self.triggered.append(job_id)
+        return self._new_run(job_id)
+
+    def trigger_job_from_failure(self, account_id, job_id, *, should_poll=True):
+        self.reruns.append(job_id)
+        if job_id in self.unretriable:
+            return {"status": {"is_success": False}, "data": None}
+
+        return self._new_run(job_id)
+
+    def list_runs(self, account_id, **kwargs):
+        self.list_calls += 1
+        return {"data": []}
+
+    def get_run(self, account_id, run_id):
+        return {"data": {"id": run_id, "status": self._runs[run_id], "href": ""}}
+
+
+def test_dag_triggers_in_dependency_order():
+    client = FakeAdminClient()
+    dag = JobDAG(client, ACCOUNT_ID, {2: [1], 3: [1], 4: [2, 3]}, poll_interval=0)
+    results = dag.run()
+    assert client.triggered[0] == 1
+    assert set(client.triggered[1:3]) == {2, 3}
+    assert client.triggered[3] == 4
+    assert all(r["data"]["status"] == JobRunStatus.SUCCESS for r in results.values())
+
+
+def test_dag_skips_downstream_of_failure():
+    client = FakeAdminClient(outcomes={2: [JobRunStatus.ERROR]})
+    results = JobDAG(
+        client, ACCOUNT_ID, {2: [1], 3: [1], 4: [2], 5: [3]}, poll_interval=0
+    ).run()
+    assert results[2]["data"]["status"] == JobRunStatus.ERROR
+    assert results[4] is None
+    assert results[5]["data"]["status"] == JobRunStatus.SUCCESS
+    assert 4 not in client.triggered
+
+
+def test_dag_retries_from_failure():
+    client = FakeAdminClient(outcomes={1: [JobRunStatus.ERROR, JobRunStatus.SUCCESS]})
+    results = JobDAG(client, ACCOUNT_ID, {2: [1]}, retries=1, poll_interval=0).run()
+    assert client.reruns == [1]
+    assert results[2]["data"]["status"] == JobRunStatus.SUCCESS
+
+
+def test_dag_untriggerable_job_skips_downstream():
+    client = FakeAdminClient(untriggerable=[1])
+    results = JobDAG(client, ACCOUNT_ID, {2: [1], 3: []}, poll_interval=0).run()
+    assert results[1] is None
+    assert results[2] is None
+    assert results[3]["data"]["status"] == JobRunStatus.SUCCESS
+
+
+def test_dag_untriggerable_retry_skips_downstream():
+    client = FakeAdminClient(outcomes={1: [JobRunStatus.ERROR]}, unretriable=[1])
+    results = JobDAG(
+        client, ACCOUNT_ID, {2: [1], 3: []}, retries=1, poll_interval=0
+    ).run()
+    assert client.reruns == [1]
+    assert results[1]["data"]["status"] == JobRunStatus.ERROR
+    assert results[2] is None
+    assert results[3]["data"]["status"] == JobRunStatus.SUCCESS
+
+
+def _admin_with_rejected_reruns(fake: FakeAdminClient) -> _AdminClient:
+    """Admin client whose real `trigger_job_from_failure` is always rejected"""
+    admin = _AdminClient(requests.Session(), api_key="fake")
+    for method in ("trigger_job", "list_runs", "get_run"):
+        setattr(admin, method, getattr(fake, method))
+
+    def simple_request(path, *, method="get", **kwargs):
+        assert path.endswith("/rerun/")
+        fake.reruns.append(path)
+        return {"status": {"is_success": False}, "data": None}
+
+    admin._simple_request = simple_request
+    return admin
+
+
+def test_dag_rejected_rerun_from_admin_client_skips_downstream():
+    fake = FakeAdminClient(outcomes={1: [JobRunStatus.ERROR]})
+    admin = _admin_with_rejected_reruns(fake)
+    results = JobDAG(
+        admin, ACCOUNT_ID, {2: [1], 3: []}, retries=1, poll_interval=0
+    ).run()
+    assert len(fake.reruns) == 1
+    assert results[1]["data"]["status"] == JobRunStatus.ERROR
+    assert results[2] is None
+    assert results[3]["data"]["status"] == JobRunStatus.SUCCESS
+
+
+def test_dag_cycle():
+    with pytest.raises(ValueError):
+        JobDAG(FakeAdminClient(), ACCOUNT_ID, {1: [2], 2: [1]})
+
+
+def test_poller_shares_list_request():
+    client = FakeAdminClient()
+    poller = RunPoller(client, poll_interval=0)
+    for job_id in range(3):
+        poller.add(client.trigger_job(ACCOUNT_ID, job_id, {}))
+    completed = poller.poll()
+    assert len(completed) == 3
+    assert client.list_calls == 1
+    assert len(poller) == 0
+
+
+def test_trigger_job_async_resolves_futures():
+    admin = _AdminClient(requests.Session(), api_key="fake")
+    fake = FakeAdminClient(outcomes={2: [JobRunStatus.ERROR, JobRunStatus.SUCCESS]})
+    for method in ("trigger_job", "trigger_job_from_failure", "list_runs", "get_run"):
+        setattr(admin, method, getattr(fake, method))
+    futures = [
+        admin.trigger_job_async(ACCOUNT_ID, job_id, {}, poll_interval=0, retries=1)
+        for job_id in range(1, 4)
+    ]
+    _, not_done = wait_all(futures, timeout=5)
+    assert not not_done
+    assert fake.reruns == [2]
+    assert [f.result()["data"]["status"] for f in futures] == [JobRunStatus.SUCCESS] * 3
+    assert len(list(as_completed(futures, timeout=0))) == 3
+
+
+def test_trigger_job_async_fails_future_when_retry_raises():
+    admin = _AdminClient(requests.Session(), api_key="fake")
+    fake = FakeAdminClient(outcomes={2: [JobRunStatus.ERROR]})
+
+    def trigger_job_from_failure(account_id, job_id, *, should_poll=True):
+        raise requests.ConnectionError("connection reset")
+
+    for method in ("trigger_job", "list_runs", "get_run"):
+        setattr(admin, method, getattr(fake, method))
+    admin.trigger_job_from_failure = trigger_job_from_failure
+    futures = [
+        admin.trigger_job_async(ACCOUNT_ID, job_id, {}, poll_interval=0, retries=1)
+        for job_id in range(1, 4)
+    ]
+    _, not_done = wait_all(futures, timeout=5)
+    assert not not_done
+    with pytest.raises(requests.ConnectionError):
+        futures[1].result(timeout=0)
+    assert futures[0].result()["data"]["status"] == JobRunStatus.SUCCESS
+    assert futures[2].result()["data"]["status"] == JobRunStatus.SUCCESS
+
+
+def test_trigger_job_async_rejected_rerun_resolves_with_response():
+    fake = FakeAdminClient(outcomes={2: [JobRunStatus.ERROR]})
+    admin = _admin_with_rejected_reruns(fake)
+    futures = [
+        admin.trigger_job_async(ACCOUNT_ID, job_id, {}, poll_interval=0, retries=1)
+        for job_id in range(1, 4)
+    ]
+    _, not_done = wait_all(futures, timeout=5)
+    assert not not_done
+    assert len(fake.reruns) == 1
+    assert futures[1].result(timeout=0) == {
+        "status": {"is_success": False},
+        "data": None,
+    }
+    assert futures[0].result()["data"]["status"] == JobRunStatus.SUCCESS
@@ -0,0 +1,183 @@
+# stdlib
+import hashlib
+import json
+
+# third party
+import pytest
+
+# first party
+from dbtc.client.metadata import QUERIES
+from dbtc.graphql import (
+    PagePaths,
+    batch_document,
+    count_fields,
+    encode_payload,
+    lookup,
+    page_paths,
+    parse_operation,
+    parse_selections,
+    persisted_payload,
+    split_batch_response,
+)
+
+
+def test_parse_selections_skips_arguments_and_expands_fragments():
+    document = """
+    # Comments and strings containing braces are ignored
+    query Models($first: Int = 5, $after: String) @cached(ttl: "1{0}") {
+      env: environment(id: 1) {
+        ...Applied
+      }
+    }
+    fragment Applied on Environment {
+      applied {
+        ... on AppliedState @include(if: true) {
+          models(first: $first, after: $after, filter: {tags: ["a", "b"]}) {
+            info: pageInfo { endCursor hasNextPage }
+            nodes { description(format: \"\"\"a "quoted" } block\"\"\") }
+          }
+        }
+      }
+    }
+    """
+    (environment,) = parse_selections(document)
+    assert (environment.name, environment.key) == ("environment", "env")
+    assert page_paths(document) == PagePaths(
+        page_info=("data", "env", "applied", "models", "info"),
+        items=("data", "env", "applied", "models", "nodes"),
+    )
+
+
+def test_parse_operation_and_arguments():
+    document = """
+    fragment Node on Model { uniqueId }
+    query Models($id: BigInt!, $first: Int = 5, $tags: [String!]) {
+      environment(id: $id) {
+        applied {
+          models(first: $first, filter: {tags: $tags}, after: "x") {
+            edges { node { ...Node } }
+          }
+        }
+      }
+    }
+    """
+    operation = parse_operation(document)
+    assert operation.type == "query"
+    assert operation.variables == {
+        "id": ("BigInt!", False),
+        "first": ("Int", True),
+        "tags": ("[String!]", False),
+    }
+    assert operation.used == ("id", "first", "tags")
+    (environment,) = parse_selections(document)
+    assert environment.arguments == {"id": "$id"}
+    models = environment.selections[0].selections[0]
+    assert set(models.arguments) == {"first", "filter", "after"}
+    assert models.arguments["first"] == "$first"
+    assert parse_operation("{ environment { name } }").variables == {}
+
+
+def test_page_paths_ignores_lists_before_the_connection():
+    assert page_paths(QUERIES["recommendations"]) == PagePaths(
+        page_info=("data", "recommendations", "rules", "pageInfo"),
+        items=("data", "recommendations", "rules", "edges"),
+    )
+
+
+def test_page_paths_without_pagination():
+    assert page_paths(QUERIES["mesh_projects"]) is None
+    assert page_paths("not { graphql") is None
+
+
+def test_parse_errors():
+    with pytest.raises(ValueError):
+        parse_selections("query { models { uniqueId }")
+
+
+def test_lookup():
+    data = {"data": {"environment": None}}
+    assert lookup(data, ("data", "environment", "applied")) is None
+    assert lookup(data, ("data",)) == {"environment": None}
+
+
+def test_batch_document_aliases_fields_and_renames_variables():
+    document = """
+    query Model($environmentId: BigInt!, $uniqueId: String!) {
+      performance(environmentId: $environmentId) {
+        modelInformation(uniqueId: $uniqueId) { name }
+      }
+    }
+    """
+    merged, keys = batch_document(document, 2, ("uniqueId",))
+    assert keys == ("performance",)
+    assert merged.startswith(
+        "query Batch($environmentId : BigInt ! "
+        "$uniqueId_0 : String ! $uniqueId_1 : String !)"
+    )
+    assert [field.key for field in parse_selections(merged)] == ["m0", "m1"]
+    assert "uniqueId : $uniqueId_1" in merged
+    assert count_fields(merged) == 2 * count_fields(document)
+
+
+def test_batch_document_with_several_fields():
+    merged, keys = batch_document(
+        "query { a: models { name } sources { name } }", 2, ()
+    )
+    assert keys == ("a", "sources")
+    assert [field.key for field in parse_selections(merged)] == [
+        "m0_a",
+        "m0_sources",
+        "m1_a",
+        "m1_sources",
+    ]
+    assert [field.name for field in parse_selections(merged)][:2] == [
+        "models",
+        "sources",
+    ]
+
+
+def test_batch_document_requires_a_single_query():
+    with pytest.raises(ValueError):
+        batch_document("mutation { a }", 2, ())
+    with pytest.raises(ValueError):
+        batch_document("query { a } query { b }", 2, ())
+
+
+def test_split_batch_response_routes_errors():
+    response = {
+        "data": {"m0": {"name": "a"}, "m1": None},
+        "errors": [
+            {"message": "missing", "path": ["m1", "name"]},
+            {"message": "timeout"},
+        ],
+    }
+    first, second = split_batch_response(response, 2, ("model",))
+    assert first == {
+        "data": {"model": {"name": "a"}},
+        "errors": [{"message": "timeout"}],
+    }
+    assert second == {
+        "data": {"model": None},
+        "errors": [
+            {"message": "missing", "path": ["model", "name"]},
+            {"message": "timeout"},
+        ],
+    }
+
+
+def test_encode_payload_matches_json():
+    payload = {"query": QUERIES["search"], "variables": {"environmentId": 1}}
+    assert json.loads(encode_payload(payload)) == payload
+    assert json.loads(encode_payload({"query": "{ a }"})) == {"query": "{ a }"}
+    assert json.loads(encode_payload({"variables": {}})) == {"variables": {}}
+
+
+def test_persisted_payload():
+    payload = {"query": "{ a }", "variables": {"x": 1}}
+    digest = hashlib.sha256(b"{ a }").hexdigest()
+    persisted = persisted_payload(payload)
+    assert persisted == {
+        "variables": {"x": 1},
+        "extensions": {"persistedQuery": {"version": 1, "sha256Hash": digest}},
+    }
+    assert persisted_payload(payload, include_query=True)["query"] == "{ a }"
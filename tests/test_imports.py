@@ -0,0 +1,22 @@
+# stdlib
+import subprocess
+import sys
+
+# third party
+import pytest
+
+
+@pytest.mark.parametrize("module", ["dbtc", "dbtc.cli"])
+def test_import_does_not_load_pandas_or_pyarrow(module):
+    loaded = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {module}; "
+            "print(','.join(m for m in ('pandas', 'pyarrow') if m in sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    assert loaded == ""
@@ -0,0 +1,101 @@
+# stdlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# third party
+import pytest
+
+# first party
+from dbtc import dbtCloudClient
+from dbtc.instrumentation import (
+    HistogramCollector,
+    Instrument,
+    LatencyHistogram,
+    endpoint_template,
+    graphql_operation,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def _respond(self):
+        body = json.dumps({"status": {"code": 200}, "data": {"id": 1}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_client():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = dbtCloudClient(api_key="fake", service_token="fake")
+    client.cloud.full_url = lambda path=None: (
+        f"http://127.0.0.1:{server.server_address[1]}/{path}"
+    )
+    yield client
+    server.shutdown()
+    server.server_close()
+
+
+def test_endpoint_template():
+    assert endpoint_template("accounts/43786/runs/123") == "accounts/{id}/runs/{id}"
+    assert endpoint_template("accounts/1/runs/2/artifacts/manifest.json") == (
+        "accounts/{id}/runs/{id}/artifacts/manifest.json"
+    )
+
+
+def test_graphql_operation():
+    assert graphql_operation("\nquery Performance($id: Int) {}") == "Performance"
+    assert graphql_operation("{models {uniqueId}}") == "anonymous"
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+    assert histogram.count == 1000
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.01)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.01)
+    assert histogram.percentile(100) == 1.0
+    assert histogram.count_at_or_below(0.1) == pytest.approx(100, abs=1)
+
+
+def test_hooks_receive_request_details(local_client):
+    events = []
+
+    class Recorder(Instrument):
+        def before_request(self, event):
+            events.append(("before", event.endpoint))
+
+        def after_request(self, event):
+            events.append(("after", event))
+
+    collector = HistogramCollector()
+    local_client.add_instrument(Recorder())
+    local_client.add_instrument(collector)
+    local_client.cloud.get_run(43786, 123)
+
+    assert events[0] == ("before", "/api/v2/accounts/{id}/runs/{id}")
+    event = events[1][1]
+    assert event.method == "GET"
+    assert event.status_code == 200
+    assert event.response_bytes > 0
+    assert event.retries == 0
+    assert event.total_time >= event.network_time + event.decode_time
+
+    text = collector.prometheus_text()
+    assert (
+        'dbtc_requests_total{client="cloud",method="GET",'
+        'endpoint="/api/v2/accounts/{id}/runs/{id}",status="200"} 1'
+    ) in text
+    assert 'phase="network",le="+Inf"} 1' in text
@@ -0,0 +1,114 @@
+# stdlib
+from typing import Dict, List, Optional
+
+# third party
+import pytest
+
+# first party
+from tests.conftest import FakeDiscovery, answer_aliases
+
+# stg_customers.id -> dim_customers.customer_id -> fct_orders.customer_id
+#                                               -> rpt_churn.customer_id
+EDGES = {
+    "model.tpch.stg_customers.id": ["model.tpch.dim_customers.customer_id"],
+    "model.tpch.dim_customers.customer_id": [
+        "model.tpch.fct_orders.customer_id",
+        "model.tpch.rpt_churn.customer_id",
+    ],
+    "model.tpch.dim_customers.name": [],
+}
+
+
+def _record(column: str, run_id: int) -> Dict:
+    node, _, name = column.rpartition(".")
+    return {
+        "runId": run_id,
+        "nodeUniqueId": node,
+        "uniqueId": column,
+        "name": name,
+        "parentColumns": [p for p, children in EDGES.items() if column in children],
+        "childColumns": EDGES.get(column, []),
+    }
+
+
+class FakeLineage(FakeDiscovery):
+    """Returns the columns of each requested node along with their parents"""
+
+    def __init__(self):
+        super().__init__()
+        self.nodes: List[str] = []
+        self.run_id = 1
+        self.errors: Optional[List[Dict]] = None
+
+    def respond(self, query: str, variables: Dict):
+        if self.errors is not None:
+            return {"errors": self.errors}
+
+        return answer_aliases(query, variables, "nodeUniqueId", self._lineage)
+
+    def _lineage(self, node: str) -> Dict:
+        self.nodes.append(node)
+        columns = {c for c in EDGES if c.startswith(f"{node}.")}
+        columns |= {p for c in columns for p in _record(c, 0)["parentColumns"]}
+        return {"lineage": [_record(column, self.run_id) for column in sorted(columns)]}
+
+
+@pytest.fixture
+def discovery(fake_discovery):
+    fake = FakeLineage()
+    return fake_discovery(fake).metadata, fake
+
+
+def test_graph_traversal(discovery):
+    metadata, fake = discovery
+    graph = metadata.column_lineage_graph(
+        1, ["model.tpch.dim_customers", "model.tpch.dim_customers"], batch_size=1
+    )
+    assert fake.nodes == ["model.tpch.dim_customers"]
+    assert graph.upstream("model.tpch.dim_customers.customer_id") == {
+        "model.tpch.stg_customers.id"
+    }
+    assert graph.downstream("model.tpch.stg_customers.id") == {
+        "model.tpch.dim_customers.customer_id",
+        "model.tpch.fct_orders.customer_id",
+        "model.tpch.rpt_churn.customer_id",
+    }
+    assert graph.downstream("model.tpch.stg_customers.id", depth=1) == {
+        "model.tpch.dim_customers.customer_id"
+    }
+    assert graph.impact("model.tpch.dim_customers") == {
+        "model.tpch.fct_orders": {"customer_id"},
+        "model.tpch.rpt_churn": {"customer_id"},
+    }
+
+
+def test_fetch_deduplicates_and_refreshes_by_run(discovery):
+    metadata, fake = discovery
+    graph = metadata.column_lineage_graph(1, ["model.tpch.dim_customers"])
+    graph.fetch(["model.tpch.dim_customers", "model.tpch.stg_customers"])
+    assert fake.nodes == ["model.tpch.dim_customers", "model.tpch.stg_customers"]
+    assert graph.run_id("model.tpch.dim_customers") == 1
+
+    memo = graph._memo
+    graph.downstream("model.tpch.stg_customers.id")
+    graph.fetch(["model.tpch.dim_customers"], refresh=True)
+    assert graph._memo is memo and memo
+
+    fake.run_id = 2
+    graph.fetch(["model.tpch.dim_customers"], refresh=True)
+    assert graph.run_id("model.tpch.dim_customers") == 2
+    assert not graph._memo
+
+
+def test_errors_are_retried(discovery):
+    metadata, fake = discovery
+    errors = [{"message": "lineage unavailable"}]
+    fake.errors = errors
+    graph = metadata.column_lineage_graph(1, ["model.tpch.dim_customers"])
+    assert graph.errors == {"model.tpch.dim_customers": errors}
+    assert graph.nodes == []
+
+    fake.errors = None
+    graph.fetch(["model.tpch.dim_customers"])
+    assert graph.errors == {}
+    assert "model.tpch.dim_customers.customer_id" in graph
@@ -0,0 +1,121 @@
+# stdlib
+from typing import Dict, List
+
+# third party
+import pytest
+
+# first party
+from dbtc.client.mesh import _topological_order
+
+PROJECTS = [
+    {
+        "projectId": 1,
+        "dbtCoreProject": "core",
+        "projectSummary": {"publicModels": 1},
+        "dependentProjects": [{"projectId": 2}, {"projectId": 3}],
+    },
+    {
+        "projectId": 2,
+        "dbtCoreProject": "finance",
+        "projectSummary": {"publicModels": 1},
+        "dependentProjects": [{"projectId": 3}],
+    },
+    {
+        "projectId": 3,
+        "dbtCoreProject": "reports",
+        "projectSummary": {"publicModels": 0},
+        "dependentProjects": [],
+    },
+]
+
+MODELS = [
+    {
+        "uniqueId": "model.finance.revenue",
+        "projectId": 2,
+        "isDefaultEnv": False,
+        "dependentProjects": [],
+        "publicAncestors": [],
+    },
+    {
+        "uniqueId": "model.core.customers",
+        "projectId": 1,
+        "isDefaultEnv": True,
+        "dependentProjects": [{"projectId": 2}],
+        "publicAncestors": [],
+    },
+    {
+        "uniqueId": "model.finance.revenue",
+        "projectId": 2,
+        "isDefaultEnv": True,
+        "dependentProjects": [{"projectId": 3}],
+        "publicAncestors": [{"uniqueId": "model.core.customers"}],
+    },
+    {
+        "uniqueId": "model.core.orders",
+        "projectId": 1,
+        "isDefaultEnv": True,
+        "dependentProjects": [],
+        "publicAncestors": [],
+    },
+]
+
+
+@pytest.fixture
+def mesh(fake_discovery):
+    payloads: List[Dict] = []
+
+    def send(method, url, json, **kwargs):
+        payloads.append(json)
+        if "meshProjects" in json["query"]:
+            account = {"meshProjects": PROJECTS}
+        else:
+            account = {
+                "publicModels": {
+                    "pageInfo": {"endCursor": None, "hasNextPage": False},
+                    "edges": [{"node": node} for node in MODELS],
+                }
+            }
+        return {"data": {"account": account}}
+
+    return fake_discovery(send).metadata.mesh_graph(1), payloads
+
+
+def test_build(mesh):
+    graph, payloads = mesh
+    assert len(payloads) == 2
+    assert len(graph) == 3
+    assert 1 in graph and "model.core.customers" in graph
+    assert graph.projects[1]["dbtCoreProject"] == "core"
+    assert graph.models["model.finance.revenue"]["isDefaultEnv"] is True
+
+
+def test_projects(mesh):
+    graph, _ = mesh
+    assert graph.downstream_projects(1) == {2, 3}
+    assert graph.downstream_projects(3) == set()
+    assert graph.upstream_projects(3) == {1, 2}
+    assert graph.project_order() == [1, 2, 3]
+    with pytest.raises(ValueError):
+        graph.downstream_projects(4)
+
+
+def test_models_and_impact(mesh):
+    graph, _ = mesh
+    assert graph.downstream_models("model.core.customers") == {"model.finance.revenue"}
+    assert graph.upstream_models("model.finance.revenue") == {"model.core.customers"}
+    assert graph.impact("model.core.customers") == {
+        2: {"model.finance.revenue"},
+        3: set(),
+    }
+    assert graph.impact("model.core.orders") == {}
+    order = graph.model_order()
+    assert order.index("model.core.customers") < order.index("model.finance.revenue")
+    assert graph.model_order(1) == ["model.core.customers", "model.core.orders"]
+    with pytest.raises(ValueError):
+        graph.impact("model.core.missing")
+
+
+def test_cycles_are_rejected():
+    assert _topological_order([{2}, {2}, set()]) == [0, 1, 2]
+    with pytest.raises(ValueError):
+        _topological_order([{1}, {0}])
@@ -0,0 +1,76 @@
+# stdlib
+from typing import Dict
+
+# third party
+import pytest
+
+# first party
+from tests.conftest import FakeDiscovery, answer_aliases
+
+
+class FakePerformance(FakeDiscovery):
+    """Answers each aliased `performance` field with the model it was asked for"""
+
+    def respond(self, query: str, variables: Dict):
+        return answer_aliases(
+            query,
+            variables,
+            "uniqueId",
+            lambda unique_id: {"jobInformation": [{"name": unique_id}]},
+        )
+
+
+@pytest.fixture
+def discovery(fake_discovery):
+    fake = FakePerformance()
+    return fake_discovery(fake).metadata, fake
+
+
+def test_list_of_unique_ids_is_batched(discovery):
+    metadata, fake = discovery
+    unique_ids = [f"model.test.m{i}" for i in range(5)]
+    responses = metadata.model_job_information(
+        1, "2024-01-01", "2024-01-31", unique_ids, batch_size=2
+    )
+    assert len(fake.payloads) == 3
+    assert list(responses) == unique_ids
+    for unique_id, response in responses.items():
+        assert response == {
+            "data": {"performance": {"jobInformation": [{"name": unique_id}]}}
+        }
+
+    variables = fake.payloads[-1]["variables"]
+    assert variables == {
+        "environmentId": 1,
+        "start": "2024-01-01",
+        "end": "2024-01-31",
+        "uniqueId_0": "model.test.m4",
+    }
+
+
+def test_single_unique_id_is_unchanged(discovery):
+    metadata, fake = discovery
+    response = metadata.model_job_information(
+        1, "2024-01-01", "2024-01-31", "model.test.m0"
+    )
+    assert response == {
+        "data": {"performance": {"jobInformation": [{"name": "model.test.m0"}]}}
+    }
+    assert fake.payloads[0]["variables"]["uniqueId"] == "model.test.m0"
+
+
+def test_batches_are_limited_by_field_count(discovery):
+    metadata, fake = discovery
+    metadata.batch_query(
+        "query Jobs($uniqueId: String!) "
+        "{ performance { jobInformation(uniqueId: $uniqueId) { name } } }",
+        [{"uniqueId": str(i)} for i in range(4)],
+        max_fields=6,
+    )
+    assert len(fake.payloads) == 2
+
+
+def test_paginated_queries_are_not_batched(discovery):
+    metadata, _ = discovery
+    with pytest.raises(ValueError):
+        metadata.batch_query("query { models { pageInfo { endCursor } } }", [{}, {}])
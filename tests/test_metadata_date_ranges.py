@@ -0,0 +1,151 @@
+# stdlib
+from typing import Dict, List
+
+# third party
+import pytest
+
+# first party
+from dbtc.client.metadata import _date_chunks
+from tests.conftest import FakeDiscovery, answer_aliases
+
+# Executions of each model, and failures, by (start, end) sub-range
+EXECUTIONS = {
+    ("2024-01-01", "2024-01-07"): {"model.a": (10, 1), "model.b": (30, 0)},
+    ("2024-01-08", "2024-01-14"): {"model.a": (30, 3), "model.c": (5, 5)},
+    ("2024-01-15", "2024-01-16"): {"model.a": (10, 0), "model.b": (5, 0)},
+}
+
+
+class FakePerformance(FakeDiscovery):
+    """Serves the models executed in each sub-range of `EXECUTIONS`"""
+
+    @property
+    def variables(self) -> List[Dict]:
+        return [payload["variables"] for payload in self.payloads]
+
+    def respond(self, query: str, variables: Dict):
+        if "modelExecutionHistory" in query:
+            return answer_aliases(
+                query,
+                variables,
+                "startDate",
+                lambda date: {
+                    "modelExecutionHistory": [{"date": date, "executionTimes": [1.0]}]
+                },
+            )
+
+        models = EXECUTIONS[(variables["start"], variables["end"])]
+        if "mostExecutedModels" in query:
+            rows = [
+                {
+                    "uniqueId": unique_id,
+                    "totalExecutions": total,
+                    "byJob": [{"jobId": 1, "totalExecutions": total}],
+                }
+                for unique_id, (total, _) in models.items()
+            ]
+            rows.sort(key=lambda row: -row["totalExecutions"])
+            return _performance("mostExecutedModels", rows[: variables["limit"]])
+
+        if "longestExecutedModels" in query:
+            rows = [
+                {
+                    "uniqueId": unique_id,
+                    "maxExecutionTime": float(total),
+                    "averageExecutionTime": total / 2,
+                    "byJob": [],
+                }
+                for unique_id, (total, _) in models.items()
+            ]
+            return _performance("longestExecutedModels", rows)
+
+        rows = [
+            {
+                "uniqueId": unique_id,
+                "failurePercentage": 100 * failed / total,
+                "totalExecutions": total,
+                "totalFailedExecutions": failed,
+            }
+            for unique_id, (total, failed) in models.items()
+        ]
+        return _performance("mostExecutionFailedModels", rows)
+
+
+def _performance(field: str, rows: List[Dict]) -> Dict:
+    return {"data": {"performance": {field: rows}}}
+
+
+@pytest.fixture
+def client(fake_discovery):
+    fake = FakePerformance()
+    return fake_discovery(fake).metadata, fake
+
+
+def _rows(response: Dict, field: str) -> List[Dict]:
+    return response["data"]["performance"][field]
+
+
+def test_date_chunks():
+    assert _date_chunks("2024-01-01", "2024-01-16", 7) == list(EXECUTIONS)
+    assert _date_chunks("2024-01-01", "2024-01-01", 7) == [("2024-01-01", "2024-01-01")]
+    with pytest.raises(ValueError):
+        _date_chunks("2024-01-02", "2024-01-01", 7)
+    with pytest.raises(ValueError):
+        _date_chunks("2024-01-01", "2024-01-02", 0)
+
+
+def test_most_executed_models(client):
+    metadata, fake = client
+    response = metadata.most_executed_models(
+        1, "2024-01-01", "2024-01-16", limit=2, chunk_days=7
+    )
+    rows = _rows(response, "mostExecutedModels")
+    assert [(row["uniqueId"], row["totalExecutions"]) for row in rows] == [
+        ("model.a", 50),
+        ("model.b", 35),
+    ]
+    assert rows[0]["byJob"] == [{"jobId": 1, "totalExecutions": 50}]
+    assert len(fake.variables) == 3
+    assert {v["limit"] for v in fake.variables} == {8}
+
+
+def test_longest_executed_models(client):
+    metadata, _ = client
+    response = metadata.longest_executed_models(
+        1, "2024-01-01", "2024-01-16", order_by="AVG", chunk_days=7
+    )
+    rows = _rows(response, "longestExecutedModels")
+    assert [row["uniqueId"] for row in rows] == ["model.b", "model.a", "model.c"]
+    assert rows[1]["maxExecutionTime"] == 30.0
+    assert rows[1]["averageExecutionTime"] == pytest.approx(25 / 3)
+
+
+def test_most_failed_models_weights_percentages(client):
+    metadata, _ = client
+    response = metadata.most_failed_models(
+        1, "2024-01-01", "2024-01-16", limit=2, chunk_days=7
+    )
+    rows = _rows(response, "mostExecutionFailedModels")
+    assert [row["uniqueId"] for row in rows] == ["model.c", "model.a"]
+    assert rows[1]["totalExecutions"] == 50
+    assert rows[1]["totalFailedExecutions"] == 4
+    assert rows[1]["failurePercentage"] == pytest.approx(8.0)
+
+
+def test_model_execution_history(client):
+    metadata, fake = client
+    response = metadata.model_execution_history(
+        1, "2024-01-01", "2024-01-16", "model.a", chunk_days=7
+    )
+    dates = [row["date"] for row in _rows(response, "modelExecutionHistory")]
+    assert dates == ["2024-01-01", "2024-01-08", "2024-01-15"]
+
+    responses = metadata.model_execution_history(
+        1, "2024-01-01", "2024-01-16", ["model.a", "model.b"], chunk_days=7
+    )
+    assert set(responses) == {"model.a", "model.b"}
+    dates = [
+        row["date"] for row in _rows(responses["model.b"], "modelExecutionHistory")
+    ]
+    assert dates == ["2024-01-01", "2024-01-08", "2024-01-15"]
+    assert len(fake.variables) == 3 + 3
@@ -0,0 +1,57 @@
+# stdlib
+from typing import Dict, List
+
+# third party
+import pytest
+
+# first party
+from dbtc.graphql import parse_selections
+
+
+@pytest.fixture
+def discovery(fake_discovery):
+    payloads: List[Dict] = []
+
+    def send(method, url, json, **kwargs):
+        payloads.append(json)
+        performance = {
+            "mostExecutedModels": [{"uniqueId": "model.a", "totalExecutions": 10}],
+            "longestExecutedModels": [{"uniqueId": "model.b"}],
+            "mostExecutionFailedModels": [],
+            "mostTestFailedModels": None,
+        }
+        recommendations = {
+            "metrics": [{"name": "coverage", "value": 0.5}],
+            "rules": {"edges": [{"node": {"name": "rule"}}], "totalCount": 3},
+        }
+        return {
+            "data": {"performance": performance, "recommendations": recommendations},
+            "errors": [{"message": "mostTestFailedModels failed"}],
+        }
+
+    return fake_discovery(send).metadata, payloads
+
+
+def test_performance_overview_is_one_request(discovery):
+    metadata, payloads = discovery
+    overview = metadata.performance_overview(1, "2024-01-01", "2024-01-31", first=2)
+    assert len(payloads) == 1
+    assert [field.name for field in parse_selections(payloads[0]["query"])] == [
+        "performance",
+        "recommendations",
+    ]
+    assert payloads[0]["variables"]["first"] == 2
+
+    assert overview["most_executed_models"][0]["uniqueId"] == "model.a"
+    assert overview["longest_executed_models"] == [{"uniqueId": "model.b"}]
+    assert overview["most_failed_models"] == []
+    assert overview["most_models_test_failures"] is None
+    assert overview["recommendations"]["rules"] == [{"name": "rule"}]
+    assert overview["recommendations"]["totalCount"] == 3
+    assert len(overview["errors"]) == 1
+
+
+def test_performance_overview_validates_order_by(discovery):
+    metadata, _ = discovery
+    with pytest.raises(ValueError):
+        metadata.performance_overview(1, "2024-01-01", "2024-01-31", order_by="MIN")
@@ -0,0 +1,306 @@
+# stdlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+# third party
+import pytest
+
+# first party
+from dbtc.client.metadata import QUERIES
+from tests.conftest import FakeDiscovery
+
+TOTAL_MODELS = 25
+
+MODELS_QUERY = """
+query Models($environmentId: BigInt!, $first: Int!, $after: String) {
+  environment(id: $environmentId) {
+    applied {
+      models(first: $first, after: $after) {
+        pageInfo {
+          endCursor
+          hasNextPage
+        }
+        edges {
+          node {
+            uniqueId
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+class FakeModels(FakeDiscovery):
+    """Serves `TOTAL_MODELS` models using numeric cursors"""
+
+    def respond(self, query: str, variables: Dict):
+        start = int(variables.get("after") or 0)
+        end = min(start + variables.get("first", 10), TOTAL_MODELS)
+        edges = [{"node": {"uniqueId": f"model.test.m{i}"}} for i in range(start, end)]
+        connection = {
+            "pageInfo": {"endCursor": str(end), "hasNextPage": end < TOTAL_MODELS},
+            "edges": edges,
+        }
+        if "searchResults" in query:
+            data = {"environment": {"applied": {"searchResults": connection}}}
+        elif "publicModels" in query:
+            data = {"account": {"publicModels": connection}}
+        else:
+            data = {"environment": {"applied": {"models": connection}}}
+        return {"data": data}
+
+
+@pytest.fixture
+def discovery(fake_discovery):
+    fake = FakeModels()
+    return fake_discovery(fake).metadata, fake
+
+
+def _ids(elements) -> List[str]:
+    return [element["node"]["uniqueId"] for element in elements]
+
+
+def test_query_collects_every_page(discovery):
+    metadata, _ = discovery
+    pages = metadata.query(MODELS_QUERY, {"environmentId": 1, "first": 10})
+    assert len(pages) == 3
+    elements = metadata.query(
+        MODELS_QUERY, {"environmentId": 1, "first": 10}, paginated_request_to_list=True
+    )
+    assert _ids(elements) == [f"model.test.m{i}" for i in range(TOTAL_MODELS)]
+
+
+def test_iter_query_yields_as_pages_arrive(discovery):
+    metadata, fake = discovery
+    results = metadata.iter_query(
+        MODELS_QUERY, {"environmentId": 1, "first": 10}, paginated_request_to_list=True
+    )
+    assert next(results)["node"]["uniqueId"] == "model.test.m0"
+    assert len(fake.payloads) == 1
+    assert len(list(results)) == TOTAL_MODELS - 1
+    assert len(fake.payloads) == 3
+
+
+def test_iter_query_resumes_from_checkpoint(discovery):
+    metadata, _ = discovery
+    checkpoints = []
+    results = metadata.iter_query(
+        MODELS_QUERY,
+        {"environmentId": 1, "first": 10},
+        paginated_request_to_list=True,
+        checkpoint=checkpoints.append,
+    )
+    first_page = [next(results) for _ in range(10)]
+    assert checkpoints == []
+
+    # Interrupted while reading the second page
+    next(results)
+    assert checkpoints == ["10"]
+    results.close()
+
+    rest = list(
+        metadata.iter_query(
+            MODELS_QUERY,
+            {"environmentId": 1, "first": 10},
+            paginated_request_to_list=True,
+            after=checkpoints[-1],
+            checkpoint=checkpoints.append,
+        )
+    )
+    assert _ids(first_page + rest) == [f"model.test.m{i}" for i in range(25)]
+    assert checkpoints == ["10", "20", None]
+
+
+def test_iter_query_max_pages(discovery):
+    metadata, _ = discovery
+    pages = list(metadata.iter_query(MODELS_QUERY, {"environmentId": 1, "first": 5}, 2))
+    assert len(pages) == 2
+
+
+def test_iter_query_max_results(discovery):
+    metadata, fake = discovery
+    checkpoints = []
+    elements = list(
+        metadata.iter_query(
+            MODELS_QUERY,
+            {"environmentId": 1, "first": 10},
+            paginated_request_to_list=True,
+            checkpoint=checkpoints.append,
+            max_results=13,
+        )
+    )
+    assert _ids(elements) == [f"model.test.m{i}" for i in range(13)]
+    assert [p["variables"]["first"] for p in fake.payloads] == [10, 3]
+    assert checkpoints == ["10", "13"]
+
+    pages = metadata.query(
+        MODELS_QUERY, {"environmentId": 1, "first": 10}, max_results=7
+    )
+    assert len(pages) == 1
+
+
+def test_iter_query_max_results_without_first(discovery):
+    metadata, _ = discovery
+    checkpoints = []
+    elements = list(
+        metadata.iter_query(
+            MODELS_QUERY,
+            {"environmentId": 1},
+            paginated_request_to_list=True,
+            checkpoint=checkpoints.append,
+            max_results=13,
+        )
+    )
+    # The second page is cut short, so resuming starts from the first page's cursor
+    assert _ids(elements) == [f"model.test.m{i}" for i in range(13)]
+    assert checkpoints == ["10"]
+    resumed = metadata.iter_query(
+        MODELS_QUERY,
+        {"environmentId": 1},
+        paginated_request_to_list=True,
+        after=checkpoints[-1],
+    )
+    assert _ids(resumed)[:5] == [f"model.test.m{i}" for i in range(10, 15)]
+
+
+def test_search_and_public_models_page_fully(discovery):
+    metadata, fake = discovery
+    response = metadata.search(1, "customer", first=10)
+    results = response["data"]["environment"]["applied"]["searchResults"]
+    assert _ids(results["edges"]) == [f"model.test.m{i}" for i in range(TOTAL_MODELS)]
+    assert results["pageInfo"] == {"endCursor": "25", "hasNextPage": False}
+    assert len(fake.payloads) == 3
+
+    response = metadata.public_models(1, first=10, max_results=15)
+    assert len(response["data"]["account"]["publicModels"]["edges"]) == 15
+    assert [p["variables"]["first"] for p in fake.payloads[3:]] == [10, 5]
+
+
+def test_search_paginates_custom_queries(discovery):
+    metadata, fake = discovery
+    gql_query = """
+    query Search($filter: SearchQueryFilter!, $environmentId: BigInt!, $after: String, $first: Int) {
+      environment(id: $environmentId) {
+        applied {
+          searchResults(filter: $filter, after: $after, first: $first) {
+            edges { node { uniqueId } }
+          }
+        }
+      }
+    }
+    """  # noqa: E501
+    response = metadata.search(1, "customer", gql_query=gql_query, first=10)
+    edges = response["data"]["environment"]["applied"]["searchResults"]["edges"]
+    assert len(edges) == TOTAL_MODELS
+    assert "pageInfo" in fake.payloads[0]["query"]
+
+
+def test_search_does_not_paginate_custom_queries_without_after(discovery):
+    metadata, fake = discovery
+    gql_query = """
+    query Search($filter: SearchQueryFilter!, $environmentId: BigInt!, $first: Int) {
+      environment(id: $environmentId) {
+        applied {
+          searchResults(filter: $filter, first: $first) {
+            edges { node { uniqueId } }
+          }
+        }
+      }
+    }
+    """
+    response = metadata.search(1, "customer", gql_query=gql_query, first=10)
+    edges = response["data"]["environment"]["applied"]["searchResults"]["edges"]
+    assert len(edges) == 10
+    assert len(fake.payloads) == 1
+    assert "pageInfo" not in fake.payloads[0]["query"]
+
+
+def test_list_elements_come_from_the_paginated_connection(fake_discovery):
+    def send(method, url, json, **kwargs):
+        return {
+            "data": {
+                "recommendations": {
+                    "metrics": [{"name": "coverage", "value": 1}],
+                    "rules": {
+                        "edges": [{"node": {"name": "rule"}}],
+                        "pageInfo": {"endCursor": "1", "hasNextPage": False},
+                    },
+                }
+            }
+        }
+
+    metadata = fake_discovery(send).metadata
+    rules = metadata.query(
+        QUERIES["recommendations"],
+        {"environmentId": 1, "first": 10},
+        paginated_request_to_list=True,
+    )
+    assert rules == [{"node": {"name": "rule"}}]
+
+
+def test_variables_are_not_modified(discovery):
+    metadata, fake = discovery
+    variables = {"environmentId": 1, "first": 10}
+    for _ in range(2):
+        elements = metadata.query(
+            MODELS_QUERY, variables, paginated_request_to_list=True
+        )
+        assert len(elements) == TOTAL_MODELS
+        assert variables == {"environmentId": 1, "first": 10}
+    assert [p["variables"].get("after") for p in fake.payloads[:3]] == [
+        None,
+        "10",
+        "20",
+    ]
+
+
+def test_same_variables_from_many_threads(discovery):
+    metadata, _ = discovery
+    variables = {"environmentId": 1, "first": 5}
+
+    def export(_):
+        return metadata.query(MODELS_QUERY, variables, paginated_request_to_list=True)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(export, range(16)))
+
+    expected = [f"model.test.m{i}" for i in range(TOTAL_MODELS)]
+    assert all(_ids(elements) == expected for elements in results)
+
+
+def test_query_many_tags_results_with_variables(discovery):
+    metadata, fake = discovery
+    variables_list = [{"environmentId": i, "first": 10} for i in range(12)]
+    results = list(
+        metadata.query_many(
+            MODELS_QUERY, variables_list, max_workers=4, paginated_request_to_list=True
+        )
+    )
+    assert sorted(v["environmentId"] for v, _ in results) == list(range(12))
+    assert all(len(elements) == TOTAL_MODELS for _, elements in results)
+    assert len(fake.payloads) == 12 * 3
+
+
+def test_query_many_exceptions(fake_discovery):
+    fake = FakeModels()
+
+    def send(method, url, json, **kwargs):
+        if json["variables"]["environmentId"] == 2:
+            raise ConnectionError("environment 2 is unreachable")
+        return fake(method, url, json, **kwargs)
+
+    metadata = fake_discovery(send).metadata
+    variables_list = [{"environmentId": i, "first": 10} for i in range(4)]
+    results = dict(
+        (v["environmentId"], result)
+        for v, result in metadata.query_many(
+            MODELS_QUERY, variables_list, return_exceptions=True
+        )
+    )
+    assert isinstance(results.pop(2), ConnectionError)
+    assert all(len(pages) == 3 for pages in results.values())
+
+    with pytest.raises(ConnectionError):
+        list(metadata.query_many(MODELS_QUERY, variables_list))
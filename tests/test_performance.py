@@ -0,0 +1,125 @@
+# stdlib
+import datetime
+from typing import Dict, List
+
+# third party
+import numpy as np
+import pytest
+
+# first party
+from dbtc.performance import NO_JOB, PerformanceFrame
+
+
+def _history(times_by_day: Dict[int, List[float]], job_id: int = 1) -> Dict:
+    """A `model_execution_history` response with one execution per time"""
+    start = datetime.date(2024, 1, 1)
+    return {
+        "data": {
+            "performance": {
+                "modelExecutionHistory": [
+                    {
+                        "date": str(start + datetime.timedelta(days=day)),
+                        "executionTimes": times,
+                        "executionsByJob": [
+                            {
+                                "jobId": job_id,
+                                "executionTimes": times,
+                                "executions": [
+                                    {
+                                        "runId": day * 100 + i,
+                                        "executionTime": time,
+                                        "status": "success",
+                                    }
+                                    for i, time in enumerate(times)
+                                ],
+                            }
+                        ],
+                    }
+                    for day, times in times_by_day.items()
+                ]
+            }
+        }
+    }
+
+
+@pytest.fixture
+def frame() -> PerformanceFrame:
+    steady = {day: [10.0, 12.0] for day in range(14)}
+    slower = {day: [10.0 + (day >= 10) * 10] for day in range(14)}
+    return PerformanceFrame.from_history(
+        {
+            "model.tpch.steady": _history(steady),
+            "model.tpch.slower": _history(slower, job_id=2),
+            "model.tpch.unused": {"data": {"performance": None}},
+        }
+    )
+
+
+def test_from_history(frame):
+    assert len(frame) == 28 + 14
+    assert frame.unique_ids == [
+        "model.tpch.steady",
+        "model.tpch.slower",
+        "model.tpch.unused",
+    ]
+    assert set(frame.job_id) == {1, 2}
+    assert frame.run_id[:2].tolist() == [0, 1]
+    assert frame.day[0] == np.datetime64("2024-01-01", "D").astype(np.int64)
+
+    table = frame.to_arrow()
+    assert table.num_rows == len(frame)
+    assert table.column("unique_id")[0].as_py() == "model.tpch.steady"
+
+
+def test_from_history_without_executions():
+    response = {
+        "data": {
+            "performance": {
+                "modelExecutionHistory": [
+                    {"date": "2024-01-01", "executionTimes": [1.0, None, 3.0]},
+                    {
+                        "date": "2024-01-02",
+                        "executionTimes": [5.0],
+                        "executionsByJob": [{"jobId": 7, "executionTimes": [5.0]}],
+                    },
+                ]
+            }
+        }
+    }
+    frame = PerformanceFrame.from_history([("model.tpch.a", response)])
+    assert frame.execution_time.tolist() == [1.0, 3.0, 5.0]
+    assert frame.job_id.tolist() == [NO_JOB, NO_JOB, 7]
+
+
+def test_percentiles_match_numpy(frame):
+    stats = frame.percentiles()
+    assert stats["unique_id"].tolist() == frame.unique_ids
+    assert stats["count"].tolist() == [28, 14, 0]
+    for i in range(2):
+        times = frame.execution_time[frame.model == i]
+        assert stats["mean"][i] == pytest.approx(times.mean())
+        for q in (50, 95, 99):
+            assert stats[f"p{q}"][i] == pytest.approx(np.percentile(times, q))
+    assert np.isnan(stats["p50"][2])
+
+    by_job = frame.percentiles(by="job", q=(50,))
+    assert by_job["job_id"].tolist() == [1, 2]
+    assert by_job["unique_id"].tolist() == ["model.tpch.steady", "model.tpch.slower"]
+
+    with pytest.raises(ValueError):
+        frame.percentiles(by="run")
+
+
+def test_trends(frame):
+    trends = frame.trends()
+    assert trends["slope"][0] == pytest.approx(0.0)
+    assert trends["slope"][1] > 0
+    assert np.isnan(trends["slope"][2])
+
+
+def test_regressions(frame):
+    flags = frame.regressions(recent_days=4)
+    assert flags["regressed"].tolist() == [False, True, False]
+    assert flags["baseline_mean"][1] == pytest.approx(10.0)
+    assert flags["recent_mean"][1] == pytest.approx(20.0)
+    assert flags["change"][1] == pytest.approx(1.0)
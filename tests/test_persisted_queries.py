@@ -0,0 +1,77 @@
+# stdlib
+import json
+from typing import Dict, List
+
+# third party
+import pytest
+
+# first party
+from dbtc import dbtCloudClient
+
+QUERY = "query Environment($environmentId: BigInt!) { environment(id: $environmentId) { name } }"  # noqa: E501
+DATA = {"data": {"environment": {"name": "prod"}}}
+
+
+class FakeServer:
+    """Serves persisted queries once it has seen their full text"""
+
+    def __init__(self, supported: bool = True):
+        self.supported = supported
+        self.known: set = set()
+        self.payloads: List[Dict] = []
+
+    def __call__(self, method: str, url: str, json: Dict, **kwargs):
+        self.payloads.append(json)
+        persisted = (json.get("extensions") or {}).get("persistedQuery")
+        if persisted is None:
+            return DATA
+
+        if not self.supported:
+            return {"errors": [{"message": "PersistedQueryNotSupported"}]}
+
+        if "query" in json:
+            self.known.add(persisted["sha256Hash"])
+        elif persisted["sha256Hash"] not in self.known:
+            return {"errors": [{"message": "PersistedQueryNotFound"}]}
+
+        return DATA
+
+
+def test_query_is_sent_once(fake_discovery):
+    server = FakeServer()
+    client = fake_discovery(server, persisted_queries=True)
+    for _ in range(3):
+        assert client.metadata.query(QUERY, {"environmentId": 1}) == DATA
+    assert ["query" in payload for payload in server.payloads] == [
+        False,
+        True,
+        False,
+        False,
+    ]
+
+
+def test_unsupported_server_turns_persisted_queries_off(fake_discovery):
+    server = FakeServer(supported=False)
+    client = fake_discovery(server, persisted_queries=True)
+    for _ in range(2):
+        assert client.metadata.query(QUERY, {"environmentId": 1}) == DATA
+    assert client.metadata.persisted_queries is False
+    assert len(server.payloads) == 3
+
+
+def test_graphql_payloads_are_sent_as_encoded_bytes(monkeypatch):
+    client = dbtCloudClient(service_token="fake")
+    sent: List[Dict] = []
+
+    def request(method, url, **kwargs):
+        sent.append(kwargs)
+        raise RuntimeError
+
+    monkeypatch.setattr(client.metadata.session, "request", request)
+    with pytest.raises(RuntimeError):
+        client.metadata.query(QUERY, {"environmentId": 1})
+    assert "json" not in sent[0]
+    assert json.loads(sent[0]["data"]) == {
+        "query": QUERY,
+        "variables": {"environmentId": 1},
+    }
@@ -0,0 +1,265 @@
+# stdlib
+import json
+from typing import Dict, List
+
+# third party
+import pytest
+import requests
+
+# first party
+from dbtc.schema import MetadataSchema
+from tests.conftest import FakeResponse
+
+
+def _type(name: str, kind: str = "OBJECT") -> Dict:
+    return {"kind": kind, "name": name, "ofType": None}
+
+
+def _non_null(type_ref: Dict) -> Dict:
+    return {"kind": "NON_NULL", "name": None, "ofType": type_ref}
+
+
+def _list(type_ref: Dict) -> Dict:
+    return {"kind": "LIST", "name": None, "ofType": type_ref}
+
+
+def _field(name: str, type_ref: Dict, **args: Dict) -> Dict:
+    return {
+        "name": name,
+        "args": [
+            {"name": arg, "type": arg_type, "defaultValue": None}
+            for arg, arg_type in args.items()
+        ],
+        "type": type_ref,
+    }
+
+
+def _object(name: str, fields: List[Dict]) -> Dict:
+    return {"kind": "OBJECT", "name": name, "fields": fields, "possibleTypes": None}
+
+
+def _scalar(name: str, kind: str = "SCALAR") -> Dict:
+    return {"kind": kind, "name": name, "fields": None, "possibleTypes": None}
+
+
+STRING = _type("String", "SCALAR")
+
+SCHEMA = {
+    "queryType": {"name": "Query"},
+    "mutationType": None,
+    "types": [
+        _scalar("String"),
+        _scalar("Int"),
+        _scalar("BigInt"),
+        _scalar("Boolean"),
+        _scalar("ModelAppliedFilter", "INPUT_OBJECT"),
+        _object(
+            "Query",
+            [
+                _field(
+                    "environment",
+                    _non_null(_type("Environment")),
+                    id=_non_null(_type("BigInt", "SCALAR")),
+                )
+            ],
+        ),
+        _object(
+            "Environment",
+            [_field("name", STRING), _field("applied", _type("AppliedState"))],
+        ),
+        _object(
+            "AppliedState",
+            [
+                _field(
+                    "models",
+                    _non_null(_type("ModelConnection")),
+                    first=_type("Int", "SCALAR"),
+                    after=STRING,
+                    filter=_type("ModelAppliedFilter", "INPUT_OBJECT"),
+                )
+            ],
+        ),
+        _object(
+            "ModelConnection",
+            [
+                _field("pageInfo", _non_null(_type("PageInfo"))),
+                _field("edges", _non_null(_list(_non_null(_type("ModelEdge"))))),
+            ],
+        ),
+        _object(
+            "PageInfo",
+            [
+                _field("endCursor", STRING),
+                _field("hasNextPage", _type("Boolean", "SCALAR")),
+            ],
+        ),
+        _object("ModelEdge", [_field("node", _non_null(_type("Model")))]),
+        _object("Model", [_field("uniqueId", STRING), _field("name", STRING)]),
+    ],
+}
+
+VALID = """
+query Models($environmentId: BigInt!, $first: Int, $after: String) {
+  environment(id: $environmentId) {
+    applied {
+      models(first: $first, after: $after) {
+        pageInfo {
+          endCursor
+          hasNextPage
+        }
+        edges {
+          node {
+            __typename
+            uniqueId
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+class FakeDiscovery:
+    def __init__(self, etag: str = '"v1"'):
+        self.etag = etag
+        self.introspections: List[Dict] = []
+        self.queries: List[Dict] = []
+
+    def __call__(self, method: str, url: str, json: Dict, **kwargs):
+        if "__schema" in json["query"]:
+            headers = kwargs.get("headers") or {}
+            self.introspections.append(headers)
+            if headers.get("If-None-Match") == self.etag:
+                return FakeResponse({}, 304)
+
+            return FakeResponse(
+                {"data": {"__schema": SCHEMA}}, headers={"ETag": self.etag}
+            )
+
+        self.queries.append(json)
+        if "unknownField" in json["query"]:
+            return FakeResponse({"errors": [{"message": "Unknown field"}]}, 400)
+
+        return {"data": {"environment": {"name": "prod"}}}
+
+
+@pytest.fixture
+def client(fake_discovery):
+    fake = FakeDiscovery()
+    return fake_discovery(fake), fake
+
+
+def test_valid_query():
+    schema = MetadataSchema(SCHEMA)
+    assert schema.validate(VALID) == []
+    assert schema.validate(VALID, {"environmentId": 1}) == []
+
+
+@pytest.mark.parametrize(
+    "query, error",
+    [
+        (
+            "{ environment(id: 1) { nam } }",
+            "Cannot query field 'nam' on type 'Environment'",
+        ),
+        (
+            "{ environment(id: 1, name: 2) { name } }",
+            "Unknown argument 'name' on field 'Query.environment'",
+        ),
+        (
+            "{ environment { name } }",
+            "Field 'Query.environment' argument 'id' of type 'BigInt!' is required",
+        ),
+        (
+            "{ environment(id: 1) }",
+            "Field 'environment' of type 'Environment' must have a selection",
+        ),
+        (
+            "{ environment(id: 1) { name { first } } }",
+            "Field 'name' must not have a selection",
+        ),
+        (
+            "query ($id: BigInt!, $x: Int) { environment(id: $id) { name } }",
+            "Variable '$x' is never used",
+        ),
+        (
+            "query { environment(id: $id) { name } }",
+            "Variable '$id' is not defined",
+        ),
+        (
+            "query ($id: Environment!) { environment(id: $id) { name } }",
+            "Variable '$id' has unknown input type 'Environment!'",
+        ),
+        ("{ environment(id: 1) { name }", "Syntax error"),
+        (
+            VALID.replace("hasNextPage", ""),
+            "'pageInfo' must select 'endCursor' and 'hasNextPage' to paginate",
+        ),
+        (
+            VALID.replace("first: $first, after: $after", "first: $first"),
+            "The paginated field 'models' must be passed 'after: $after'",
+        ),
+    ],
+)
+def test_invalid_query(query, error):
+    errors = MetadataSchema(SCHEMA).validate(query)
+    assert any(e.startswith(error) for e in errors), errors
+
+
+def test_missing_required_variable():
+    schema = MetadataSchema(SCHEMA)
+    assert schema.validate(VALID, {"first": 5}) == [
+        "Variable '$environmentId' of required type 'BigInt!' was not provided"
+    ]
+    with pytest.raises(ValueError, match="environmentId"):
+        schema.check(VALID, {})
+
+
+def test_invalid_queries_are_not_sent(client):
+    client, fake = client
+    client.enable_metadata_validation()
+    with pytest.raises(ValueError, match="Cannot query field 'nam'"):
+        client.metadata.query("{ environment(id: 1) { nam } }")
+    assert fake.queries == []
+
+    response = client.metadata.query("{ environment(id: 1) { name } }")
+    assert response == {"data": {"environment": {"name": "prod"}}}
+    assert len(fake.queries) == 1
+
+
+def test_error_status_raises(client):
+    client, _ = client
+    with pytest.raises(requests.HTTPError, match="400 Error: Unknown field"):
+        client.metadata.query("{ unknownField }")
+
+
+def test_schema_is_cached_on_disk(client, tmp_path, monkeypatch):
+    client, fake = client
+    client.enable_metadata_validation(directory=str(tmp_path))
+    client.enable_metadata_validation(directory=str(tmp_path))
+    assert fake.introspections == [{}]
+    (path,) = tmp_path.glob("schema-*.json")
+    assert json.loads(path.read_text())["etag"] == '"v1"'
+
+    # Once expired, the schema is only downloaded again if it changed
+    schema = client.enable_metadata_validation(directory=str(tmp_path), ttl=0)
+    assert fake.introspections[-1] == {"If-None-Match": '"v1"'}
+    assert schema.validate(VALID) == []
+
+    fake.etag = '"v2"'
+    client.enable_metadata_validation(directory=str(tmp_path), ttl=0)
+    assert json.loads(path.read_text())["etag"] == '"v2"'
+    assert len(fake.introspections) == 3
+
+
+def test_validate_only_checks_one_query(client, tmp_path, monkeypatch):
+    client, fake = client
+    monkeypatch.setattr("dbtc.client.metadata.DEFAULT_SCHEMA_DIRECTORY", str(tmp_path))
+    with pytest.raises(ValueError, match="Cannot query field 'nam'"):
+        client.metadata.query("{ environment(id: 1) { nam } }", validate=True)
+    assert fake.queries == []
+    assert client.metadata.schema is None
+
+    client.metadata.query("{ environment(id: 1) { nam } }")
+    assert len(fake.queries) == 1
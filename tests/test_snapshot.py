@@ -0,0 +1,130 @@
+# stdlib
+from typing import Dict
+
+# third party
+import pytest
+
+# first party
+from dbtc.client.snapshot import EnvironmentSnapshot
+from tests.conftest import FakeAppliedState
+
+
+def _model(name: str, generated_at: str = "2024-01-01T00:00:00Z") -> Dict:
+    return {
+        "uniqueId": f"model.tpch.{name}",
+        "name": name,
+        "rawCode": "select 1",
+        "executionInfo": {"lastRunGeneratedAt": generated_at},
+    }
+
+
+MODEL_NAMES = (
+    "customers",
+    "orders",
+    "parts",
+    "nation",
+    "region",
+    "supplier",
+    "partsupp",
+)
+
+
+@pytest.fixture
+def discovery(fake_discovery, tmp_path):
+    fake = FakeAppliedState(
+        {
+            "models": [_model(name) for name in MODEL_NAMES],
+            "sources": [{"uniqueId": "source.tpch.raw.orders", "name": "orders"}],
+        },
+        page_size=2,
+    )
+    client = fake_discovery(fake)
+
+    def sync(**kwargs):
+        return client.metadata.snapshot_environment(
+            1, str(tmp_path), resource_types=["Model", "Source"], **kwargs
+        )
+
+    return client.metadata, fake, sync, str(tmp_path)
+
+
+def test_first_sync_stores_everything(discovery):
+    metadata, _, sync, store = discovery
+    diff = sync()
+    assert diff["added"] == [
+        "model.tpch.customers",
+        "model.tpch.nation",
+        "model.tpch.orders",
+        "model.tpch.parts",
+        "model.tpch.partsupp",
+        "model.tpch.region",
+        "model.tpch.supplier",
+        "source.tpch.raw.orders",
+    ]
+    assert diff["removed"] == diff["modified"] == []
+
+    snapshot = EnvironmentSnapshot(metadata, 1, store, resource_types=["Model"])
+    assert snapshot.table("Model").num_rows == 7
+    assert [node["name"] for node in snapshot.nodes()][:2] == ["customers", "orders"]
+
+
+def test_unchanged_applied_state_is_not_fetched(discovery):
+    _, fake, sync, _ = discovery
+    sync()
+    requests = len(fake.payloads)
+    assert sync() == {"added": [], "removed": [], "modified": []}
+    assert len(fake.payloads) == requests + 1
+
+
+def test_only_newly_generated_models_are_fetched(discovery):
+    metadata, fake, sync, store = discovery
+    sync()
+    models = fake.resources["models"]
+    models[0] = _model("customers", "2024-01-02T00:00:00Z")
+    models[0]["rawCode"] = "select 2"
+    models[1]["executionInfo"]["lastRunGeneratedAt"] = "2024-01-02T00:00:00Z"
+    del models[2]
+    models.append(_model("lineitem", "2024-01-02T00:00:00Z"))
+    fake.last_updated_at = "2024-01-02T00:00:00Z"
+    start = len(fake.payloads)
+
+    diff = sync()
+    assert diff == {
+        "added": ["model.tpch.lineitem"],
+        "removed": ["model.tpch.parts"],
+        "modified": ["model.tpch.customers"],
+    }
+    filtered = [
+        p["variables"]["filter"]["uniqueIds"]
+        for p in fake.payloads[start:]
+        if p["variables"].get("filter") and not p["variables"].get("after")
+    ]
+    assert filtered == [
+        ["model.tpch.customers", "model.tpch.orders", "model.tpch.lineitem"]
+    ]
+
+    snapshot = EnvironmentSnapshot(metadata, 1, store)
+    nodes = {node["uniqueId"]: node for node in snapshot.nodes("Model")}
+    assert "model.tpch.parts" not in nodes
+    assert len(nodes) == 7
+    assert nodes["model.tpch.customers"]["rawCode"] == "select 2"
+
+
+def test_failed_sync_stores_nothing(discovery):
+    _, fake, sync, _ = discovery
+    sync()
+    models = fake.resources["models"]
+    models[0]["rawCode"] = "select 2"
+    models[0]["executionInfo"]["lastRunGeneratedAt"] = "2024-01-02T00:00:00Z"
+    fake.last_updated_at = "2024-01-02T00:00:00Z"
+    fake.failing = "sources"
+    with pytest.raises(RuntimeError):
+        sync()
+
+    fake.failing = None
+    assert sync()["modified"] == ["model.tpch.customers"]
+
+
+def test_resource_types_are_validated(tmp_path):
+    with pytest.raises(ValueError):
+        EnvironmentSnapshot(None, 1, str(tmp_path), resource_types=["Metric"])
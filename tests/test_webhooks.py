@@ -0,0 +1,97 @@
+# stdlib
+import json
+import threading
+
+# third party
+import requests
+
+# first party
+from dbtc.client.runs import JobRunStatus, RunPoller
+from dbtc.client.webhooks import WebhookReceiver, sign
+
+SECRET = "webhook-secret"
+
+
+def _event(run_id, event_type="job.run.completed"):
+    return {
+        "accountId": 1,
+        "eventId": f"event-{run_id}",
+        "eventType": event_type,
+        "webhookName": "test",
+        "data": {
+            "jobId": "10",
+            "runId": str(run_id),
+            "runStatus": "Success",
+            "runStatusCode": JobRunStatus.SUCCESS,
+        },
+    }
+
+
+def _send(receiver, event, secret=SECRET):
+    body = json.dumps(event).encode()
+    return requests.post(
+        receiver.url.replace("0.0.0.0", "127.0.0.1"),
+        data=body,
+        headers={"Authorization": sign(secret, body)},
+    )
+
+
+def test_rejects_bad_signature():
+    with WebhookReceiver(SECRET, host="127.0.0.1", port=0) as receiver:
+        assert _send(receiver, _event(1), secret="wrong").status_code == 401
+        assert receiver.wait_for(lambda: [1], timeout=0) == set()
+
+
+def test_delivers_events_to_listeners_and_waiters():
+    events = []
+    with WebhookReceiver(SECRET, host="127.0.0.1", port=0) as receiver:
+        receiver.add_listener(events.append)
+        assert _send(receiver, _event(1, "job.run.started")).status_code == 200
+        assert _send(receiver, _event(2)).status_code == 200
+        assert receiver.wait_for(lambda: [1, 2], timeout=0) == {2}
+
+        # Consumed events aren't returned twice
+        assert receiver.wait_for(lambda: [2], timeout=0) == set()
+    assert [e.data.runId for e in events] == [1, 2]
+
+
+class _FakeClient:
+    def __init__(self, receiver):
+        self.webhook_receiver = receiver
+        self.get_run_calls = []
+
+    def get_run(self, account_id, run_id):
+        self.get_run_calls.append(run_id)
+        return {"data": {"id": run_id, "status": JobRunStatus.SUCCESS, "href": ""}}
+
+    def list_runs(self, account_id, **kwargs):
+        raise AssertionError("A pushed run shouldn't require listing runs")
+
+    def _run_status_formatted(self, run, time):
+        return ""
+
+    @property
+    def console(self):
+        return self
+
+    def log(self, *args):
+        pass
+
+
+def test_poller_finishes_on_push():
+    with WebhookReceiver(
+        SECRET, host="127.0.0.1", port=0, fallback_interval=30
+    ) as receiver:
+        client = _FakeClient(receiver)
+        poller = RunPoller(client)
+        for run_id in (1, 2):
+            poller.add({"data": {"id": run_id, "account_id": 1}})
+
+        timer = threading.Timer(0.1, _send, args=(receiver, _event(2)))
+        timer.start()
+        poller.wait()
+        completed = poller.poll()
+        timer.join()
+    assert [run["data"]["id"] for run in completed] == [2]
+    assert client.get_run_calls == [2]
+    assert poller.run_ids() == [1]